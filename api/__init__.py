@@ -1,6 +1,10 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List
 
 from flask import Flask
+from flask.sessions import SecureCookieSessionInterface
 from flask_cors import CORS
 from flask_restx import Api
 from werkzeug.utils import import_string
@@ -8,9 +12,19 @@ from werkzeug.utils import import_string
 from api.gold import gold_api
 from api.kospi import kospi_api
 from api.gs import gs_api
+from api.batch import batch_api
+from api.dashboard import dashboard_api
+from api.archive import archive_api
+from api.dashboard.services import DashboardService
+from api.market.services import SharedSnapshotService
 from api.common import jwt
-from config import config_by_name
+from config import LazyConfig, config_by_name
+from util.checkpoint_utils import init_checkpoint
+from util.compression_utils import init_compression
+from util.deadline_utils import Deadline
 from util.logging_util import logger
+from util.response_utils import prime_serializers
+from util.spill_utils import init_response_spill
 
 
 authorizations = {
@@ -30,9 +44,25 @@ authorizations = {
 }
 
 
+class StatelessSessionInterface(SecureCookieSessionInterface):
+    """
+    쿠키 세션을 사용하지 않는 세션 인터페이스(인증은 JWT 로 한다).
+    기본 인터페이스는 요청마다 SECRET_KEY 를 읽으므로, 그대로 두면 첫 요청에서 Parameter Store 를 조회하게 된다.
+    """
+
+    def open_session(self, app, request):
+        # None 을 반환하면 flask 가 NullSession 을 사용한다.
+        return None
+
+
+class FinanceFlask(Flask):
+    config_class = LazyConfig
+    session_interface = StatelessSessionInterface()
+
+
 def create_app():
     # SonarQube: S4502 - CSRF protection is not necessary for JWT-based authentication
-    app = Flask(__name__)
+    app = FinanceFlask(__name__)
     # for zappa health check;
     app.add_url_rule('/', endpoint='ping', view_func=lambda: 'Pong!')
 
@@ -59,28 +89,90 @@ def create_app():
     api.add_namespace(gold_api)
     api.add_namespace(kospi_api)
     api.add_namespace(gs_api)
+    api.add_namespace(batch_api)
+    api.add_namespace(dashboard_api)
+    api.add_namespace(archive_api)
     
     # register controllers
     from api.gold import controllers
     from api.kospi import controllers
     from api.gs import controllers
+    from api.batch import controllers
+    from api.dashboard import controllers
+    from api.archive import controllers
 
     # enable CORS for all origins (전체 허용)
     CORS(app, resources={r"/*": {"origins": "*"}})
+
+    # 큰 응답은 S3 로 분리해 303 으로 응답(압축 후의 크기를 재도록 압축 훅보다 먼저 등록)
+    init_response_spill(app)
+    
+    # 응답 압축(gzip, brotli)
+    init_compression(app)
     
-    # 애플리케이션 시작 시 테이블 초기화
-    initialize_tables()
+    # 워커 간 공유 스냅샷(S3, 같은 호스트의 워커끼리는 공유 메모리). warm-up 도 스냅샷을 먼저 읽도록 그 전에 설정
+    SharedSnapshotService.configure(app.config['SHARED_SNAPSHOT_ENABLED'], app.config['SHARED_SNAPSHOT_FRESH_SECS'],
+                                    app.config['SHARED_SNAPSHOT_MAX_STALE_SECS'])
+    if app.config['SHARED_MEMORY_PATH'] and not os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        SharedSnapshotService.attach_shared_memory(app.config['SHARED_MEMORY_PATH'], app.config['SHARED_MEMORY_SLOT_SIZE'])
+    
+    # 캐시 체크포인트 복원, 복원하지 못한 캐시는 warm-up(WARMUP_BUDGET_SECS 를 넘겨 시작을 막지 않는다)
+    restored = init_checkpoint(app)
+    initialize_tables(app, restored)
+
+    # 대시보드 스냅샷 주기 갱신(Lambda 에서는 요청 사이에 스레드가 멈추므로 zappa events 로 갱신한다)
+    if app.config['DASHBOARD_REFRESH_SECS'] and not os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        DashboardService.start_refresher(app.config['DASHBOARD_REFRESH_SECS'])
+
+    # 공유 메모리 스냅샷 주기 갱신(쓰기 잠금을 얻은 워커 하나만 쓴다)
+    SharedSnapshotService.start_shared_memory_refresher()
 
     return app
 
 
-def initialize_tables():
+def initialize_tables(app: Flask, restored: List[str] = ()):
     """
-    애플리케이션 시작 시 필요한 DynamoDB 테이블들을 초기화
-    현재는 금 가격 서비스가 DynamoDB를 사용하지 않으므로 빈 함수
+    애플리케이션 시작 시 캐시를 미리 채운다(warm-up).
+    대시보드 스냅샷(등록된 전 종목의 실시간 시세와 최신 일별 시세 1페이지), 종목별 일별 시세 이력 페이지,
+    응답 직렬화 경로를 동시에 준비한다. WARMUP_BUDGET_SECS 가 지나면 끝나지 않은 작업을 기다리지 않고 시작을 계속하며,
+    실패한 작업은 기록만 하고 첫 요청에서 평소처럼 조회한다.
+    체크포인트에서 복원한 캐시(restored)는 업스트림을 다시 조회하지 않는다.
     """
+    budget_secs = app.config['WARMUP_BUDGET_SECS']
+    if not budget_secs:
+        logger.info("캐시 warm-up 비활성화")
+        return
+
+    started = time.monotonic()
+    deadline = Deadline(budget_secs)
+    executor = ThreadPoolExecutor(max_workers=len(DashboardService.INSTRUMENTS) + 2, thread_name_prefix='warmup')
     try:
-        logger.info("애플리케이션 초기화 완료")
-        
-    except Exception as e:
-        logger.error(f"애플리케이션 초기화 실패: {str(e)}")
+        tasks = {'serializer': executor.submit(prime_serializers)}
+        if 'dashboard' not in restored:
+            tasks['dashboard'] = executor.submit(DashboardService.refresh)
+        # 1페이지는 대시보드 스냅샷을 만들면서 읽으므로 2페이지부터 읽는다.
+        for name, service in DashboardService.INSTRUMENTS.items():
+            if name not in restored:
+                tasks[f'{name}-history'] = executor.submit(_warm_history, service,
+                                                           app.config['WARMUP_HISTORY_PAGES'], deadline)
+
+        wait(tasks.values(), timeout=deadline.remaining())
+    finally:
+        # 예산을 넘긴 작업은 백그라운드에서 마저 끝나도록 두고 기다리지 않는다.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for name, future in tasks.items():
+        if not future.done():
+            logger.warning(f"캐시 warm-up 예산 초과로 기다리지 않음 - {name}")
+        elif future.exception() is not None:
+            logger.error(f"캐시 warm-up 실패 - {name}: {str(future.exception())}")
+    logger.info(f"캐시 warm-up 완료 - {(time.monotonic() - started) * 1000:.0f}ms")
+
+
+def _warm_history(service, pages: int, deadline: Deadline):
+    # 일별 시세 이력의 2..pages 페이지를 읽어 날짜 인덱스와 변경 이력을 채운다.
+    history = service.get_history()
+    for page in range(2, pages + 1):
+        if deadline.expired():
+            return
+        history.load_page(page, deadline)
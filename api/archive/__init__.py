@@ -0,0 +1,3 @@
+from flask_restx import Namespace
+
+archive_api = Namespace(name='archive', path='/archive', description='종목별 전체 일별 시세 아카이브(S3) 다운로드 API')
@@ -0,0 +1,68 @@
+from flask import current_app
+from flask_restx import Resource, fields, reqparse
+
+from api.archive import archive_api
+from api.archive.services import ArchiveService
+from util.logging_util import logger
+from util.response_utils import fast_marshal_with
+from exceptions import CoreException
+
+
+# 아카이브 다운로드 응답 모델
+archive_model = archive_api.model('ArchiveResponse', {
+    'status': fields.String(description='응답 상태'),
+    'data': fields.Raw(description='연도별 아카이브 파티션과 서명된 다운로드 URL'),
+    'message': fields.String(description='응답 메시지'),
+    'error_code': fields.String(description='오류 코드')
+})
+
+# 요청 파라미터 파서
+archive_parser = reqparse.RequestParser()
+archive_parser.add_argument('year', 
+                            type=int, 
+                            required=False, 
+                            help='조회할 연도 (미입력시 전체 연도)',
+                            location='args')
+
+
+@archive_api.route('/<string:instrument>')
+@archive_api.param('instrument', '종목 구분 (gold, kospi, gs)')
+class ArchiveResource(Resource):
+    @archive_api.doc('get_archive_links')
+    @archive_api.expect(archive_parser)
+    @fast_marshal_with(archive_api, archive_model)
+    def get(self, instrument):
+        """종목 전체 일별 시세 아카이브 다운로드 URL 조회
+        
+        매일 S3 로 내보내는 연도별 아카이브(gzip 압축 컬럼 단위 JSON)의 서명된 URL 을 반환합니다.
+        전체 이력은 API 응답 대신 이 URL 로 S3 에서 직접 내려받습니다.
+        """
+        try:
+            args = archive_parser.parse_args()
+            result = ArchiveService.get_download_links(instrument, args.get('year'),
+                                                       current_app.config['ARCHIVE_URL_EXPIRES_SECS'])
+            
+            return {
+                'status': 'success',
+                'data': result,
+                'message': '아카이브 다운로드 URL 을 성공적으로 조회했습니다.',
+                'error_code': None
+            }
+            
+        except CoreException as e:
+            logger.error(f"아카이브 조회 중 비즈니스 오류: {e.error_code} - {e.message}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': e.message,
+                'error_code': e.error_code
+            }, 400
+            
+        except Exception as e:
+            logger.error(f"아카이브 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
@@ -0,0 +1,206 @@
+import json
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from api.gold.services import GoldPriceService
+from api.gs.services import GsStockService
+from api.kospi.services import KospiPriceService
+from util import s3_utils
+from util.deadline_utils import Deadline
+from util.logging_util import logger
+from util.response_utils import dumps
+from exceptions import CoreException, DeadlineExceededException
+
+
+class ArchiveService:
+    """
+    종목별 전체 일별 시세를 연도별 파티션으로 S3 에 내보내고, 클라이언트에는 서명된 다운로드 URL 을 제공합니다.
+    파티션은 gzip 으로 압축한 컬럼 단위 JSON({'columns': {'date': [...], 'close': [...], ...}}, 날짜 오름차순)이고,
+    종목마다 파티션 목록을 담은 manifest.json 을 둡니다.
+    지난 연도의 파티션은 연도가 끝난 뒤 한 번 내보내면(complete) 바뀌지 않으므로, 다음 내보내기부터는 올해 파티션만 다시 씁니다.
+    """
+    # 종목 구분 -> 서비스
+    INSTRUMENTS = {
+        'gold': GoldPriceService,
+        'kospi': KospiPriceService,
+        'gs': GsStockService
+    }
+    # 파티션 형식 버전. 객체 키에 들어가므로 형식이 바뀌면 새 경로에 다시 내보냅니다.
+    FORMAT_VERSION = 1
+    KEY_PREFIX = 'archive'
+    # 내보내기 한 번에 허용하는 시간(초). 처음 내보낼 때는 이력 전체 페이지를 읽습니다.
+    EXPORT_DEADLINE_SECS = 840.0
+    # manifest 를 메모리에 두는 시간(초)
+    MANIFEST_CACHE_SECS = 60.0
+    _manifests: Dict[str, Tuple[Optional[Dict], float]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def export_all(deadline: Optional[Deadline] = None) -> Dict[str, List[int]]:
+        """
+        모든 종목의 일별 시세를 S3 아카이브로 내보냅니다. 한 종목이 실패해도 나머지 종목은 계속 내보냅니다.
+
+        Args:
+            deadline: 내보내기 데드라인(선택사항, 없으면 EXPORT_DEADLINE_SECS)
+
+        Returns:
+            Dict[str, List[int]]: 종목 구분 -> 내보낸 연도 목록
+        """
+        deadline = deadline or Deadline(ArchiveService.EXPORT_DEADLINE_SECS)
+        exported = {}
+        for instrument in ArchiveService.INSTRUMENTS:
+            try:
+                exported[instrument] = ArchiveService.export_instrument(instrument, deadline)
+            except Exception as e:
+                logger.error(f"아카이브 {instrument} 내보내기 중 오류: {str(e)}")
+                exported[instrument] = []
+        return exported
+
+    @staticmethod
+    def export_instrument(instrument: str, deadline: Optional[Deadline] = None) -> List[int]:
+        """
+        종목의 일별 시세를 최신 연도부터 차례로 읽어, 연도가 바뀔 때마다 그 연도의 파티션을 멀티파트 업로드로 씁니다.
+        이미 complete 로 내보낸 연도는 건너뛰고, 이력 끝까지 내보낸 적이 있으면 complete 연도에서 멈춥니다.
+        데드라인을 넘기면 읽던 연도는 쓰지 않고 그때까지 내보낸 연도만 manifest 에 반영합니다(다음 실행에서 이어서 내보냄).
+
+        Args:
+            instrument: 종목 구분
+            deadline: 내보내기 데드라인(선택사항)
+
+        Returns:
+            List[int]: 내보낸 연도 목록
+        """
+        history = ArchiveService.INSTRUMENTS[instrument].get_history()
+        manifest = ArchiveService._load_manifest(instrument) or {
+            'format': ArchiveService.FORMAT_VERSION,
+            'instrument': instrument,
+            'history_complete': False,
+            'partitions': {}
+        }
+        partitions = manifest['partitions']
+        current_year = datetime.now().year
+        exported = []
+
+        def export_year(year: int, bars: List[Dict], complete: bool):
+            if partitions.get(str(year), {}).get('complete'):
+                return
+            partitions[str(year)] = ArchiveService._export_partition(instrument, year, bars, complete)
+            exported.append(year)
+
+        year, bars = None, []
+        try:
+            for bar in history.iter_bars(deadline=deadline):
+                bar_year = int(bar['date'][:4])
+                if bar_year != year:
+                    # 더 과거 연도의 시세가 나왔으므로 읽던 연도는 모두 읽었습니다.
+                    if bars:
+                        export_year(year, bars, year < current_year)
+                    year, bars = bar_year, []
+                    if manifest['history_complete'] and partitions.get(str(year), {}).get('complete'):
+                        break
+                bars.append(bar)
+            else:
+                if bars:
+                    export_year(year, bars, year < current_year)
+                manifest['history_complete'] = True
+        except DeadlineExceededException:
+            logger.warning(f"아카이브 {instrument} 내보내기 데드라인 초과 - {year}년 이전은 다음 실행에서 내보냄")
+        finally:
+            if exported:
+                manifest['updated_at'] = datetime.now().isoformat()
+                s3_utils.put_object_contents(dumps(manifest), ArchiveService._key(instrument, 'manifest.json'))
+                with ArchiveService._lock:
+                    ArchiveService._manifests[instrument] = (manifest, time.monotonic())
+        logger.info(f"아카이브 {instrument} 내보내기 - {exported}")
+        return exported
+
+    @staticmethod
+    def get_download_links(instrument: str, year: Optional[int], expires_in: int) -> Dict:
+        """
+        종목 아카이브의 연도별 파티션 정보와 서명된 다운로드 URL 을 반환합니다.
+
+        Args:
+            instrument: 종목 구분
+            year: 연도(선택사항, 없으면 전체 연도)
+            expires_in: URL 유효 시간(초)
+
+        Returns:
+            Dict: 아카이브 정보와 연도별 파티션(다운로드 URL 포함) 목록
+        """
+        if instrument not in ArchiveService.INSTRUMENTS:
+            raise CoreException("INVALID_INSTRUMENT",
+                                f"지원하지 않는 종목입니다: {instrument} (사용 가능: {', '.join(ArchiveService.INSTRUMENTS)})")
+
+        manifest = ArchiveService._get_manifest(instrument)
+        if manifest is None:
+            raise CoreException("ARCHIVE_NOT_FOUND", f"아직 내보낸 아카이브가 없습니다: {instrument}")
+
+        partitions = []
+        for partition_year, partition in sorted(manifest['partitions'].items()):
+            if year is not None and int(partition_year) != year:
+                continue
+            url = s3_utils.create_presigned_url(partition['key'], expiration=expires_in)
+            partitions.append(dict(partition, year=int(partition_year), url=url))
+        if year is not None and not partitions:
+            raise CoreException("ARCHIVE_NOT_FOUND", f"{year}년 아카이브가 없습니다: {instrument}")
+
+        return {
+            'instrument': instrument,
+            'format': 'application/json; columnar; gzip',
+            'updated_at': manifest.get('updated_at'),
+            'expires_in': expires_in,
+            'partitions': partitions
+        }
+
+    @staticmethod
+    def _key(instrument: str, name: str) -> str:
+        return f"{ArchiveService.KEY_PREFIX}/v{ArchiveService.FORMAT_VERSION}/{instrument}/{name}"
+
+    @staticmethod
+    def _load_manifest(instrument: str) -> Optional[Dict]:
+        result = s3_utils.get_object_contents(ArchiveService._key(instrument, 'manifest.json'))
+        return json.loads(result['body']) if result is not None else None
+
+    @staticmethod
+    def _get_manifest(instrument: str) -> Optional[Dict]:
+        # 요청마다 S3 를 읽지 않도록 MANIFEST_CACHE_SECS 동안 메모리의 manifest 를 사용합니다.
+        cached = ArchiveService._manifests.get(instrument)
+        if cached is not None and time.monotonic() - cached[1] < ArchiveService.MANIFEST_CACHE_SECS:
+            return cached[0]
+        manifest = ArchiveService._load_manifest(instrument)
+        with ArchiveService._lock:
+            ArchiveService._manifests[instrument] = (manifest, time.monotonic())
+        return manifest
+
+    @staticmethod
+    def _export_partition(instrument: str, year: int, bars: List[Dict], complete: bool) -> Dict:
+        # bars 는 최신순이므로 날짜 오름차순으로 바꿔 씁니다.
+        bars = bars[::-1]
+        key = ArchiveService._key(instrument, f"year={year}/daily.json.gz")
+        result = s3_utils.put_object_multipart(ArchiveService._encode_partition(instrument, year, bars), key,
+                                               content_type='application/json', content_encoding='gzip')
+        return {
+            'key': key,
+            'count': len(bars),
+            'first_date': bars[0]['date'],
+            'last_date': bars[-1]['date'],
+            'size': result['size'],
+            'etag': result['etag'],
+            'complete': complete,
+            'exported_at': datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _encode_partition(instrument: str, year: int, bars: List[Dict]) -> Iterator[bytes]:
+        # 컬럼 하나씩 JSON 으로 만들어 gzip 으로 압축하면서 내보냅니다(파티션 전체 JSON 을 한 번에 만들지 않음).
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        header = dumps({'format': ArchiveService.FORMAT_VERSION, 'instrument': instrument, 'year': year,
+                        'count': len(bars)}).rstrip()
+        yield compressor.compress(header[:-1] + b',"columns":{')
+        for index, name in enumerate(bars[0] if bars else ()):
+            column = dumps(name).rstrip() + b':' + dumps([bar.get(name) for bar in bars]).rstrip()
+            yield compressor.compress((b',' if index else b'') + column)
+        yield compressor.compress(b'}}') + compressor.flush()
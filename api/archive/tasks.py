@@ -0,0 +1,14 @@
+from api.archive.services import ArchiveService
+from util.logging_util import logger
+
+
+def export_archive(event=None, context=None):
+    """
+    종목별 전체 일별 시세를 S3 아카이브로 내보낸다. zappa events 에 하루 한 번(장 마감 후) 등록되어 있다.
+    :param event: zappa 스케쥴 이벤트
+    :param context: Lambda 컨텍스트
+    """
+    exported = ArchiveService.export_all()
+    failed = [name for name, years in exported.items() if not years]
+    if failed:
+        logger.warning(f"아카이브 내보내기 - 내보낸 연도가 없는 종목: {', '.join(failed)}")
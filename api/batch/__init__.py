@@ -0,0 +1,3 @@
+from flask_restx import Namespace
+
+batch_api = Namespace(name='batch', path='/batch', description='여러 종목 시세 일괄 조회 API')
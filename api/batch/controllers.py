@@ -0,0 +1,80 @@
+from flask import request
+from flask_restx import Resource, fields
+
+from api.batch import batch_api
+from api.batch.services import BatchQueryService
+from util.deadline_utils import request_deadline
+from util.logging_util import logger
+from util.response_utils import fast_marshal_with
+from exceptions import CoreException
+
+
+# 일괄 조회 응답 모델
+batch_response_model = batch_api.model('BatchResponse', {
+    'status': fields.String(description='응답 상태'),
+    'data': fields.Raw(description='항목별 조회 결과'),
+    'message': fields.String(description='응답 메시지'),
+    'error_code': fields.String(description='오류 코드')
+})
+
+# 조회 항목 모델
+batch_query_model = batch_api.model('BatchQuery', {
+    'id': fields.String(description='클라이언트가 결과를 찾기 위한 식별자 (선택사항)'),
+    'instrument': fields.String(description='종목 구분', enum=list(BatchQueryService.INSTRUMENTS), required=True),
+    'type': fields.String(description='조회 유형', enum=list(BatchQueryService.QUERY_TYPES), required=True),
+    'date': fields.String(description='조회할 날짜 (type=date, YYYY-MM-DD 형식)'),
+    'start_date': fields.String(description='시작 날짜 (type=range, YYYY-MM-DD 형식)'),
+    'end_date': fields.String(description='종료 날짜 (type=range, YYYY-MM-DD 형식)')
+})
+
+# 일괄 조회 요청 모델
+batch_request_model = batch_api.model('BatchRequest', {
+    'queries': fields.List(fields.Nested(batch_query_model), description='조회 목록', required=True)
+})
+
+
+@batch_api.route('')
+class BatchQueryResource(Resource):
+    @batch_api.expect(batch_request_model)
+    @fast_marshal_with(batch_api, batch_response_model)
+    @batch_api.doc('run_batch_query')
+    @batch_api.doc(description='여러 종목의 날짜/날짜 범위/실시간 시세를 한 번에 조회합니다.')
+    def post(self):
+        """여러 종목 시세 일괄 조회
+
+        같은 종목의 날짜/날짜 범위 조회는 일별 시세 이력을 한 번만 읽고, 종목별 조회는 동시에 실행합니다.
+        항목별 오류는 results 의 해당 항목에만 담깁니다.
+        """
+        try:
+            deadline = request_deadline()
+            payload = request.get_json(silent=True) or {}
+
+            result = BatchQueryService.run_batch(payload.get('queries') if isinstance(payload, dict) else None,
+                                                 deadline)
+
+            logger.info(f"일괄 조회 완료 - {result['count']}건 (실패 {result['failed']}건)")
+
+            return {
+                'status': 'success',
+                'data': result,
+                'message': '일괄 조회를 완료했습니다.',
+                'error_code': None
+            }
+
+        except CoreException as e:
+            logger.error(f"일괄 조회 중 비즈니스 오류: {e.error_code} - {e.message}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': e.message,
+                'error_code': e.error_code
+            }, 400
+
+        except Exception as e:
+            logger.error(f"일괄 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
@@ -0,0 +1,210 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.gold.services import GoldPriceService
+from api.gs.services import GsStockService
+from api.kospi.services import KospiPriceService
+from util.deadline_utils import Deadline
+from util.logging_util import logger
+from exceptions import CoreException, DeadlineExceededException
+
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    global _batch_executor
+    if _batch_executor is None:
+        with _batch_executor_lock:
+            if _batch_executor is None:
+                _batch_executor = ThreadPoolExecutor(max_workers=BatchQueryService.MAX_WORKERS,
+                                                     thread_name_prefix='batch-query')
+    return _batch_executor
+
+
+class BatchQueryService:
+    # 종목 구분 -> 서비스
+    INSTRUMENTS = {
+        'gold': GoldPriceService,
+        'kospi': KospiPriceService,
+        'gs': GsStockService
+    }
+    QUERY_TYPES = ('date', 'range', 'realtime')
+    MAX_QUERIES = 50
+    MAX_WORKERS = 8
+
+    @staticmethod
+    def run_batch(queries: Any, deadline: Optional[Deadline] = None) -> Dict:
+        """
+        여러 종목의 날짜/날짜 범위/실시간 조회를 한 번에 처리합니다.
+        같은 업스트림 데이터를 쓰는 조회는 묶어서 한 번만 가져오고(종목별 일별 시세 이력 1회, 실시간 시세 1회),
+        묶음끼리는 동시에 실행합니다. 항목별 오류는 해당 항목의 결과에만 담고 일괄 조회 전체는 실패시키지 않습니다.
+
+        Args:
+            queries: 조회 목록 ([{'instrument': 'gold', 'type': 'date', 'date': 'YYYY-MM-DD'}, ...])
+            deadline: 요청 데드라인(선택사항)
+
+        Returns:
+            Dict: 요청 순서대로의 항목별 결과
+        """
+        if not isinstance(queries, list) or not queries:
+            raise CoreException("INVALID_BATCH", "queries 에 조회 목록을 입력해주세요.")
+        if len(queries) > BatchQueryService.MAX_QUERIES:
+            raise CoreException("BATCH_TOO_LARGE", f"한 번에 최대 {BatchQueryService.MAX_QUERIES}개까지 조회할 수 있습니다.")
+
+        # 항목 검증 후 업스트림 조회 단위(종목별 이력 / 실시간)로 묶기
+        items = []
+        groups: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for index, query in enumerate(queries):
+            item = {
+                'index': index,
+                'id': query.get('id') if isinstance(query, dict) else None,
+                'instrument': query.get('instrument') if isinstance(query, dict) else None,
+                'type': query.get('type') if isinstance(query, dict) else None
+            }
+            try:
+                group_key, date_range = BatchQueryService._normalize_query(query)
+                groups.setdefault(group_key, []).append(date_range)
+                items.append((item, group_key, date_range, None))
+            except CoreException as e:
+                items.append((item, None, None, e))
+
+        # 묶음별로 동시에 조회
+        executor = _get_batch_executor()
+        futures = {
+            group_key: executor.submit(BatchQueryService._fetch_group, group_key, date_ranges, deadline)
+            for group_key, date_ranges in groups.items()
+        }
+        wait(futures.values(), timeout=deadline.remaining() if deadline else None)
+
+        results = []
+        for item, group_key, date_range, error in items:
+            if error is None:
+                try:
+                    future = futures[group_key]
+                    if not future.done():
+                        raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+                    item['data'] = BatchQueryService._select(item['type'], date_range, future.result())
+                except CoreException as e:
+                    error = e
+                except Exception as e:
+                    logger.error(f"일괄 조회 항목 처리 중 오류: {str(e)}")
+                    error = CoreException("BATCH_QUERY_ERROR", f"조회 중 오류가 발생했습니다: {str(e)}")
+
+            if error is None:
+                item.update({'status': 'success', 'message': None, 'error_code': None})
+            else:
+                item.update({'status': 'error', 'data': None, 'message': error.message, 'error_code': error.error_code})
+            results.append(item)
+
+        succeeded = sum(1 for item in results if item['status'] == 'success')
+        return {
+            'results': results,
+            'count': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'upstream_groups': len(groups),
+            'last_updated': datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _normalize_query(query: Any) -> Tuple[Tuple[str, str], Optional[Tuple[str, str]]]:
+        """
+        조회 항목을 검증하고 (묶음 키, 날짜 범위)로 변환합니다.
+
+        Args:
+            query: 조회 항목
+
+        Returns:
+            Tuple: ((종목, 'history' 또는 'realtime'), (시작 날짜, 종료 날짜) 또는 None)
+        """
+        if not isinstance(query, dict):
+            raise CoreException("INVALID_QUERY", "조회 항목은 객체여야 합니다.")
+
+        instrument = query.get('instrument')
+        if instrument not in BatchQueryService.INSTRUMENTS:
+            raise CoreException("INVALID_INSTRUMENT",
+                                f"지원하지 않는 종목입니다: {instrument} (사용 가능: {', '.join(BatchQueryService.INSTRUMENTS)})")
+
+        query_type = query.get('type')
+        if query_type not in BatchQueryService.QUERY_TYPES:
+            raise CoreException("INVALID_QUERY_TYPE",
+                                f"지원하지 않는 조회 유형입니다: {query_type} (사용 가능: {', '.join(BatchQueryService.QUERY_TYPES)})")
+
+        if query_type == 'realtime':
+            return (instrument, 'realtime'), None
+
+        if query_type == 'date':
+            start_date = end_date = query.get('date')
+        else:
+            start_date, end_date = query.get('start_date'), query.get('end_date')
+
+        try:
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        except (TypeError, ValueError):
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+
+        if start_dt > end_dt:
+            raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+
+        return (instrument, 'history'), (start_date, end_date)
+
+    @staticmethod
+    def _fetch_group(group_key: Tuple[str, str], date_ranges: List[Optional[Tuple[str, str]]],
+                     deadline: Optional[Deadline] = None) -> Any:
+        """
+        묶음의 업스트림 데이터를 한 번 가져옵니다.
+        이력 묶음은 모든 항목의 날짜 범위를 포함하는 범위를 일별 시세 이력에서 한 번만 읽습니다.
+
+        Args:
+            group_key: (종목, 'history' 또는 'realtime')
+            date_ranges: 묶음에 속한 항목들의 날짜 범위
+            deadline: 요청 데드라인(선택사항)
+
+        Returns:
+            Any: 이력 묶음은 일별 시세 목록, 실시간 묶음은 실시간 가격 정보
+        """
+        instrument, kind = group_key
+        service = BatchQueryService.INSTRUMENTS[instrument]
+        try:
+            if kind == 'realtime':
+                return service.get_realtime_price(deadline)
+
+            start_date = min(start for start, _ in date_ranges)
+            end_date = max(end for _, end in date_ranges)
+            return list(service.get_history().iter_bars(start_date, end_date, deadline))
+        except CoreException:
+            raise
+        except DeadlineExceededException:
+            logger.error(f"요청 데드라인 초과로 일괄 조회 중단 - {instrument} {kind}")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"일괄 조회 중 오류 - {instrument} {kind}: {str(e)}")
+            raise CoreException("BATCH_QUERY_ERROR", f"조회 중 오류가 발생했습니다: {str(e)}")
+
+    @staticmethod
+    def _select(query_type: str, date_range: Optional[Tuple[str, str]], fetched: Any) -> Any:
+        """
+        묶음 조회 결과에서 항목에 해당하는 데이터를 골라냅니다.
+
+        Args:
+            query_type: 조회 유형 ('date', 'range', 'realtime')
+            date_range: 항목의 날짜 범위 (실시간이면 None)
+            fetched: _fetch_group 의 결과
+
+        Returns:
+            Any: 항목의 응답 데이터
+        """
+        if query_type == 'realtime':
+            return fetched
+
+        start_date, end_date = date_range
+        bars = [bar for bar in fetched if start_date <= bar['date'] <= end_date]
+        if query_type == 'range':
+            return {'bars': bars, 'count': len(bars)}
+        if not bars:
+            raise CoreException("DATE_NOT_FOUND", f"해당 날짜({start_date})의 데이터를 찾을 수 없습니다.")
+        return bars[0]
@@ -0,0 +1,3 @@
+from flask_restx import Namespace
+
+dashboard_api = Namespace(name='dashboard', path='/dashboard', description='여러 종목 대시보드 조회 API')
@@ -0,0 +1,43 @@
+from flask import Response, current_app
+from flask_restx import Resource, fields
+
+from api.dashboard import dashboard_api
+from api.dashboard.services import DashboardService
+from util.cache_utils import conditional_get, record_data_version
+from util.logging_util import logger
+from util.response_utils import JSON_MIMETYPE, fast_marshal_with
+
+
+# 대시보드 응답 모델
+dashboard_model = dashboard_api.model('DashboardResponse', {
+    'status': fields.String(description='응답 상태'),
+    'data': fields.Raw(description='종목별 실시간 시세와 최근 거래일 종가'),
+    'message': fields.String(description='응답 메시지'),
+    'error_code': fields.String(description='오류 코드')
+})
+
+
+@dashboard_api.route('')
+class DashboardResource(Resource):
+    @conditional_get('DASHBOARD_REFRESH_SECS')
+    @fast_marshal_with(dashboard_api, dashboard_model)
+    @dashboard_api.doc('get_dashboard')
+    @dashboard_api.doc(description='금, KOSPI, GS 의 실시간 시세와 최근 거래일 종가를 한 번에 조회합니다.')
+    def get(self):
+        """대시보드 조회
+        
+        백그라운드에서 갱신하는 스냅샷을 메모리에서 그대로 반환합니다.
+        """
+        try:
+            snapshot = DashboardService.get_snapshot(current_app.config['DASHBOARD_REFRESH_SECS'])
+            record_data_version('dashboard', snapshot.version, snapshot.generated_at)
+            return Response(snapshot.body, mimetype=JSON_MIMETYPE)
+            
+        except Exception as e:
+            logger.error(f"대시보드 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
@@ -0,0 +1,39 @@
+import hashlib
+import time
+from typing import Dict
+
+from util.response_utils import dumps
+
+
+class DashboardSnapshot:
+    """
+    미리 만들어 둔 대시보드 응답.
+    갱신할 때 응답 본문(JSON 바이트)과 데이터 버전까지 만들어 두어, 요청 처리 시에는 그대로 반환만 한다.
+    """
+    __slots__ = ('instruments', 'generated_at', 'body', 'version')
+
+    def __init__(self, instruments: Dict[str, Dict], generated_at: float = None):
+        """
+        :param instruments: 종목 구분 -> {'quote': 실시간 시세, 'last_close': 최근 일별 시세, 'updated_at': ..., 'stale': ...}
+        :param generated_at: 스냅샷 생성 시각(time.time())
+        """
+        self.instruments = instruments
+        self.generated_at = generated_at if generated_at is not None else time.time()
+        # 데이터 버전은 시세 값만으로 계산해, 값이 그대로면 다시 만들어도 ETag 가 바뀌지 않는다.
+        values = {name: (entry['quote'], entry['last_close']) for name, entry in instruments.items()}
+        self.version = hashlib.blake2b(dumps(values), digest_size=16).hexdigest()
+        self.body = dumps({
+            'status': 'success',
+            'data': {
+                'instruments': instruments,
+                'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.generated_at))
+            },
+            'message': '대시보드를 성공적으로 조회했습니다.',
+            'error_code': None
+        })
+
+    def age(self) -> float:
+        """
+        :return: 생성 후 지난 시간(초)
+        """
+        return time.time() - self.generated_at
@@ -0,0 +1,177 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from api.dashboard.models import DashboardSnapshot
+from api.gold.services import GoldPriceService
+from api.gs.services import GsStockService
+from api.kospi.services import KospiPriceService
+from util.checkpoint_utils import register_checkpoint
+from util.deadline_utils import Deadline
+from util.logging_util import logger
+
+
+class DashboardService:
+    # 종목 구분 -> 서비스
+    INSTRUMENTS = {
+        'gold': GoldPriceService,
+        'kospi': KospiPriceService,
+        'gs': GsStockService
+    }
+    # 스냅샷 한 번을 만드는 데 허용하는 시간(초)
+    REFRESH_DEADLINE_SECS = 20.0
+    _snapshot: Optional[DashboardSnapshot] = None
+    _lock = threading.Lock()
+    _refreshing = False
+    _refresher: Optional[threading.Thread] = None
+
+    @staticmethod
+    def get_snapshot(max_age_secs: float) -> DashboardSnapshot:
+        """
+        메모리의 대시보드 스냅샷을 반환합니다.
+        스냅샷이 max_age_secs 보다 오래되었으면 기존 스냅샷을 그대로 반환하고 백그라운드에서 갱신합니다.
+        프로세스의 첫 요청이라 스냅샷이 없을 때만 요청 안에서 만듭니다.
+
+        Args:
+            max_age_secs: 스냅샷 유효 시간(초)
+
+        Returns:
+            DashboardSnapshot: 대시보드 스냅샷
+        """
+        snapshot = DashboardService._snapshot
+        if snapshot is None:
+            with DashboardService._lock:
+                if DashboardService._snapshot is None:
+                    DashboardService.refresh()
+                return DashboardService._snapshot
+
+        if snapshot.age() > max_age_secs:
+            DashboardService._refresh_in_background()
+        return snapshot
+
+    @staticmethod
+    def refresh() -> DashboardSnapshot:
+        """
+        종목별 실시간 시세와 최근 일별 시세를 동시에 조회해 대시보드 스냅샷을 새로 만듭니다.
+        조회에 실패한 종목은 이전 스냅샷의 값을 stale 로 표시해 유지합니다.
+
+        Returns:
+            DashboardSnapshot: 새 대시보드 스냅샷
+        """
+        deadline = Deadline(DashboardService.REFRESH_DEADLINE_SECS)
+        previous = DashboardService._snapshot
+
+        with ThreadPoolExecutor(max_workers=len(DashboardService.INSTRUMENTS),
+                                thread_name_prefix='dashboard-refresh') as executor:
+            futures = {
+                name: executor.submit(DashboardService._build_entry, name, service, deadline,
+                                      previous.instruments.get(name) if previous else None)
+                for name, service in DashboardService.INSTRUMENTS.items()
+            }
+            instruments = {name: future.result() for name, future in futures.items()}
+
+        snapshot = DashboardSnapshot(instruments)
+        DashboardService._snapshot = snapshot
+        logger.info(f"대시보드 스냅샷 갱신 완료 - version: {snapshot.version}")
+        return snapshot
+
+    @staticmethod
+    def _build_entry(name: str, service, deadline: Deadline, previous_entry: Optional[Dict]) -> Dict:
+        """
+        한 종목의 대시보드 항목을 만듭니다.
+
+        Args:
+            name: 종목 구분
+            service: 종목 서비스
+            deadline: 갱신 데드라인
+            previous_entry: 이전 스냅샷의 항목(없으면 None)
+
+        Returns:
+            Dict: {'quote': 실시간 시세, 'last_close': 가장 최근 거래일의 일별 시세, 'updated_at': ..., 'stale': ...}
+        """
+        try:
+            quote = service.get_realtime_price(deadline)['realtime_data']
+            last_close = next(service.get_history().iter_bars(deadline=deadline), None)
+            return {
+                'quote': quote,
+                'last_close': last_close,
+                'updated_at': datetime.now().isoformat(),
+                'stale': False
+            }
+        except Exception as e:
+            logger.error(f"대시보드 {name} 항목 갱신 중 오류: {str(e)}")
+            if previous_entry is not None:
+                return dict(previous_entry, stale=True)
+            return {'quote': None, 'last_close': None, 'updated_at': None, 'stale': True}
+
+    @staticmethod
+    def _export_checkpoint() -> Optional[Tuple[Dict, float]]:
+        """
+        체크포인트에 저장할 상태(스냅샷의 종목별 항목, 생성 시각)를 반환합니다. 응답 본문은 복원할 때 다시 만듭니다.
+
+        Returns:
+            Optional[Tuple]: (종목별 항목, 생성 시각), 스냅샷이 없으면 None
+        """
+        snapshot = DashboardService._snapshot
+        return (snapshot.instruments, snapshot.generated_at) if snapshot is not None else None
+
+    @staticmethod
+    def _restore_checkpoint(state: Tuple[Dict, float]):
+        """
+        체크포인트의 상태로 스냅샷을 채웁니다. 생성 시각을 그대로 두므로 오래된 스냅샷은 첫 요청에서 백그라운드로 갱신됩니다.
+
+        Args:
+            state: _export_checkpoint 로 저장한 상태
+        """
+        with DashboardService._lock:
+            if DashboardService._snapshot is None:
+                DashboardService._snapshot = DashboardSnapshot(*state)
+
+    @staticmethod
+    def _refresh_in_background():
+        """
+        갱신 중이 아니면 백그라운드 스레드에서 스냅샷을 갱신합니다.
+        """
+        with DashboardService._lock:
+            if DashboardService._refreshing:
+                return
+            DashboardService._refreshing = True
+
+        def run():
+            try:
+                DashboardService.refresh()
+            except Exception as e:
+                logger.error(f"대시보드 스냅샷 백그라운드 갱신 중 오류: {str(e)}")
+            finally:
+                DashboardService._refreshing = False
+
+        threading.Thread(target=run, name='dashboard-refresh', daemon=True).start()
+
+    @staticmethod
+    def start_refresher(interval_secs: float):
+        """
+        interval_secs 마다 스냅샷을 갱신하는 백그라운드 스레드를 시작합니다(프로세스당 하나).
+        Lambda 에서는 요청 사이에 스레드가 멈추므로 zappa events 의 tasks.refresh_dashboard_snapshot 을 사용합니다.
+
+        Args:
+            interval_secs: 갱신 주기(초)
+        """
+        with DashboardService._lock:
+            if DashboardService._refresher is not None:
+                return
+
+            def run():
+                while True:
+                    try:
+                        DashboardService.refresh()
+                    except Exception as e:
+                        logger.error(f"대시보드 스냅샷 주기 갱신 중 오류: {str(e)}")
+                    time.sleep(interval_secs)
+
+            DashboardService._refresher = threading.Thread(target=run, name='dashboard-refresher', daemon=True)
+            DashboardService._refresher.start()
+
+
+register_checkpoint('dashboard', DashboardService._export_checkpoint, DashboardService._restore_checkpoint)
@@ -0,0 +1,14 @@
+from api.dashboard.services import DashboardService
+from util.logging_util import logger
+
+
+def refresh_dashboard_snapshot(event=None, context=None):
+    """
+    대시보드 스냅샷을 갱신한다. zappa events 에 1분 주기로 등록되어 있다.
+    :param event: zappa 스케쥴 이벤트
+    :param context: Lambda 컨텍스트
+    """
+    snapshot = DashboardService.refresh()
+    stale = [name for name, entry in snapshot.instruments.items() if entry['stale']]
+    if stale:
+        logger.warning(f"대시보드 스냅샷 갱신 - 갱신하지 못한 종목: {', '.join(stale)}")
@@ -1,9 +1,13 @@
-from flask import request
+from flask import current_app, request
 from flask_restx import Resource, fields, reqparse
 
 from api.gold import gold_api
 from api.gold.services import GoldPriceService
+from util.cache_utils import conditional_get
+from util.deadline_utils import request_deadline
 from util.logging_util import logger
+from util.response_utils import (JSON_MIMETYPE, SERIES_MIMETYPES, fast_marshal_with, negotiate_series_format,
+                                  ndjson_response, series_response)
 from exceptions import CoreException
 
 
@@ -21,9 +25,23 @@ daily_price_model = gold_api.model('DailyPriceData', {
     'closing_price': fields.String(description='종가')
 })
 
+# 실시간 데이터 모델
+realtime_data_model = gold_api.model('GoldRealtimeData', {
+    'current_price': fields.String(description='현재가'),
+    'change_value': fields.String(description='전일비'),
+    'change_rate': fields.String(description='등락률'),
+    'direction': fields.String(description='등락 방향'),
+    'open_price': fields.String(description='시가'),
+    'high_price': fields.String(description='고가'),
+    'low_price': fields.String(description='저가'),
+    'market_status': fields.String(description='장 상태'),
+    'traded_at': fields.String(description='체결 시각(현지 기준)')
+})
+
 # 전체 일별 시세 응답 모델
 all_prices_model = gold_api.model('AllDailyPricesResponse', {
     'current_price': fields.String(description='현재가'),
+    'current_price_info': fields.Nested(realtime_data_model, description='현재가 정보'),
     'daily_prices': fields.List(fields.Nested(daily_price_model), description='일별 시세 목록'),
     'total_count': fields.Integer(description='총 데이터 개수'),
     'last_updated': fields.String(description='마지막 업데이트 시간')
@@ -49,13 +67,54 @@ date_range_parser.add_argument('end_date',
                               required=True, 
                               help='종료 날짜 (YYYY-MM-DD 형식)',
                               location='args')
+date_range_parser.add_argument('stream', 
+                              type=str, 
+                              required=False, 
+                              choices=('ndjson',),
+                              help='ndjson 이면 일별 시세를 한 줄에 한 건씩 스트리밍 (선택사항)',
+                              location='args')
+
+
+# 커서 페이지네이션 파라미터 파서
+page_parser = reqparse.RequestParser()
+page_parser.add_argument('fields', 
+                         type=str, 
+                         required=False, 
+                         help='일별 시세에 남길 필드 (쉼표 구분, 예: date,closing_price)',
+                         location='args')
+page_parser.add_argument('limit', 
+                         type=int, 
+                         required=False, 
+                         help='페이지당 일별 시세 수 (기본값: 20)',
+                         location='args')
+page_parser.add_argument('after', 
+                         type=str, 
+                         required=False, 
+                         help='이전 응답의 next_cursor (YYYY-MM-DD 형식)',
+                         location='args')
+
+
+# 동기화 파라미터 파서
+sync_parser = reqparse.RequestParser()
+sync_parser.add_argument('since', 
+                         type=str, 
+                         required=False, 
+                         help='마지막으로 받은 날짜 (YYYY-MM-DD 형식, 이 날짜 이후의 시세만 조회)',
+                         location='args')
+sync_parser.add_argument('token', 
+                         type=str, 
+                         required=False, 
+                         help='이전 응답의 동기화 토큰 (since 보다 우선)',
+                         location='args')
 
 
 @gold_api.route('/price')
 class GoldPrice(Resource):
+    @gold_api.produces(SERIES_MIMETYPES)
     @gold_api.doc('get_gold_price')
-    @gold_api.expect(price_parser)
-    @gold_api.marshal_with(gold_price_model)
+    @gold_api.expect(price_parser, page_parser)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(gold_api, gold_price_model)
     def get(self):
         """네이버 금융에서 금 가격 정보를 조회합니다.
         
@@ -64,13 +123,38 @@ class GoldPrice(Resource):
                 미입력시 전체 일별 시세 데이터를 조회합니다.
         """
         try:
+            deadline = request_deadline()
             args = price_parser.parse_args()
             date = args.get('date')
             
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = GoldPriceService.get_price_page_columns(
+                        date, date, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, '금 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = GoldPriceService.get_price_page(date, date, page_args.get('after'),
+                                                         page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': '금 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = GoldPriceService.get_price_series(date, date, deadline)
+                return series_response(series.columns, mimetype, '금 시세를 성공적으로 조회했습니다.')
+            
             logger.info(f"금 가격 정보 조회 요청 - date: {date}")
             
             # 서비스 호출
-            result = GoldPriceService.get_gold_price_info(date)
+            result = GoldPriceService.get_gold_price_info(date, deadline)
             
             return {
                 'status': 'success',
@@ -100,15 +184,43 @@ class GoldPrice(Resource):
 
 @gold_api.route('/price/daily')
 class GoldDailyPrices(Resource):
+    @gold_api.produces(SERIES_MIMETYPES)
     @gold_api.doc('get_all_daily_prices')
-    @gold_api.marshal_with(gold_price_model)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(gold_api, gold_price_model)
     def get(self):
         """네이버 금융에서 전체 일별 금 시세 데이터를 조회합니다."""
         try:
+            deadline = request_deadline()
+            
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = GoldPriceService.get_price_page_columns(
+                        None, None, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, '금 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = GoldPriceService.get_price_page(None, None, page_args.get('after'),
+                                                         page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': '금 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = GoldPriceService.get_price_series(None, None, deadline)
+                return series_response(series.columns, mimetype, '전체 일별 금 시세를 성공적으로 조회했습니다.')
+            
             logger.info("전체 일별 금 시세 조회 요청")
             
             # 전체 일별 시세 조회
-            result = GoldPriceService._get_all_daily_prices()
+            result = GoldPriceService._get_all_daily_prices(deadline)
             
             return {
                 'status': 'success',
@@ -138,25 +250,57 @@ class GoldDailyPrices(Resource):
 
 @gold_api.route('/price/range')
 class GoldPriceRange(Resource):
+    @gold_api.produces(SERIES_MIMETYPES)
     @gold_api.doc('get_price_range')
-    @gold_api.expect(date_range_parser)
-    @gold_api.marshal_with(gold_price_model)
+    @gold_api.expect(date_range_parser, page_parser)
+    @conditional_get('PRICE_MAX_AGE_SECS')
+    @fast_marshal_with(gold_api, gold_price_model)
     def get(self):
         """지정된 날짜 범위의 금 시세 데이터를 조회합니다.
         
         파라미터:
         - start_date: 시작 날짜 (YYYY-MM-DD 형식, 필수)
         - end_date: 종료 날짜 (YYYY-MM-DD 형식, 필수)
+        - stream: ndjson 이면 application/x-ndjson 으로 한 줄에 한 건씩 스트리밍 (선택사항)
         """
         try:
+            deadline = request_deadline()
             args = date_range_parser.parse_args()
             start_date = args.get('start_date')
             end_date = args.get('end_date')
             
+            # stream=ndjson 이면 일별 시세 이력을 페이지 단위로 읽으며 한 줄씩 스트리밍
+            if args.get('stream') == 'ndjson':
+                return ndjson_response(GoldPriceService.iter_price_bars(start_date, end_date, deadline))
+            
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = GoldPriceService.get_price_page_columns(
+                        start_date, end_date, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, '금 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = GoldPriceService.get_price_page(start_date, end_date, page_args.get('after'),
+                                                         page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': '금 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = GoldPriceService.get_price_series(start_date, end_date, deadline, from_history=True)
+                return series_response(series.columns, mimetype, '날짜 범위 금 시세를 성공적으로 조회했습니다.')
+            
             logger.info(f"날짜 범위 금 시세 조회 요청 - start: {start_date}, end: {end_date}")
             
             # 날짜 범위 조회
-            result = GoldPriceService.get_date_range_prices(start_date, end_date)
+            result = GoldPriceService.get_date_range_prices(start_date, end_date, deadline)
             
             return {
                 'status': 'success',
@@ -184,27 +328,66 @@ class GoldPriceRange(Resource):
             }, 500
 
 
+@gold_api.route('/price/history')
+class GoldPriceHistory(Resource):
+    @gold_api.expect(sync_parser)
+    @fast_marshal_with(gold_api, gold_price_model)
+    @gold_api.doc('get_gold_price_history')
+    @gold_api.doc(description='since 또는 동기화 토큰 이후에 추가되거나 바뀐 금 일별 시세만 조회합니다.')
+    def get(self):
+        """금 일별 시세 변경분 조회
+        
+        파라미터:
+        - since: 마지막으로 받은 날짜 (YYYY-MM-DD 형식)
+        - token: 이전 응답의 token (since 보다 우선, 같은 날짜의 수정된 시세도 포함)
+        """
+        try:
+            deadline = request_deadline()
+            args = sync_parser.parse_args()
+            
+            result = GoldPriceService.get_price_changes(args.get('since'), args.get('token'), deadline)
+            
+            logger.info(f"금 일별 시세 변경분 조회 완료 - {result['count']}건")
+            
+            return {
+                'status': 'success',
+                'data': result,
+                'message': '금 일별 시세 변경분을 성공적으로 조회했습니다.',
+                'error_code': None
+            }
+            
+        except CoreException as e:
+            logger.error(f"금 일별 시세 변경분 조회 중 오류: {e.error_code} - {e.message}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': e.message,
+                'error_code': e.error_code
+            }, 400
+            
+        except Exception as e:
+            logger.error(f"금 일별 시세 변경분 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
+
+
 @gold_api.route('/price/latest')
 class GoldLatestPrice(Resource):
     @gold_api.doc('get_latest_price')
-    @gold_api.marshal_with(gold_price_model)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(gold_api, gold_price_model)
     def get(self):
         """가장 최근 거래일의 금 시세 데이터를 조회합니다."""
         try:
+            deadline = request_deadline()
             logger.info("최신 금 시세 조회 요청")
             
-            # 전체 데이터를 가져온 후 첫 번째(최신) 데이터만 반환
-            all_data = GoldPriceService._get_all_daily_prices()
-            
-            if all_data['daily_prices']:
-                latest_price = all_data['daily_prices'][0]  # 첫 번째가 가장 최신
-                result = {
-                    'current_price': all_data['current_price'],
-                    'latest_trading_day': latest_price,
-                    'last_updated': all_data['last_updated']
-                }
-            else:
-                raise CoreException("NO_DATA_FOUND", "최신 시세 데이터를 찾을 수 없습니다.")
+            # 최신 일별 시세/현재가 레코드에서 조회 (유효 시간이 지난 레코드만 다시 가져옴)
+            result = GoldPriceService.get_latest_price(current_app.config['REALTIME_MAX_AGE_SECS'], deadline)
             
             return {
                 'status': 'success',
@@ -230,4 +413,43 @@ class GoldLatestPrice(Resource):
                 'message': '서버 내부 오류가 발생했습니다.',
                 'error_code': 'INTERNAL_SERVER_ERROR'
             }, 500
-       
\ No newline at end of file
+
+
+@gold_api.route('/price/realtime')
+class GoldRealtimePrice(Resource):
+    @gold_api.doc('get_realtime_price')
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(gold_api, gold_price_model)
+    def get(self):
+        """실시간 금 가격 정보(현재가, 전일비, 시가/고가/저가)를 조회합니다."""
+        try:
+            deadline = request_deadline()
+            logger.info("실시간 금 시세 조회 요청")
+            
+            # 실시간 금 가격 정보 조회
+            result = GoldPriceService.get_realtime_price(deadline)
+            
+            return {
+                'status': 'success',
+                'data': result,
+                'message': '실시간 금 시세를 성공적으로 조회했습니다.',
+                'error_code': None
+            }
+            
+        except CoreException as e:
+            logger.error(f"실시간 시세 조회 중 비즈니스 오류: {e.error_code} - {e.message}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': e.message,
+                'error_code': e.error_code
+            }, 400
+            
+        except Exception as e:
+            logger.error(f"실시간 시세 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
@@ -1,26 +1,51 @@
 import urllib.request
 import urllib.parse
+import hashlib
 import re
+import time
 import requests
-from typing import Dict, Optional, List
-from bs4 import BeautifulSoup
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import datetime, date
 
+from api.market.models import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, HistoryStore, PriceSeries, rows_to_columns
+from api.market.services import SharedSnapshotService
+from util.cache_utils import pin_data_version
+from util.checkpoint_utils import register_checkpoint
+from util.deadline_utils import Deadline
+from util.fetch_utils import fetch, fetch_element_text, fetch_table
+from util.html_utils import TableRow
 from util.logging_util import logger
-from exceptions import CoreException
+from exceptions import CoreException, DeadlineExceededException
 
 
 class GoldPriceService:
     BASE_URL = "https://finance.naver.com/marketindex/worldGoldDetail.naver"
+    # 일별 시세 데이터는 별도 URL에서 가져옴
+    DAILY_QUOTE_URL = "https://finance.naver.com/marketindex/worldDailyQuote.naver?marketindexCd=CMDT_GC&fdtc=2"
+    REALTIME_URL = "https://api.stock.naver.com/marketindex/metals/GCcv1"
+    # 컬럼 단위 시계열의 컬럼명 -> (일별 시세 행의 키, 타입)
+    SERIES_FIELDS = {
+        'close': ('closing_price', float)
+    }
+    _history: Optional[HistoryStore] = None
+    # 최신 현재가 레코드: (현재가 정보, 조회 시각). 시세 JSON API 조회에 성공할 때마다 갱신
+    _latest_quote: Optional[Tuple[Dict, float]] = None
+    EMPTY_PRICE_INFO = {
+        'current_price': "N/A",
+        'change_value': "N/A",
+        'change_rate': "N/A",
+        'direction': "N/A"
+    }
     
     @staticmethod
-    def get_gold_price_info(date: Optional[str] = None) -> Dict:
+    def get_gold_price_info(date: Optional[str] = None, deadline: Optional[Deadline] = None) -> Dict:
         """
         네이버 금융에서 금 가격 정보를 조회합니다.
         
         Args:
             date: 조회할 날짜 (YYYY-MM-DD 형식, 선택사항)
                 미입력시 실시간 데이터를 조회합니다.
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
             Dict: 금 가격 정보
@@ -28,72 +53,42 @@ class GoldPriceService:
         try:
             if date:
                 # 특정 날짜 조회
-                return GoldPriceService._get_gold_price_by_date(date)
+                return GoldPriceService._get_gold_price_by_date(date, deadline)
             else:
                 # 전체 일별 시세 조회
-                return GoldPriceService._get_all_daily_prices()
+                return GoldPriceService._get_all_daily_prices(deadline)
         except Exception as e:
             logger.error(f"금 가격 정보 조회 중 오류 발생: {str(e)}")
             raise CoreException("GOLD_PRICE_FETCH_ERROR", f"금 가격 정보를 가져올 수 없습니다: {str(e)}")
     
     @staticmethod
-    def _get_all_daily_prices() -> Dict:
+    def _get_all_daily_prices(deadline: Optional[Deadline] = None) -> Dict:
         """
         네이버 금융에서 전체 일별 금 시세를 크롤링합니다.
         
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
         Returns:
             Dict: 전체 일별 시세 데이터
         """
         try:
-            # 일별 시세 데이터는 별도 URL에서 가져옴
-            daily_quote_url = "https://finance.naver.com/marketindex/worldDailyQuote.naver?marketindexCd=CMDT_GC&fdtc=2&page=1"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            # 일별 시세 데이터 크롤링
-            response = requests.get(daily_quote_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 일별 시세 테이블 찾기 - 더 정확한 셀렉터 사용
-            daily_prices = []
+            daily_prices = GoldPriceService._get_daily_series(deadline).rows
             
-            # 테이블의 tbody에서 데이터 행들을 찾기
-            table = soup.find('table')
-            if table:
-                # 헤더 행을 제외한 데이터 행들
-                rows = table.find_all('tr')[1:]  # 첫 번째 행(헤더) 제외
-                
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 4:
-                        try:
-                            date_text = cells[0].get_text(strip=True)
-                            closing_price = cells[1].get_text(strip=True)
-                            
-                            # 날짜 형식 확인 (YYYY.MM.DD 형식)
-                            if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
-                                daily_prices.append({
-                                    'date': date_text,
-                                    'closing_price': closing_price
-                                })
-                        except (IndexError, ValueError) as e:
-                            logger.warning(f"테이블 행 파싱 중 오류: {str(e)}")
-                            continue
-            
-            # 현재가 정보는 메인 페이지에서 가져오기
-            current_price = GoldPriceService._get_current_price()
+            # 현재가 정보는 시세 JSON API에서 가져오기
+            current_price_info = GoldPriceService._get_current_price(deadline)
             
             return {
-                'current_price': current_price,
+                'current_price': current_price_info['current_price'],
+                'current_price_info': current_price_info,
                 'daily_prices': daily_prices,
                 'last_updated': datetime.now().isoformat(),
                 'total_count': len(daily_prices)
             }
             
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
         except requests.RequestException as e:
             logger.error(f"네이버 금융 페이지 요청 중 오류: {str(e)}")
             raise CoreException("NETWORK_ERROR", f"네트워크 오류가 발생했습니다: {str(e)}")
@@ -102,65 +97,298 @@ class GoldPriceService:
             raise CoreException("CRAWLING_ERROR", f"데이터 파싱 중 오류가 발생했습니다: {str(e)}")
     
     @staticmethod
-    def _get_current_price() -> str:
+    def _get_daily_series(deadline: Optional[Deadline] = None) -> PriceSeries:
         """
-        네이버 금융 메인 페이지에서 현재가 정보를 가져옵니다.
+        최신 일별 시세 페이지(1페이지)를 컬럼 단위 시계열로 반환합니다.
+        일별 시세 이력을 거쳐 읽으므로 최신 일별 시세 레코드도 함께 갱신됩니다.
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
-            str: 현재가
+            PriceSeries: 일별 시세 시계열(rows 에 기존 일별 시세 목록 포함)
+        """
+        return GoldPriceService.get_history().load_page(1, deadline)
+    
+    @staticmethod
+    def get_history() -> HistoryStore:
+        """
+        일별 시세 이력 저장소를 반환합니다.
+        
+        Returns:
+            HistoryStore: 일별 시세 이력
+        """
+        if GoldPriceService._history is None:
+            GoldPriceService._history = HistoryStore('gold', GoldPriceService._get_daily_series_page)
+        return GoldPriceService._history
+    
+    @staticmethod
+    def _export_checkpoint() -> Optional[Dict]:
+        """
+        체크포인트에 저장할 상태(일별 시세 이력, 최신 현재가 레코드)를 반환합니다.
+        
+        Returns:
+            Optional[Dict]: 저장할 상태(읽은 데이터가 없으면 None)
+        """
+        history = GoldPriceService.get_history().export_state()
+        if history is None and GoldPriceService._latest_quote is None:
+            return None
+        return {'history': history, 'latest_quote': GoldPriceService._latest_quote}
+    
+    @staticmethod
+    def _restore_checkpoint(state: Dict):
+        """
+        체크포인트의 상태로 일별 시세 이력과 최신 현재가 레코드를 채웁니다(이미 조회한 값은 그대로 둡니다).
+        
+        Args:
+            state: _export_checkpoint 로 저장한 상태
+        """
+        if state['history'] is not None:
+            GoldPriceService.get_history().restore_state(state['history'])
+        if GoldPriceService._latest_quote is None:
+            GoldPriceService._latest_quote = state['latest_quote']
+    
+    @staticmethod
+    def _get_daily_series_page(page: int, deadline: Optional[Deadline] = None) -> PriceSeries:
+        """
+        일별 시세 페이지를 컬럼 단위 시계열로 반환합니다.
+        1페이지는 공유 스냅샷이 있으면 스냅샷의 것을 사용하고, 없으면 네이버 금융을 직접 조회합니다.
+        
+        Args:
+            page: 페이지 번호 (1페이지가 최신)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열(rows 에 기존 일별 시세 목록 포함)
+        """
+        if page == 1:
+            snapshot = SharedSnapshotService.get_snapshot('gold', deadline)
+            if snapshot is not None:
+                return snapshot['daily']
+        return GoldPriceService._fetch_daily_series_page(page, deadline)
+    
+    @staticmethod
+    def _get_current_price(deadline: Optional[Deadline] = None) -> Dict:
+        """
+        현재가 정보를 가져옵니다.
+        공유 스냅샷이 있으면 스냅샷의 현재가를 사용하고, 없으면 시세 JSON API를 직접 조회합니다.
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 현재가 정보
+        """
+        snapshot = SharedSnapshotService.get_snapshot('gold', deadline)
+        if snapshot is None:
+            return GoldPriceService._fetch_current_price(deadline)
+        GoldPriceService._latest_quote = (snapshot['realtime'], snapshot['generated_at'])
+        return dict(snapshot['realtime'])
+    
+    @staticmethod
+    def _build_shared_snapshot(deadline: Optional[Deadline] = None) -> Optional[Dict]:
+        """
+        공유 스냅샷에 쓸 현재가 정보와 일별 시세 1페이지를 네이버 금융에서 직접 조회합니다(선출된 워커만 호출).
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Optional[Dict]: {'realtime': 현재가 정보, 'daily': 일별 시세 1페이지}. 현재가를 가져오지 못하면 None
+        """
+        realtime = GoldPriceService._fetch_current_price(deadline)
+        if realtime['current_price'] == "N/A":
+            return None
+        return {'realtime': realtime, 'daily': GoldPriceService._fetch_daily_series_page(1, deadline)}
+    
+    @staticmethod
+    def _fetch_daily_series_page(page: int, deadline: Optional[Deadline] = None) -> PriceSeries:
+        """
+        일별 시세 페이지를 조회해 컬럼 단위 시계열로 반환합니다.
+        
+        Args:
+            page: 페이지 번호 (1페이지가 최신)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열(rows 에 기존 일별 시세 목록 포함)
         """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        
+        # 일별 시세 데이터 크롤링 (첫 번째 테이블까지만 스트리밍으로 읽고, 바뀌지 않았으면 이전 파싱 결과 재사용)
+        url = f"{GoldPriceService.DAILY_QUOTE_URL}&page={page}"
+        return fetch_table(url, GoldPriceService._parse_daily_table,
+                           headers=headers, timeout=10, deadline=deadline)
+    
+    @staticmethod
+    def _parse_daily_table(rows: List[TableRow]) -> PriceSeries:
+        """
+        일별 시세 테이블의 행 목록을 컬럼 단위 시계열로 변환합니다.
+        
+        Args:
+            rows: 일별 시세 테이블의 행 목록
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열
+        """
+        daily_prices = GoldPriceService._parse_daily_prices(rows)
+        return PriceSeries.from_rows('gold', daily_prices, GoldPriceService.SERIES_FIELDS)
+    
+    @staticmethod
+    def _parse_daily_prices(rows: List[TableRow]) -> List[Dict]:
+        """
+        일별 시세 테이블의 행 목록에서 일별 시세 목록을 추출합니다.
+        
+        Args:
+            rows: 일별 시세 테이블의 행 목록
+        
+        Returns:
+            List[Dict]: 일별 시세 목록
+        """
+        daily_prices = []
+        
+        # 헤더 행을 제외한 데이터 행들
+        for row in rows[1:]:  # 첫 번째 행(헤더) 제외
+            cells = row.cells
+            if len(cells) >= 4:
+                date_text = cells[0]
+                closing_price = cells[1]
+                
+                # 날짜 형식 확인 (YYYY.MM.DD 형식)
+                if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
+                    daily_prices.append({
+                        'date': date_text,
+                        'closing_price': closing_price
+                    })
+        
+        return daily_prices
+    
+    @staticmethod
+    def _fetch_current_price(deadline: Optional[Deadline] = None) -> Dict:
+        """
+        시세 JSON API에서 현재가 정보를 가져옵니다.
+        API 조회에 실패하면 상세 페이지의 현재가 영역만 읽어 현재가를 가져옵니다.
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 현재가 정보
+        """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        
         try:
-            url = f"{GoldPriceService.BASE_URL}?marketindexCd=CMDT_GC&fdtc=2"
+            response = fetch(GoldPriceService.REALTIME_URL, headers=headers, timeout=10, deadline=deadline, hedge=True)
+            response.raise_for_status()
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            current_price_info = GoldPriceService._parse_realtime_data(response.json())
+            GoldPriceService._latest_quote = (current_price_info, time.time())
+            return current_price_info
             
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+        except DeadlineExceededException:
+            logger.warning("요청 데드라인 초과로 현재가 조회 생략")
+            return dict(GoldPriceService.EMPTY_PRICE_INFO)
+        except Exception as e:
+            logger.warning(f"시세 API 현재가 조회 중 오류, 상세 페이지로 대체: {str(e)}")
+        
+        try:
+            # 상세 페이지는 현재가 영역(p.no_today)이 닫히면 더 읽지 않는다.
+            url = f"{GoldPriceService.BASE_URL}?marketindexCd=CMDT_GC&fdtc=2"
+            current_price = fetch_element_text(url, GoldPriceService._parse_current_price, 'p', 'no_today',
+                                               headers=headers, timeout=10, deadline=deadline, encoding='euc-kr')
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 현재가 찾기 - 여러 셀렉터 시도
-            current_price_selectors = [
-                '.num',
-                '.blind em',
-                'em.num',
-                'span.num',
-                'strong em'
-            ]
-            
-            current_price = "N/A"
-            for selector in current_price_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    price_text = element.get_text(strip=True)
-                    # 숫자와 콤마, 점이 포함된 가격 패턴 확인
-                    if re.match(r'[\d,]+\.?\d*', price_text):
-                        current_price = price_text
-                        break
-                        
-            # 현재가를 찾지 못한 경우 페이지 전체에서 금액 패턴 검색
-            if current_price == "N/A":
-                text_content = soup.get_text()
-                # 3,000대 숫자 패턴 검색 (금 시세는 보통 3,000대)
-                price_match = re.search(r'3,\d{3}\.\d{2}', text_content)
-                if price_match:
-                    current_price = price_match.group()
-                    
-            return current_price
+            return {
+                **GoldPriceService.EMPTY_PRICE_INFO,
+                'current_price': current_price
+            }
             
         except Exception as e:
             logger.warning(f"현재가 조회 중 오류: {str(e)}")
-            return "N/A"
+            return dict(GoldPriceService.EMPTY_PRICE_INFO)
     
     @staticmethod
-    def _get_gold_price_by_date(target_date: str) -> Dict:
+    def _parse_realtime_data(data: Dict) -> Dict:
+        """
+        시세 JSON API 응답에서 현재가 정보를 추출합니다.
+        
+        Args:
+            data: 시세 JSON API 응답
+        
+        Returns:
+            Dict: 현재가 정보
+        """
+        current_price = GoldPriceService._to_number(data.get('closePrice'))
+        if current_price is None:
+            raise ValueError(f"현재가 항목이 없습니다: {list(data.keys())}")
+        
+        change_value = GoldPriceService._to_number(data.get('compareToPreviousClosePrice'))
+        change_rate = GoldPriceService._to_number(data.get('fluctuationsRatio'))
+        
+        # 등락 방향 판단 (code: 1=상한, 2=상승, 3=보합, 4=하한, 5=하락)
+        direction_map = {"1": "상승", "2": "상승", "3": "보합", "4": "하락", "5": "하락"}
+        fluctuation = data.get('compareToPreviousPrice') or data.get('fluctuationsType')
+        code = fluctuation.get('code', 3) if isinstance(fluctuation, dict) else 3
+        direction = direction_map.get(str(code), "보합")
+        
+        def format_price(value: Optional[float]) -> str:
+            return f"{value:.2f}" if value is not None else "N/A"
+        
+        return {
+            'current_price': format_price(current_price),
+            'change_value': format_price(abs(change_value) if change_value is not None else None),
+            'change_rate': f"{change_rate:.2f}%" if change_rate is not None else "N/A",
+            'direction': direction,
+            'open_price': format_price(GoldPriceService._to_number(data.get('openPrice'))),
+            'high_price': format_price(GoldPriceService._to_number(data.get('highPrice'))),
+            'low_price': format_price(GoldPriceService._to_number(data.get('lowPrice'))),
+            'market_status': data.get('marketStatus', 'UNKNOWN'),
+            'traded_at': data.get('localTradedAt')
+        }
+    
+    @staticmethod
+    def _parse_current_price(text: Optional[str]) -> str:
+        """
+        상세 페이지 현재가 영역의 텍스트에서 현재가를 추출합니다.
+        
+        Args:
+            text: 현재가 영역(p.no_today)의 텍스트
+        
+        Returns:
+            str: 현재가
+        """
+        price = GoldPriceService._to_number(text)
+        return f"{price:.2f}" if price is not None else "N/A"
+    
+    @staticmethod
+    def _to_number(value) -> Optional[float]:
+        """
+        '3,412.50' 형식의 가격 문자열(또는 숫자)을 숫자로 변환합니다.
+        
+        Args:
+            value: 가격 문자열 또는 숫자
+        
+        Returns:
+            Optional[float]: 변환된 숫자, 변환할 수 없으면 None
+        """
+        if isinstance(value, (int, float)):
+            return float(value)
+        if not value:
+            return None
+        match = re.search(r'-?[\d,]*\d(?:\.\d+)?', str(value))
+        return float(match.group().replace(',', '')) if match else None
+    
+    @staticmethod
+    def _get_gold_price_by_date(target_date: str, deadline: Optional[Deadline] = None) -> Dict:
         """
         특정 날짜의 금 시세를 조회합니다.
         
         Args:
             target_date: 조회할 날짜 (YYYY-MM-DD 형식)
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
             Dict: 해당 날짜의 금 시세 정보
@@ -170,7 +398,7 @@ class GoldPriceService:
             datetime.strptime(target_date, '%Y-%m-%d')
             
             # 전체 데이터를 가져온 후 해당 날짜 필터링
-            all_data = GoldPriceService._get_all_daily_prices()
+            all_data = GoldPriceService._get_all_daily_prices(deadline)
             
             # 날짜 형식 변환 (YYYY-MM-DD -> YYYY.MM.DD)
             target_date_formatted = target_date.replace('-', '.')
@@ -196,13 +424,14 @@ class GoldPriceService:
             raise CoreException("DATE_QUERY_ERROR", f"날짜별 조회 중 오류가 발생했습니다: {str(e)}")
     
     @staticmethod
-    def get_date_range_prices(start_date: str, end_date: str) -> Dict:
+    def get_date_range_prices(start_date: str, end_date: str, deadline: Optional[Deadline] = None) -> Dict:
         """
         날짜 범위의 금 시세를 조회합니다.
         
         Args:
             start_date: 시작 날짜 (YYYY-MM-DD 형식)
             end_date: 종료 날짜 (YYYY-MM-DD 형식)
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
             Dict: 날짜 범위의 금 시세 정보
@@ -215,18 +444,8 @@ class GoldPriceService:
             if start_dt > end_dt:
                 raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
             
-            # 전체 데이터 가져오기
-            all_data = GoldPriceService._get_all_daily_prices()
-            
-            # 날짜 범위 필터링
-            filtered_prices = []
-            for price_data in all_data['daily_prices']:
-                try:
-                    price_date = datetime.strptime(price_data['date'], '%Y.%m.%d')
-                    if start_dt <= price_date <= end_dt:
-                        filtered_prices.append(price_data)
-                except ValueError:
-                    continue
+            # 일별 시세 이력에서 날짜 범위의 행 조회 (NDJSON, 시계열 응답과 같은 범위)
+            filtered_prices = GoldPriceService.get_history().get_series(start_date, end_date, deadline).rows
             
             return {
                 'start_date': start_date,
@@ -240,7 +459,272 @@ class GoldPriceService:
             raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
         except CoreException:
             raise
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 이력 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
         except Exception as e:
             logger.error(f"날짜 범위 금 시세 조회 중 오류: {str(e)}")
             raise CoreException("DATE_RANGE_QUERY_ERROR", f"날짜 범위 조회 중 오류가 발생했습니다: {str(e)}")
-        
\ No newline at end of file
+    
+    @staticmethod
+    def get_price_series(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                         deadline: Optional[Deadline] = None, from_history: bool = False) -> PriceSeries:
+        """
+        금 일별 시세를 컬럼 단위 시계열로 조회합니다.
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 선택사항)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 선택사항)
+            deadline: 요청 데드라인(선택사항)
+            from_history: True 이면 첫 페이지가 아닌 일별 시세 이력에서 조회 (날짜 범위 조회용)
+        
+        Returns:
+            PriceSeries: 날짜 범위의 일별 시세 시계열
+        """
+        try:
+            # 날짜 형식 검증
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+            
+            if start_dt and end_dt and start_dt > end_dt:
+                raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+            
+            if from_history:
+                return GoldPriceService.get_history().get_series(start_date, end_date, deadline)
+            return GoldPriceService._get_daily_series(deadline).between(start_date, end_date)
+            
+        except ValueError:
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        except CoreException:
+            raise
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"금 시계열 조회 중 오류: {str(e)}")
+            raise CoreException("SERIES_QUERY_ERROR", f"시계열 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    @staticmethod
+    def iter_price_bars(start_date: str, end_date: str, deadline: Optional[Deadline] = None) -> Iterator[Dict]:
+        """
+        날짜 범위의 금 일별 시세를 일별 시세 이력에서 최신순으로 하나씩 조회합니다.
+        날짜 형식은 호출 시점에 검증하고, 업스트림 페이지는 반환된 이터레이터를 소비할 때 필요한 만큼만 읽습니다.
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Iterator[Dict]: 일별 시세({'date': ..., 'close': ..., ...}) 이터레이터
+        """
+        try:
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        except ValueError:
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        
+        if start_dt > end_dt:
+            raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+        
+        def iter_bars():
+            try:
+                yield from GoldPriceService.get_history().iter_bars(start_date, end_date, deadline)
+            except DeadlineExceededException:
+                logger.error("요청 데드라인 초과로 일별 시세 이력 조회 중단")
+                raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+            except Exception as e:
+                logger.error(f"금 일별 시세 이력 조회 중 오류: {str(e)}")
+                raise CoreException("HISTORY_QUERY_ERROR", f"일별 시세 이력 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        return iter_bars()
+    
+    @staticmethod
+    def get_price_page(start_date: Optional[str] = None, end_date: Optional[str] = None, after: Optional[str] = None,
+                       limit: Optional[int] = None, fields: Optional[str] = None,
+                       deadline: Optional[Deadline] = None) -> Dict:
+        """
+        금 일별 시세를 커서 기반 페이지로 조회합니다.
+        날짜 인덱스로 커서 이전의 일별 시세 페이지는 건너뛰고, limit 개를 채울 때까지만 페이지를 읽습니다.
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 선택사항)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 선택사항)
+            after: 이전 응답의 next_cursor (YYYY-MM-DD 형식, 선택사항)
+            limit: 최대 일별 시세 수 (미입력시 DEFAULT_PAGE_LIMIT)
+            fields: 일별 시세에 남길 필드 목록 (쉼표 구분, 선택사항)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 일별 시세 목록과 다음 페이지 커서(next_cursor, 마지막 페이지이면 None)
+        """
+        try:
+            # 날짜 형식 검증
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+            if after:
+                datetime.strptime(after, '%Y-%m-%d')
+        except ValueError:
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        
+        if start_dt and end_dt and start_dt > end_dt:
+            raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+        
+        if limit is None:
+            limit = DEFAULT_PAGE_LIMIT
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise CoreException("INVALID_LIMIT", f"limit 은 1 이상 {MAX_PAGE_LIMIT} 이하로 입력해주세요.")
+        
+        selected_fields = None
+        if fields:
+            row_fields = ['date'] + [key for key, _ in GoldPriceService.SERIES_FIELDS.values()]
+            selected_fields = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown_fields = [field for field in selected_fields if field not in row_fields]
+            if not selected_fields or unknown_fields:
+                raise CoreException("INVALID_FIELDS",
+                                    f"지원하지 않는 필드입니다: {', '.join(unknown_fields)} (사용 가능: {', '.join(row_fields)})")
+        
+        try:
+            result = GoldPriceService.get_history().get_page(limit, start_date, end_date, after or None,
+                                                             selected_fields, deadline)
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 페이지 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"금 일별 시세 페이지 조회 중 오류: {str(e)}")
+            raise CoreException("PAGE_QUERY_ERROR", f"일별 시세 페이지 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        result['last_updated'] = datetime.now().isoformat()
+        return result
+    
+    @staticmethod
+    def get_price_page_columns(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                               after: Optional[str] = None, limit: Optional[int] = None, fields: Optional[str] = None,
+                               deadline: Optional[Deadline] = None) -> Tuple[Dict[str, list], Optional[str]]:
+        """
+        get_price_page 와 같은 일별 시세 페이지를 컬럼 단위로 조회합니다 (Accept 로 시계열 형식을 요청한 경우).
+        컬럼명과 순서는 JSON 응답의 일별 시세 필드와 같고, 날짜는 YYYY-MM-DD, 시세는 숫자로 변환합니다.
+        
+        Args:
+            get_price_page 와 같음
+        
+        Returns:
+            Tuple: (필드명 -> 값 리스트, 다음 페이지 커서 또는 None)
+        """
+        result = GoldPriceService.get_price_page(start_date, end_date, after, limit, fields, deadline)
+        if fields:
+            names = [field.strip() for field in fields.split(',') if field.strip()]
+        else:
+            names = ['date'] + [key for key, _ in GoldPriceService.SERIES_FIELDS.values()]
+        return rows_to_columns(result['daily_prices'], names, GoldPriceService.SERIES_FIELDS), result['next_cursor']
+    
+    @staticmethod
+    def get_price_changes(since: Optional[str] = None, token: Optional[str] = None,
+                          deadline: Optional[Deadline] = None) -> Dict:
+        """
+        since 이후에 추가된 금 일별 시세, 또는 동기화 토큰 이후에 추가되거나 바뀐 일별 시세만 조회합니다.
+        
+        Args:
+            since: 마지막으로 받은 날짜 (YYYY-MM-DD 형식, 선택사항)
+            token: 이전 응답의 동기화 토큰 (선택사항, since 보다 우선)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 추가/변경된 일별 시세 목록과 다음 동기화 토큰
+        """
+        if not since and not token:
+            raise CoreException("SYNC_POINT_REQUIRED", "since 또는 token 을 입력해주세요.")
+        
+        try:
+            if token:
+                HistoryStore.parse_sync_token(token)
+            else:
+                datetime.strptime(since, '%Y-%m-%d')
+        except ValueError:
+            if token:
+                raise CoreException("INVALID_SYNC_TOKEN", "동기화 토큰이 올바르지 않습니다.")
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        
+        try:
+            result = GoldPriceService.get_history().get_changes(since, token, deadline)
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 변경분 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"금 일별 시세 변경분 조회 중 오류: {str(e)}")
+            raise CoreException("SYNC_QUERY_ERROR", f"일별 시세 변경분 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        result['last_updated'] = datetime.now().isoformat()
+        return result
+    
+    @staticmethod
+    def get_latest_price(max_age_secs: float, deadline: Optional[Deadline] = None) -> Dict:
+        """
+        가장 최근 거래일의 금 시세와 현재가를 최신 레코드에서 조회합니다.
+        레코드가 max_age_secs 보다 오래되었을 때만 일별 시세 1페이지나 현재가를 다시 가져옵니다.
+        
+        Args:
+            max_age_secs: 레코드 유효 시간(초)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 최신 금 시세 정보
+        """
+        try:
+            latest = GoldPriceService.get_history().get_latest(max_age_secs, deadline)
+            if latest is None:
+                raise CoreException("NO_DATA_FOUND", "최신 시세 데이터를 찾을 수 없습니다.")
+            latest_row, _, validated_at = latest
+            
+            latest_quote = GoldPriceService._latest_quote
+            if latest_quote is None or time.time() - latest_quote[1] > max_age_secs:
+                latest_quote = (GoldPriceService._get_current_price(deadline), time.time())
+                # 현재가를 가져오지 못한 응답(N/A)은 레코드로 남기지 않아 다음 요청에서 다시 조회
+                if latest_quote[0]['current_price'] != "N/A":
+                    GoldPriceService._latest_quote = latest_quote
+            current_price_info, quoted_at = latest_quote
+            
+            # 레코드를 다시 가져왔는지와 관계없이 같은 값이면 같은 ETag 가 되도록 레코드의 버전으로 고정
+            version = hashlib.blake2b(repr((latest_row, current_price_info)).encode('utf-8'), digest_size=16)
+            pin_data_version('gold:latest', version.hexdigest(), min(validated_at, quoted_at))
+            
+            return {
+                'current_price': current_price_info['current_price'],
+                'current_price_info': current_price_info,
+                'latest_trading_day': latest_row,
+                'last_updated': datetime.now().isoformat()
+            }
+            
+        except CoreException:
+            raise
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 최신 시세 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"최신 금 시세 조회 중 오류: {str(e)}")
+            raise CoreException("LATEST_QUERY_ERROR", f"최신 시세 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    @staticmethod
+    def get_realtime_price(deadline: Optional[Deadline] = None) -> Dict:
+        """
+        실시간 금 가격 정보만 조회합니다.
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 실시간 금 가격 정보
+        """
+        try:
+            current_price_info = GoldPriceService._get_current_price(deadline)
+            return {
+                'realtime_data': current_price_info,
+                'last_updated': datetime.now().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"실시간 금 가격 조회 중 오류: {str(e)}")
+            raise CoreException("REALTIME_FETCH_ERROR", f"실시간 가격 정보를 가져올 수 없습니다: {str(e)}")
+
+
+register_checkpoint('gold', GoldPriceService._export_checkpoint, GoldPriceService._restore_checkpoint)
+SharedSnapshotService.register('gold', GoldPriceService._build_shared_snapshot)
@@ -4,7 +4,11 @@ from datetime import datetime
 
 from api.gs import gs_api
 from api.gs.services import GsStockService
+from util.cache_utils import conditional_get
+from util.deadline_utils import request_deadline
 from util.logging_util import logger
+from util.response_utils import (JSON_MIMETYPE, SERIES_MIMETYPES, fast_marshal_with, negotiate_series_format,
+                                  ndjson_response, series_response)
 from exceptions import CoreException
 
 
@@ -72,6 +76,12 @@ date_range_parser.add_argument('end_date',
                               required=True, 
                               help='종료 날짜 (YYYY-MM-DD 형식)',
                               location='args')
+date_range_parser.add_argument('stream', 
+                              type=str, 
+                              required=False, 
+                              choices=('ndjson',),
+                              help='ndjson 이면 일별 시세를 한 줄에 한 건씩 스트리밍 (선택사항)',
+                              location='args')
 
 # 페이지네이션 파라미터 파서
 pagination_parser = reqparse.RequestParser()
@@ -83,20 +93,80 @@ pagination_parser.add_argument('page',
                               location='args')
 
 
+# 커서 페이지네이션 파라미터 파서
+page_parser = reqparse.RequestParser()
+page_parser.add_argument('fields', 
+                         type=str, 
+                         required=False, 
+                         help='일별 시세에 남길 필드 (쉼표 구분, 예: date,closing_price)',
+                         location='args')
+page_parser.add_argument('limit', 
+                         type=int, 
+                         required=False, 
+                         help='페이지당 일별 시세 수 (기본값: 20)',
+                         location='args')
+page_parser.add_argument('after', 
+                         type=str, 
+                         required=False, 
+                         help='이전 응답의 next_cursor (YYYY-MM-DD 형식)',
+                         location='args')
+
+
+# 동기화 파라미터 파서
+sync_parser = reqparse.RequestParser()
+sync_parser.add_argument('since', 
+                         type=str, 
+                         required=False, 
+                         help='마지막으로 받은 날짜 (YYYY-MM-DD 형식, 이 날짜 이후의 시세만 조회)',
+                         location='args')
+sync_parser.add_argument('token', 
+                         type=str, 
+                         required=False, 
+                         help='이전 응답의 동기화 토큰 (since 보다 우선)',
+                         location='args')
+
+
 @gs_api.route('/price')
 class GsStockResource(Resource):
-    @gs_api.expect(price_parser)
-    @gs_api.marshal_with(gs_stock_model)
+    @gs_api.expect(price_parser, page_parser)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(gs_api, gs_stock_model)
+    @gs_api.produces(SERIES_MIMETYPES)
     @gs_api.doc('get_gs_stock')
     @gs_api.doc(description='GS 종목 정보를 조회합니다.')
     def get(self):
         """GS 종목 정보 조회"""
         try:
+            deadline = request_deadline()
             args = price_parser.parse_args()
             date = args.get('date')
             
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = GsStockService.get_price_page_columns(
+                        date, date, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, 'GS 종목 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = GsStockService.get_price_page(date, date, page_args.get('after'),
+                                                       page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': 'GS 종목 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = GsStockService.get_price_series(date, date, deadline)
+                return series_response(series.columns, mimetype, 'GS 종목 시세를 성공적으로 조회했습니다.')
+            
             # GS 종목 정보 조회
-            stock_info = GsStockService.get_gs_stock_info(date)
+            stock_info = GsStockService.get_gs_stock_info(date, deadline)
             
             logger.info(f"GS 종목 정보 조회 완료 - 날짜: {date or '전체'}")
             
@@ -127,19 +197,50 @@ class GsStockResource(Resource):
 
 @gs_api.route('/stock/range')
 class GsStockRangeResource(Resource):
-    @gs_api.expect(date_range_parser)
-    @gs_api.marshal_with(gs_stock_model)
+    @gs_api.expect(date_range_parser, page_parser)
+    @conditional_get('PRICE_MAX_AGE_SECS')
+    @fast_marshal_with(gs_api, gs_stock_model)
+    @gs_api.produces(SERIES_MIMETYPES)
     @gs_api.doc('get_gs_stock_range')
     @gs_api.doc(description='날짜 범위의 GS 종목 정보를 조회합니다.')
     def get(self):
         """날짜 범위 GS 종목 정보 조회"""
         try:
+            deadline = request_deadline()
             args = date_range_parser.parse_args()
             start_date = args.get('start_date')
             end_date = args.get('end_date')
             
+            # stream=ndjson 이면 일별 시세 이력을 페이지 단위로 읽으며 한 줄씩 스트리밍
+            if args.get('stream') == 'ndjson':
+                return ndjson_response(GsStockService.iter_price_bars(start_date, end_date, deadline))
+            
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = GsStockService.get_price_page_columns(
+                        start_date, end_date, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, 'GS 종목 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = GsStockService.get_price_page(start_date, end_date, page_args.get('after'),
+                                                       page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': 'GS 종목 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = GsStockService.get_price_series(start_date, end_date, deadline, from_history=True)
+                return series_response(series.columns, mimetype, '날짜 범위 GS 종목 시세를 성공적으로 조회했습니다.')
+            
             # 날짜 범위 GS 종목 정보 조회
-            stock_info = GsStockService.get_date_range_prices(start_date, end_date)
+            stock_info = GsStockService.get_date_range_prices(start_date, end_date, deadline)
             
             logger.info(f"GS 종목 날짜 범위 조회 완료 - {start_date} ~ {end_date}")
             
@@ -168,16 +269,65 @@ class GsStockRangeResource(Resource):
             }, 500
 
 
+@gs_api.route('/stock/history')
+class GsStockHistoryResource(Resource):
+    @gs_api.expect(sync_parser)
+    @fast_marshal_with(gs_api, gs_stock_model)
+    @gs_api.doc('get_gs_price_history')
+    @gs_api.doc(description='since 또는 동기화 토큰 이후에 추가되거나 바뀐 GS 종목 일별 시세만 조회합니다.')
+    def get(self):
+        """GS 종목 일별 시세 변경분 조회
+        
+        파라미터:
+        - since: 마지막으로 받은 날짜 (YYYY-MM-DD 형식)
+        - token: 이전 응답의 token (since 보다 우선, 같은 날짜의 수정된 시세도 포함)
+        """
+        try:
+            deadline = request_deadline()
+            args = sync_parser.parse_args()
+            
+            result = GsStockService.get_price_changes(args.get('since'), args.get('token'), deadline)
+            
+            logger.info(f"GS 종목 일별 시세 변경분 조회 완료 - {result['count']}건")
+            
+            return {
+                'status': 'success',
+                'data': result,
+                'message': 'GS 종목 일별 시세 변경분을 성공적으로 조회했습니다.',
+                'error_code': None
+            }
+            
+        except CoreException as e:
+            logger.error(f"GS 종목 일별 시세 변경분 조회 중 오류: {e.error_code} - {e.message}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': e.message,
+                'error_code': e.error_code
+            }, 500
+            
+        except Exception as e:
+            logger.error(f"GS 종목 일별 시세 변경분 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
+
+
 @gs_api.route('/stock/realtime')
 class GsStockRealtimeResource(Resource):
-    @gs_api.marshal_with(gs_stock_model)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(gs_api, gs_stock_model)
     @gs_api.doc('get_gs_stock_realtime')
     @gs_api.doc(description='실시간 GS 종목 정보를 조회합니다.')
     def get(self):
         """실시간 GS 종목 정보 조회"""
         try:
+            deadline = request_deadline()
             # 실시간 GS 종목 정보 조회
-            stock_info = GsStockService.get_realtime_price()
+            stock_info = GsStockService.get_realtime_price(deadline)
             
             logger.info("실시간 GS 종목 정보 조회 완료")
             
@@ -208,14 +358,15 @@ class GsStockRealtimeResource(Resource):
 
 @gs_api.route('/health')
 class GsHealthResource(Resource):
-    @gs_api.marshal_with(gs_stock_model)
+    @fast_marshal_with(gs_api, gs_stock_model)
     @gs_api.doc('gs_health_check')
     @gs_api.doc(description='GS API 서비스 상태를 확인합니다.')
     def get(self):
         """GS API 헬스체크"""
         try:
+            deadline = request_deadline()
             # 간단한 실시간 데이터 조회로 서비스 상태 확인
-            GsStockService.get_realtime_price()
+            GsStockService.get_realtime_price(deadline)
             
             return {
                 'status': 'success',
@@ -248,7 +399,7 @@ class GsHealthResource(Resource):
 
 @gs_api.route('/info')
 class GsInfoResource(Resource):
-    @gs_api.marshal_with(gs_stock_model)
+    @fast_marshal_with(gs_api, gs_stock_model)
     @gs_api.doc('get_gs_info')
     @gs_api.doc(description='GS 종목 기본 정보를 조회합니다.')
     def get(self):
@@ -267,6 +418,7 @@ class GsInfoResource(Resource):
                         "specific_date": "/api/gs/stock?date=YYYY-MM-DD",
                         "date_range": "/api/gs/stock/range?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD",
                         "realtime": "/api/gs/stock/realtime",
+                        "history": "/api/gs/stock/history?since=YYYY-MM-DD",
                         "pagination": "/api/gs/stock/pages?page=1",
                         "health": "/api/gs/health"
                     },
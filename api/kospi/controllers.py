@@ -3,7 +3,11 @@ from flask_restx import Resource, fields, reqparse
 
 from api.kospi import kospi_api
 from api.kospi.services import KospiPriceService
+from util.cache_utils import conditional_get
+from util.deadline_utils import request_deadline
 from util.logging_util import logger
+from util.response_utils import (JSON_MIMETYPE, SERIES_MIMETYPES, fast_marshal_with, negotiate_series_format,
+                                  ndjson_response, series_response)
 from exceptions import CoreException
 
 
@@ -68,22 +72,88 @@ date_range_parser.add_argument('end_date',
                               required=True, 
                               help='종료 날짜 (YYYY-MM-DD 형식)',
                               location='args')
+date_range_parser.add_argument('stream', 
+                              type=str, 
+                              required=False, 
+                              choices=('ndjson',),
+                              help='ndjson 이면 일별 시세를 한 줄에 한 건씩 스트리밍 (선택사항)',
+                              location='args')
+
+
+# 커서 페이지네이션 파라미터 파서
+page_parser = reqparse.RequestParser()
+page_parser.add_argument('fields', 
+                         type=str, 
+                         required=False, 
+                         help='일별 시세에 남길 필드 (쉼표 구분, 예: date,closing_price)',
+                         location='args')
+page_parser.add_argument('limit', 
+                         type=int, 
+                         required=False, 
+                         help='페이지당 일별 시세 수 (기본값: 20)',
+                         location='args')
+page_parser.add_argument('after', 
+                         type=str, 
+                         required=False, 
+                         help='이전 응답의 next_cursor (YYYY-MM-DD 형식)',
+                         location='args')
+
+
+# 동기화 파라미터 파서
+sync_parser = reqparse.RequestParser()
+sync_parser.add_argument('since', 
+                         type=str, 
+                         required=False, 
+                         help='마지막으로 받은 날짜 (YYYY-MM-DD 형식, 이 날짜 이후의 시세만 조회)',
+                         location='args')
+sync_parser.add_argument('token', 
+                         type=str, 
+                         required=False, 
+                         help='이전 응답의 동기화 토큰 (since 보다 우선)',
+                         location='args')
 
 
 @kospi_api.route('/price')
 class KospiPriceResource(Resource):
-    @kospi_api.expect(price_parser)
-    @kospi_api.marshal_with(kospi_price_model)
+    @kospi_api.expect(price_parser, page_parser)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(kospi_api, kospi_price_model)
+    @kospi_api.produces(SERIES_MIMETYPES)
     @kospi_api.doc('get_kospi_price')
     @kospi_api.doc(description='KOSPI 가격 정보를 조회합니다.')
     def get(self):
         """KOSPI 가격 정보 조회"""
         try:
+            deadline = request_deadline()
             args = price_parser.parse_args()
             date = args.get('date')
             
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = KospiPriceService.get_price_page_columns(
+                        date, date, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, 'KOSPI 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = KospiPriceService.get_price_page(date, date, page_args.get('after'),
+                                                          page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': 'KOSPI 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = KospiPriceService.get_price_series(date, date, deadline)
+                return series_response(series.columns, mimetype, 'KOSPI 시세를 성공적으로 조회했습니다.')
+            
             # KOSPI 가격 정보 조회
-            price_info = KospiPriceService.get_kospi_price_info(date)
+            price_info = KospiPriceService.get_kospi_price_info(date, deadline)
             
             logger.info(f"KOSPI 가격 정보 조회 완료 - 날짜: {date or '전체'}")
             
@@ -114,19 +184,50 @@ class KospiPriceResource(Resource):
 
 @kospi_api.route('/price/range')
 class KospiPriceRangeResource(Resource):
-    @kospi_api.expect(date_range_parser)
-    @kospi_api.marshal_with(kospi_price_model)
+    @kospi_api.expect(date_range_parser, page_parser)
+    @conditional_get('PRICE_MAX_AGE_SECS')
+    @fast_marshal_with(kospi_api, kospi_price_model)
+    @kospi_api.produces(SERIES_MIMETYPES)
     @kospi_api.doc('get_kospi_price_range')
     @kospi_api.doc(description='날짜 범위의 KOSPI 가격 정보를 조회합니다.')
     def get(self):
         """날짜 범위 KOSPI 가격 정보 조회"""
         try:
+            deadline = request_deadline()
             args = date_range_parser.parse_args()
             start_date = args.get('start_date')
             end_date = args.get('end_date')
             
+            # stream=ndjson 이면 일별 시세 이력을 페이지 단위로 읽으며 한 줄씩 스트리밍
+            if args.get('stream') == 'ndjson':
+                return ndjson_response(KospiPriceService.iter_price_bars(start_date, end_date, deadline))
+            
+            # fields, limit, after 를 지정하면 일별 시세 이력에서 커서 기반 페이지로 응답
+            # 필드 선택과 페이지를 먼저 적용한 뒤 Accept 헤더로 요청한 형식으로 직렬화하므로 모든 형식의 행과 컬럼이 같다
+            mimetype = negotiate_series_format()
+            page_args = page_parser.parse_args()
+            if any(page_args.get(name) is not None for name in ('fields', 'limit', 'after')):
+                if mimetype != JSON_MIMETYPE:
+                    columns, next_cursor = KospiPriceService.get_price_page_columns(
+                        start_date, end_date, page_args.get('after'), page_args.get('limit'), page_args.get('fields'), deadline)
+                    return series_response(columns, mimetype, 'KOSPI 시세 페이지를 성공적으로 조회했습니다.',
+                                           next_cursor=next_cursor)
+                result = KospiPriceService.get_price_page(start_date, end_date, page_args.get('after'),
+                                                          page_args.get('limit'), page_args.get('fields'), deadline)
+                return {
+                    'status': 'success',
+                    'data': result,
+                    'message': 'KOSPI 시세 페이지를 성공적으로 조회했습니다.',
+                    'error_code': None
+                }
+            
+            # Accept 헤더로 컬럼 단위 JSON, CSV, MessagePack 을 요청하면 시계열로 응답
+            if mimetype != JSON_MIMETYPE:
+                series = KospiPriceService.get_price_series(start_date, end_date, deadline, from_history=True)
+                return series_response(series.columns, mimetype, '날짜 범위 KOSPI 시세를 성공적으로 조회했습니다.')
+            
             # 날짜 범위 KOSPI 가격 정보 조회
-            price_info = KospiPriceService.get_date_range_prices(start_date, end_date)
+            price_info = KospiPriceService.get_date_range_prices(start_date, end_date, deadline)
             
             logger.info(f"KOSPI 날짜 범위 조회 완료 - {start_date} ~ {end_date}")
             
@@ -155,16 +256,65 @@ class KospiPriceRangeResource(Resource):
             }, 500
 
 
+@kospi_api.route('/price/history')
+class KospiPriceHistoryResource(Resource):
+    @kospi_api.expect(sync_parser)
+    @fast_marshal_with(kospi_api, kospi_price_model)
+    @kospi_api.doc('get_kospi_price_history')
+    @kospi_api.doc(description='since 또는 동기화 토큰 이후에 추가되거나 바뀐 KOSPI 일별 시세만 조회합니다.')
+    def get(self):
+        """KOSPI 일별 시세 변경분 조회
+        
+        파라미터:
+        - since: 마지막으로 받은 날짜 (YYYY-MM-DD 형식)
+        - token: 이전 응답의 token (since 보다 우선, 같은 날짜의 수정된 시세도 포함)
+        """
+        try:
+            deadline = request_deadline()
+            args = sync_parser.parse_args()
+            
+            result = KospiPriceService.get_price_changes(args.get('since'), args.get('token'), deadline)
+            
+            logger.info(f"KOSPI 일별 시세 변경분 조회 완료 - {result['count']}건")
+            
+            return {
+                'status': 'success',
+                'data': result,
+                'message': 'KOSPI 일별 시세 변경분을 성공적으로 조회했습니다.',
+                'error_code': None
+            }
+            
+        except CoreException as e:
+            logger.error(f"KOSPI 일별 시세 변경분 조회 중 오류: {e.error_code} - {e.message}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': e.message,
+                'error_code': e.error_code
+            }, 500
+            
+        except Exception as e:
+            logger.error(f"KOSPI 일별 시세 변경분 조회 중 예상치 못한 오류: {str(e)}")
+            return {
+                'status': 'error',
+                'data': None,
+                'message': '서버 내부 오류가 발생했습니다.',
+                'error_code': 'INTERNAL_SERVER_ERROR'
+            }, 500
+
+
 @kospi_api.route('/price/realtime')
 class KospiRealtimePriceResource(Resource):
-    @kospi_api.marshal_with(kospi_price_model)
+    @conditional_get('REALTIME_MAX_AGE_SECS')
+    @fast_marshal_with(kospi_api, kospi_price_model)
     @kospi_api.doc('get_kospi_realtime_price')
     @kospi_api.doc(description='실시간 KOSPI 가격 정보를 조회합니다.')
     def get(self):
         """실시간 KOSPI 가격 정보 조회"""
         try:
+            deadline = request_deadline()
             # 실시간 KOSPI 가격 정보 조회
-            price_info = KospiPriceService.get_realtime_price()
+            price_info = KospiPriceService.get_realtime_price(deadline)
             
             logger.info("실시간 KOSPI 가격 정보 조회 완료")
             
@@ -195,14 +345,15 @@ class KospiRealtimePriceResource(Resource):
 
 @kospi_api.route('/health')
 class KospiHealthResource(Resource):
-    @kospi_api.marshal_with(kospi_price_model)
+    @fast_marshal_with(kospi_api, kospi_price_model)
     @kospi_api.doc('kospi_health_check')
     @kospi_api.doc(description='KOSPI API 서비스 상태를 확인합니다.')
     def get(self):
         """KOSPI API 헬스체크"""
         try:
+            deadline = request_deadline()
             # 간단한 실시간 데이터 조회로 서비스 상태 확인
-            KospiPriceService.get_realtime_price()
+            KospiPriceService.get_realtime_price(deadline)
             
             return {
                 'status': 'success',
@@ -2,26 +2,42 @@ import urllib.request
 import urllib.parse
 import re
 import requests
-from typing import Dict, Optional, List
-from bs4 import BeautifulSoup
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import datetime, date
 
+from api.market.models import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, HistoryStore, PriceSeries, rows_to_columns
+from api.market.services import SharedSnapshotService
+from util.checkpoint_utils import register_checkpoint
+from util.deadline_utils import Deadline
+from util.fetch_utils import fetch, fetch_table
+from util.html_utils import TableRow
 from util.logging_util import logger
-from exceptions import CoreException
+from exceptions import CoreException, DeadlineExceededException
 
 
 class KospiPriceService:
     BASE_URL = "https://finance.naver.com/sise/sise_index_day.naver?code=KOSPI"
     REALTIME_URL = "https://polling.finance.naver.com/api/realtime?query=SERVICE_INDEX:KOSPI"
+    # 컬럼 단위 시계열의 컬럼명 -> (일별 시세 행의 키, 타입)
+    SERIES_FIELDS = {
+        'close': ('closing_price', float),
+        'change': ('change_value', float),
+        'change_rate': ('change_rate', float),
+        'direction': ('direction', str),
+        'volume': ('volume', int),
+        'value': ('trading_value', int)
+    }
+    _history: Optional[HistoryStore] = None
     
     @staticmethod
-    def get_kospi_price_info(date: Optional[str] = None) -> Dict:
+    def get_kospi_price_info(date: Optional[str] = None, deadline: Optional[Deadline] = None) -> Dict:
         """
         네이버 금융에서 KOSPI 지수 정보를 조회합니다.
         
         Args:
             date: 조회할 날짜 (YYYY-MM-DD 형식, 선택사항)
                 미입력시 실시간 데이터를 조회합니다.
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
             Dict: KOSPI 지수 정보
@@ -29,82 +45,30 @@ class KospiPriceService:
         try:
             if date:
                 # 특정 날짜 조회
-                return KospiPriceService._get_kospi_price_by_date(date)
+                return KospiPriceService._get_kospi_price_by_date(date, deadline)
             else:
                 # 전체 일별 시세 조회
-                return KospiPriceService._get_all_daily_prices()
+                return KospiPriceService._get_all_daily_prices(deadline)
         except Exception as e:
             logger.error(f"KOSPI 가격 정보 조회 중 오류 발생: {str(e)}")
             raise CoreException("KOSPI_PRICE_FETCH_ERROR", f"KOSPI 가격 정보를 가져올 수 없습니다: {str(e)}")
     
     @staticmethod
-    def _get_all_daily_prices() -> Dict:
+    def _get_all_daily_prices(deadline: Optional[Deadline] = None) -> Dict:
         """
         네이버 금융에서 전체 일별 KOSPI 시세를 크롤링합니다.
         
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
         Returns:
             Dict: 전체 일별 시세 데이터
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            # 일별 시세 데이터 크롤링
-            response = requests.get(KospiPriceService.BASE_URL, headers=headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = 'euc-kr'  # 네이버 금융은 euc-kr 인코딩 사용
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 일별 시세 테이블 찾기
-            daily_prices = []
-            
-            # 테이블에서 데이터 행들을 찾기
-            table = soup.find('table', class_='type_1')
-            if not table:
-                # 클래스가 없는 경우 첫 번째 테이블 찾기
-                table = soup.find('table')
-            
-            if table:
-                # 헤더 행을 제외한 데이터 행들
-                rows = table.find_all('tr')
-                
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 6:  # 날짜, 체결가, 전일비, 등락률, 거래량, 거래대금
-                        try:
-                            date_text = cells[0].get_text(strip=True)
-                            closing_price = cells[1].get_text(strip=True).replace(',', '')
-                            change_text = cells[2].get_text(strip=True)
-                            change_rate = cells[3].get_text(strip=True)
-                            volume = cells[4].get_text(strip=True).replace(',', '')
-                            trading_value = cells[5].get_text(strip=True).replace(',', '')
-                            
-                            # 날짜 형식 확인 (YYYY.MM.DD 형식)
-                            if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
-                                # 전일비에서 숫자만 추출
-                                change_match = re.search(r'[\d,.]+', change_text)
-                                change_value = change_match.group() if change_match else "0"
-                                
-                                # 등락 방향 판단
-                                direction = "상승" if "상승" in change_text or "up" in str(row) else "하락" if "하락" in change_text or "down" in str(row) else "보합"
-                                
-                                daily_prices.append({
-                                    'date': date_text,
-                                    'closing_price': closing_price,
-                                    'change_value': change_value.replace(',', ''),
-                                    'change_rate': change_rate,
-                                    'direction': direction,
-                                    'volume': volume,
-                                    'trading_value': trading_value
-                                })
-                        except (IndexError, ValueError, AttributeError) as e:
-                            logger.warning(f"테이블 행 파싱 중 오류: {str(e)}")
-                            continue
+            daily_prices = KospiPriceService._get_daily_series(deadline).rows
             
             # 현재가 정보는 실시간 API에서 가져오기
-            current_price_info = KospiPriceService._get_current_price()
+            current_price_info = KospiPriceService._get_current_price(deadline)
             
             return {
                 'current_price_info': current_price_info,
@@ -113,6 +77,9 @@ class KospiPriceService:
                 'total_count': len(daily_prices)
             }
             
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
         except requests.RequestException as e:
             logger.error(f"네이버 금융 페이지 요청 중 오류: {str(e)}")
             raise CoreException("NETWORK_ERROR", f"네트워크 오류가 발생했습니다: {str(e)}")
@@ -121,10 +88,196 @@ class KospiPriceService:
             raise CoreException("CRAWLING_ERROR", f"데이터 파싱 중 오류가 발생했습니다: {str(e)}")
     
     @staticmethod
-    def _get_current_price() -> Dict:
+    def _get_daily_series(deadline: Optional[Deadline] = None) -> PriceSeries:
+        """
+        최신 일별 시세 페이지(1페이지)를 컬럼 단위 시계열로 반환합니다.
+        일별 시세 이력을 거쳐 읽으므로 최신 일별 시세 레코드도 함께 갱신됩니다.
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열(rows 에 기존 일별 시세 목록 포함)
+        """
+        return KospiPriceService.get_history().load_page(1, deadline)
+    
+    @staticmethod
+    def get_history() -> HistoryStore:
+        """
+        일별 시세 이력 저장소를 반환합니다.
+        
+        Returns:
+            HistoryStore: 일별 시세 이력
+        """
+        if KospiPriceService._history is None:
+            KospiPriceService._history = HistoryStore('kospi', KospiPriceService._get_daily_series_page)
+        return KospiPriceService._history
+    
+    @staticmethod
+    def _export_checkpoint() -> Optional[Dict]:
+        """
+        체크포인트에 저장할 상태(일별 시세 이력)를 반환합니다.
+        
+        Returns:
+            Optional[Dict]: 저장할 상태(읽은 데이터가 없으면 None)
+        """
+        history = KospiPriceService.get_history().export_state()
+        return {'history': history} if history is not None else None
+    
+    @staticmethod
+    def _restore_checkpoint(state: Dict):
+        """
+        체크포인트의 상태로 일별 시세 이력을 채웁니다(이미 조회한 값은 그대로 둡니다).
+        
+        Args:
+            state: _export_checkpoint 로 저장한 상태
+        """
+        KospiPriceService.get_history().restore_state(state['history'])
+    
+    @staticmethod
+    def _get_daily_series_page(page: int, deadline: Optional[Deadline] = None) -> PriceSeries:
+        """
+        일별 시세 페이지를 컬럼 단위 시계열로 반환합니다.
+        1페이지는 공유 스냅샷이 있으면 스냅샷의 것을 사용하고, 없으면 네이버 금융을 직접 조회합니다.
+        
+        Args:
+            page: 페이지 번호 (1페이지가 최신)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열(rows 에 기존 일별 시세 목록 포함)
+        """
+        if page == 1:
+            snapshot = SharedSnapshotService.get_snapshot('kospi', deadline)
+            if snapshot is not None:
+                return snapshot['daily']
+        return KospiPriceService._fetch_daily_series_page(page, deadline)
+    
+    @staticmethod
+    def _get_current_price(deadline: Optional[Deadline] = None) -> Dict:
+        """
+        현재가 정보를 가져옵니다.
+        공유 스냅샷이 있으면 스냅샷의 현재가를 사용하고, 없으면 실시간 API를 직접 조회합니다.
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 현재가 정보
+        """
+        snapshot = SharedSnapshotService.get_snapshot('kospi', deadline)
+        if snapshot is None:
+            return KospiPriceService._fetch_current_price(deadline)
+        return dict(snapshot['realtime'])
+    
+    @staticmethod
+    def _build_shared_snapshot(deadline: Optional[Deadline] = None) -> Optional[Dict]:
+        """
+        공유 스냅샷에 쓸 현재가 정보와 일별 시세 1페이지를 네이버 금융에서 직접 조회합니다(선출된 워커만 호출).
+        
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Optional[Dict]: {'realtime': 현재가 정보, 'daily': 일별 시세 1페이지}. 현재가를 가져오지 못하면 None
+        """
+        realtime = KospiPriceService._fetch_current_price(deadline)
+        if realtime['current_price'] == "N/A":
+            return None
+        return {'realtime': realtime, 'daily': KospiPriceService._fetch_daily_series_page(1, deadline)}
+    
+    @staticmethod
+    def _fetch_daily_series_page(page: int, deadline: Optional[Deadline] = None) -> PriceSeries:
+        """
+        일별 시세 페이지를 조회해 컬럼 단위 시계열로 반환합니다.
+        
+        Args:
+            page: 페이지 번호 (1페이지가 최신)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열(rows 에 기존 일별 시세 목록 포함)
+        """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        
+        # 일별 시세 데이터 크롤링 (시세 테이블까지만 스트리밍으로 읽고, 바뀌지 않았으면 이전 파싱 결과 재사용)
+        # 네이버 금융은 euc-kr 인코딩 사용
+        url = f"{KospiPriceService.BASE_URL}&page={page}"
+        return fetch_table(url, KospiPriceService._parse_daily_table, table_class='type_1',
+                           headers=headers, timeout=10, deadline=deadline, encoding='euc-kr')
+    
+    @staticmethod
+    def _parse_daily_table(rows: List[TableRow]) -> PriceSeries:
+        """
+        일별 시세 테이블의 행 목록을 컬럼 단위 시계열로 변환합니다.
+        
+        Args:
+            rows: 일별 시세 테이블의 행 목록
+        
+        Returns:
+            PriceSeries: 일별 시세 시계열
+        """
+        daily_prices = KospiPriceService._parse_daily_prices(rows)
+        return PriceSeries.from_rows('kospi', daily_prices, KospiPriceService.SERIES_FIELDS)
+    
+    @staticmethod
+    def _parse_daily_prices(rows: List[TableRow]) -> List[Dict]:
+        """
+        일별 시세 테이블의 행 목록에서 일별 시세 목록을 추출합니다.
+        
+        Args:
+            rows: 일별 시세 테이블의 행 목록
+        
+        Returns:
+            List[Dict]: 일별 시세 목록
+        """
+        daily_prices = []
+        
+        for row in rows:
+            cells = row.cells
+            if len(cells) >= 6:  # 날짜, 체결가, 전일비, 등락률, 거래량, 거래대금
+                try:
+                    date_text = cells[0]
+                    closing_price = cells[1].replace(',', '')
+                    change_text = cells[2]
+                    change_rate = cells[3]
+                    volume = cells[4].replace(',', '')
+                    trading_value = cells[5].replace(',', '')
+                    
+                    # 날짜 형식 확인 (YYYY.MM.DD 형식)
+                    if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
+                        # 전일비에서 숫자만 추출
+                        change_match = re.search(r'[\d,.]+', change_text)
+                        change_value = change_match.group() if change_match else "0"
+                        
+                        # 등락 방향 판단
+                        direction = "상승" if "상승" in change_text or "up" in row.markup else "하락" if "하락" in change_text or "down" in row.markup else "보합"
+                        
+                        daily_prices.append({
+                            'date': date_text,
+                            'closing_price': closing_price,
+                            'change_value': change_value.replace(',', ''),
+                            'change_rate': change_rate,
+                            'direction': direction,
+                            'volume': volume,
+                            'trading_value': trading_value
+                        })
+                except (IndexError, ValueError, AttributeError) as e:
+                    logger.warning(f"테이블 행 파싱 중 오류: {str(e)}")
+                    continue
+        
+        return daily_prices
+    
+    @staticmethod
+    def _fetch_current_price(deadline: Optional[Deadline] = None) -> Dict:
         """
         실시간 API에서 현재가 정보를 가져옵니다.
         
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
         Returns:
             Dict: 현재가 정보
         """
@@ -133,7 +286,7 @@ class KospiPriceService:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(KospiPriceService.REALTIME_URL, headers=headers, timeout=10)
+            response = fetch(KospiPriceService.REALTIME_URL, headers=headers, timeout=10, deadline=deadline, hedge=True)
             response.raise_for_status()
             
             data = response.json()
@@ -180,12 +333,13 @@ class KospiPriceService:
             }
     
     @staticmethod
-    def _get_kospi_price_by_date(target_date: str) -> Dict:
+    def _get_kospi_price_by_date(target_date: str, deadline: Optional[Deadline] = None) -> Dict:
         """
         특정 날짜의 KOSPI 시세를 조회합니다.
         
         Args:
             target_date: 조회할 날짜 (YYYY-MM-DD 형식)
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
             Dict: 해당 날짜의 KOSPI 시세 정보
@@ -195,7 +349,7 @@ class KospiPriceService:
             datetime.strptime(target_date, '%Y-%m-%d')
             
             # 전체 데이터를 가져온 후 해당 날짜 필터링
-            all_data = KospiPriceService._get_all_daily_prices()
+            all_data = KospiPriceService._get_all_daily_prices(deadline)
             
             # 날짜 형식 변환 (YYYY-MM-DD -> YYYY.MM.DD)
             target_date_formatted = target_date.replace('-', '.')
@@ -226,13 +380,14 @@ class KospiPriceService:
             raise CoreException("DATE_QUERY_ERROR", f"날짜별 조회 중 오류가 발생했습니다: {str(e)}")
     
     @staticmethod
-    def get_date_range_prices(start_date: str, end_date: str) -> Dict:
+    def get_date_range_prices(start_date: str, end_date: str, deadline: Optional[Deadline] = None) -> Dict:
         """
         날짜 범위의 KOSPI 시세를 조회합니다.
         
         Args:
             start_date: 시작 날짜 (YYYY-MM-DD 형식)
             end_date: 종료 날짜 (YYYY-MM-DD 형식)
+            deadline: 요청 데드라인(선택사항)
         
         Returns:
             Dict: 날짜 범위의 KOSPI 시세 정보
@@ -245,18 +400,8 @@ class KospiPriceService:
             if start_dt > end_dt:
                 raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
             
-            # 전체 데이터 가져오기
-            all_data = KospiPriceService._get_all_daily_prices()
-            
-            # 날짜 범위 필터링
-            filtered_prices = []
-            for price_data in all_data['daily_prices']:
-                try:
-                    price_date = datetime.strptime(price_data['date'], '%Y.%m.%d')
-                    if start_dt <= price_date <= end_dt:
-                        filtered_prices.append(price_data)
-                except ValueError:
-                    continue
+            # 일별 시세 이력에서 날짜 범위의 행 조회 (NDJSON, 시계열 응답과 같은 범위)
+            filtered_prices = KospiPriceService.get_history().get_series(start_date, end_date, deadline).rows
             
             return {
                 'start_date': start_date,
@@ -270,20 +415,217 @@ class KospiPriceService:
             raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
         except CoreException:
             raise
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 이력 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
         except Exception as e:
             logger.error(f"날짜 범위 KOSPI 시세 조회 중 오류: {str(e)}")
             raise CoreException("DATE_RANGE_QUERY_ERROR", f"날짜 범위 조회 중 오류가 발생했습니다: {str(e)}")
     
     @staticmethod
-    def get_realtime_price() -> Dict:
+    def get_price_series(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                         deadline: Optional[Deadline] = None, from_history: bool = False) -> PriceSeries:
+        """
+        KOSPI 일별 시세를 컬럼 단위 시계열로 조회합니다.
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 선택사항)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 선택사항)
+            deadline: 요청 데드라인(선택사항)
+            from_history: True 이면 첫 페이지가 아닌 일별 시세 이력에서 조회 (날짜 범위 조회용)
+        
+        Returns:
+            PriceSeries: 날짜 범위의 일별 시세 시계열
+        """
+        try:
+            # 날짜 형식 검증
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+            
+            if start_dt and end_dt and start_dt > end_dt:
+                raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+            
+            if from_history:
+                return KospiPriceService.get_history().get_series(start_date, end_date, deadline)
+            return KospiPriceService._get_daily_series(deadline).between(start_date, end_date)
+            
+        except ValueError:
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        except CoreException:
+            raise
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"KOSPI 시계열 조회 중 오류: {str(e)}")
+            raise CoreException("SERIES_QUERY_ERROR", f"시계열 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    @staticmethod
+    def iter_price_bars(start_date: str, end_date: str, deadline: Optional[Deadline] = None) -> Iterator[Dict]:
+        """
+        날짜 범위의 KOSPI 일별 시세를 일별 시세 이력에서 최신순으로 하나씩 조회합니다.
+        날짜 형식은 호출 시점에 검증하고, 업스트림 페이지는 반환된 이터레이터를 소비할 때 필요한 만큼만 읽습니다.
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Iterator[Dict]: 일별 시세({'date': ..., 'close': ..., ...}) 이터레이터
+        """
+        try:
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        except ValueError:
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        
+        if start_dt > end_dt:
+            raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+        
+        def iter_bars():
+            try:
+                yield from KospiPriceService.get_history().iter_bars(start_date, end_date, deadline)
+            except DeadlineExceededException:
+                logger.error("요청 데드라인 초과로 일별 시세 이력 조회 중단")
+                raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+            except Exception as e:
+                logger.error(f"KOSPI 일별 시세 이력 조회 중 오류: {str(e)}")
+                raise CoreException("HISTORY_QUERY_ERROR", f"일별 시세 이력 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        return iter_bars()
+    
+    @staticmethod
+    def get_price_page(start_date: Optional[str] = None, end_date: Optional[str] = None, after: Optional[str] = None,
+                       limit: Optional[int] = None, fields: Optional[str] = None,
+                       deadline: Optional[Deadline] = None) -> Dict:
+        """
+        KOSPI 일별 시세를 커서 기반 페이지로 조회합니다.
+        날짜 인덱스로 커서 이전의 일별 시세 페이지는 건너뛰고, limit 개를 채울 때까지만 페이지를 읽습니다.
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 선택사항)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 선택사항)
+            after: 이전 응답의 next_cursor (YYYY-MM-DD 형식, 선택사항)
+            limit: 최대 일별 시세 수 (미입력시 DEFAULT_PAGE_LIMIT)
+            fields: 일별 시세에 남길 필드 목록 (쉼표 구분, 선택사항)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 일별 시세 목록과 다음 페이지 커서(next_cursor, 마지막 페이지이면 None)
+        """
+        try:
+            # 날짜 형식 검증
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+            if after:
+                datetime.strptime(after, '%Y-%m-%d')
+        except ValueError:
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        
+        if start_dt and end_dt and start_dt > end_dt:
+            raise CoreException("INVALID_DATE_RANGE", "시작 날짜가 종료 날짜보다 늦을 수 없습니다.")
+        
+        if limit is None:
+            limit = DEFAULT_PAGE_LIMIT
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise CoreException("INVALID_LIMIT", f"limit 은 1 이상 {MAX_PAGE_LIMIT} 이하로 입력해주세요.")
+        
+        selected_fields = None
+        if fields:
+            row_fields = ['date'] + [key for key, _ in KospiPriceService.SERIES_FIELDS.values()]
+            selected_fields = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown_fields = [field for field in selected_fields if field not in row_fields]
+            if not selected_fields or unknown_fields:
+                raise CoreException("INVALID_FIELDS",
+                                    f"지원하지 않는 필드입니다: {', '.join(unknown_fields)} (사용 가능: {', '.join(row_fields)})")
+        
+        try:
+            result = KospiPriceService.get_history().get_page(limit, start_date, end_date, after or None,
+                                                              selected_fields, deadline)
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 페이지 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"KOSPI 일별 시세 페이지 조회 중 오류: {str(e)}")
+            raise CoreException("PAGE_QUERY_ERROR", f"일별 시세 페이지 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        result['last_updated'] = datetime.now().isoformat()
+        return result
+    
+    @staticmethod
+    def get_price_page_columns(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                               after: Optional[str] = None, limit: Optional[int] = None, fields: Optional[str] = None,
+                               deadline: Optional[Deadline] = None) -> Tuple[Dict[str, list], Optional[str]]:
+        """
+        get_price_page 와 같은 일별 시세 페이지를 컬럼 단위로 조회합니다 (Accept 로 시계열 형식을 요청한 경우).
+        컬럼명과 순서는 JSON 응답의 일별 시세 필드와 같고, 날짜는 YYYY-MM-DD, 시세는 숫자로 변환합니다.
+        
+        Args:
+            get_price_page 와 같음
+        
+        Returns:
+            Tuple: (필드명 -> 값 리스트, 다음 페이지 커서 또는 None)
+        """
+        result = KospiPriceService.get_price_page(start_date, end_date, after, limit, fields, deadline)
+        if fields:
+            names = [field.strip() for field in fields.split(',') if field.strip()]
+        else:
+            names = ['date'] + [key for key, _ in KospiPriceService.SERIES_FIELDS.values()]
+        return rows_to_columns(result['daily_prices'], names, KospiPriceService.SERIES_FIELDS), result['next_cursor']
+    
+    @staticmethod
+    def get_price_changes(since: Optional[str] = None, token: Optional[str] = None,
+                          deadline: Optional[Deadline] = None) -> Dict:
+        """
+        since 이후에 추가된 KOSPI 일별 시세, 또는 동기화 토큰 이후에 추가되거나 바뀐 일별 시세만 조회합니다.
+        
+        Args:
+            since: 마지막으로 받은 날짜 (YYYY-MM-DD 형식, 선택사항)
+            token: 이전 응답의 동기화 토큰 (선택사항, since 보다 우선)
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Dict: 추가/변경된 일별 시세 목록과 다음 동기화 토큰
+        """
+        if not since and not token:
+            raise CoreException("SYNC_POINT_REQUIRED", "since 또는 token 을 입력해주세요.")
+        
+        try:
+            if token:
+                HistoryStore.parse_sync_token(token)
+            else:
+                datetime.strptime(since, '%Y-%m-%d')
+        except ValueError:
+            if token:
+                raise CoreException("INVALID_SYNC_TOKEN", "동기화 토큰이 올바르지 않습니다.")
+            raise CoreException("INVALID_DATE_FORMAT", "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        
+        try:
+            result = KospiPriceService.get_history().get_changes(since, token, deadline)
+        except DeadlineExceededException:
+            logger.error("요청 데드라인 초과로 일별 시세 변경분 조회 중단")
+            raise CoreException("DEADLINE_EXCEEDED", "요청 처리 시간이 초과되었습니다.")
+        except Exception as e:
+            logger.error(f"KOSPI 일별 시세 변경분 조회 중 오류: {str(e)}")
+            raise CoreException("SYNC_QUERY_ERROR", f"일별 시세 변경분 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        result['last_updated'] = datetime.now().isoformat()
+        return result
+    
+    @staticmethod
+    def get_realtime_price(deadline: Optional[Deadline] = None) -> Dict:
         """
         실시간 KOSPI 가격 정보만 조회합니다.
         
+        Args:
+            deadline: 요청 데드라인(선택사항)
+        
         Returns:
             Dict: 실시간 KOSPI 가격 정보
         """
         try:
-            current_price_info = KospiPriceService._get_current_price()
+            current_price_info = KospiPriceService._get_current_price(deadline)
             return {
                 'realtime_data': current_price_info,
                 'last_updated': datetime.now().isoformat()
@@ -291,3 +633,7 @@ class KospiPriceService:
         except Exception as e:
             logger.error(f"실시간 KOSPI 가격 조회 중 오류: {str(e)}")
             raise CoreException("REALTIME_FETCH_ERROR", f"실시간 가격 정보를 가져올 수 없습니다: {str(e)}")
+
+
+register_checkpoint('kospi', KospiPriceService._export_checkpoint, KospiPriceService._restore_checkpoint)
+SharedSnapshotService.register('kospi', KospiPriceService._build_shared_snapshot)
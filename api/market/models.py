@@ -0,0 +1,402 @@
+import bisect
+import hashlib
+import itertools
+import re
+import secrets
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from util.history_file_utils import HistoryFile, append_history_file, write_history_file
+
+# 커서 페이지네이션의 기본/최대 일별 시세 수
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 500
+
+
+def to_iso_date(date_text: str) -> str:
+    """
+    'YYYY.MM.DD' 형식의 날짜를 'YYYY-MM-DD' 형식으로 변환한다.
+    """
+    return date_text.replace('.', '-')
+
+
+def to_number(value: str, number_type: Callable = float):
+    """
+    '3,412.50' 형식의 문자열을 number_type 으로 변환한다. 숫자가 없으면 None 을 반환한다.
+    """
+    match = re.search(r'-?[\d,]*\d(?:\.\d+)?', value or '')
+    if not match:
+        return None
+    number = float(match.group().replace(',', ''))
+    return number_type(number)
+
+
+def rows_to_columns(rows: List[Dict], names: List[str], fields: Dict[str, Tuple[str, Callable]]) -> Dict[str, list]:
+    """
+    일별 시세 행 목록을 행의 키 이름 그대로 컬럼으로 변환한다(커서 페이지를 시계열 형식으로 응답할 때 사용).
+    'date' 는 YYYY-MM-DD 로, fields 에 있는 키는 그 타입으로 변환하므로 PriceSeries 의 컬럼과 값 형식이 같다.
+    :param rows: 일별 시세 행 목록
+    :param names: 컬럼으로 만들 행의 키 목록(순서 유지)
+    :param fields: 컬럼명 -> (행의 키, 타입(float, int, str)) 매핑
+    :return: 행의 키 -> 값 리스트
+    """
+    value_types = {key: value_type for key, value_type in fields.values()}
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        if name == 'date':
+            columns[name] = [to_iso_date(value) if value else value for value in values]
+        elif value_types.get(name, str) is not str:
+            columns[name] = [to_number(value, value_types[name]) for value in values]
+        else:
+            columns[name] = values
+    return columns
+
+
+class PriceSeries:
+    """
+    종목의 일별 시세를 컬럼 단위로 담는 시계열.
+    columns 는 'date'(YYYY-MM-DD) 컬럼과 시세 컬럼(close, open, high, low, volume 등)을 같은 길이의 리스트로 가진다.
+    rows 는 기존 JSON 응답에서 사용하는 행(dict) 목록으로, 업스트림 페이지를 파싱할 때 한 번만 만든다.
+    날짜는 업스트림과 같이 최신순(내림차순)으로 정렬되어 있다.
+    """
+    __slots__ = ('instrument', 'columns', 'rows')
+
+    def __init__(self, instrument: str, columns: Dict[str, list], rows: Optional[List[Dict]] = None):
+        self.instrument = instrument
+        self.columns = columns
+        self.rows = rows if rows is not None else []
+
+    def __len__(self):
+        return len(self.columns.get('date', []))
+
+    @property
+    def dates(self) -> List[str]:
+        return self.columns['date']
+
+    @classmethod
+    def from_rows(cls, instrument: str, rows: List[Dict], fields: Dict[str, Tuple[str, Callable]]) -> 'PriceSeries':
+        """
+        파싱된 행 목록에서 컬럼을 만든다.
+        :param instrument: 종목 구분(gold, kospi, gs)
+        :param rows: 'date'(YYYY.MM.DD) 키를 가진 일별 시세 행 목록
+        :param fields: 컬럼명 -> (행의 키, 타입(float, int, str)) 매핑
+        :return: PriceSeries
+        """
+        columns = {'date': [to_iso_date(row['date']) for row in rows]}
+        for column, (key, value_type) in fields.items():
+            if value_type is str:
+                columns[column] = [row.get(key) for row in rows]
+            else:
+                columns[column] = [to_number(row.get(key), value_type) for row in rows]
+        return cls(instrument, columns, rows)
+
+    def bars(self) -> Iterator[Dict]:
+        """
+        컬럼 값을 하루 단위의 dict({'date': ..., 'close': ..., ...})로 하나씩 반환한다.
+        """
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def _index_range(self, start_date: Optional[str], end_date: Optional[str]) -> Tuple[int, int]:
+        # 날짜가 내림차순이므로 부호를 바꾼 키로 이진 탐색한다.
+        dates = self.dates
+        key = _descending_key
+        lo = 0 if end_date is None else bisect.bisect_left(dates, key(end_date), key=key)
+        hi = len(dates) if start_date is None else bisect.bisect_right(dates, key(start_date), key=key)
+        return lo, max(lo, hi)
+
+    def between(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> 'PriceSeries':
+        """
+        start_date ~ end_date(YYYY-MM-DD, 양 끝 포함) 범위의 시계열을 반환한다.
+        """
+        lo, hi = self._index_range(start_date, end_date)
+        if lo == 0 and hi == len(self):
+            return self
+        return self._slice(lo, hi)
+
+    def older_than(self, date_text: str) -> 'PriceSeries':
+        """
+        date_text(YYYY-MM-DD)보다 과거(미포함)의 시계열을 반환한다.
+        """
+        lo = bisect.bisect_right(self.dates, _descending_key(date_text), key=_descending_key)
+        return self if lo == 0 else self._slice(lo, len(self))
+
+    def _slice(self, lo: int, hi: int) -> 'PriceSeries':
+        columns = {name: values[lo:hi] for name, values in self.columns.items()}
+        return PriceSeries(self.instrument, columns, self.rows[lo:hi])
+
+
+def _descending_key(date_text: str) -> Tuple[int, ...]:
+    return tuple(-int(part) for part in date_text.split('-'))
+
+
+def _bar_digest(bar: Dict) -> bytes:
+    # 변경 이력은 체크포인트로 다른 프로세스에 넘어가므로, 프로세스마다 달라지는 hash() 대신 내용 해시를 사용한다.
+    return hashlib.blake2b(repr(tuple(bar.items())).encode('utf-8'), digest_size=8).digest()
+
+
+class HistoryStore:
+    """
+    종목의 일별 시세 이력.
+    업스트림 일별 시세 페이지(1페이지가 최신)를 필요한 만큼만 차례로 읽어 과거 방향으로 시세를 제공한다.
+    페이지의 파싱 결과는 fetch_table 의 업스트림 캐시에 보관되므로 이력 전체를 메모리에 올리지 않는다.
+    읽은 페이지마다 (최신 날짜, 가장 과거 날짜)를 날짜 인덱스로 남겨 두고, 커서(before) 이전의 페이지는 건너뛴다.
+    새 거래일이 추가되면 각 페이지의 내용은 최신 쪽으로만 밀리므로, 인덱스가 오래되어도 건너뛴 페이지에
+    커서 이전의 시세가 들어 있지는 않다.
+    읽은 시세는 날짜별 해시로 변경 이력(시퀀스)에 기록해, 동기화 토큰 이후에 추가되거나 바뀐 시세만 돌려줄 수 있다.
+    변경 이력은 프로세스 메모리에 있으므로 토큰에 epoch 를 넣어, 다른 프로세스의 토큰은 날짜 기준으로 처리한다.
+    1페이지를 읽을 때마다 최신 일별 시세 레코드(latest)를 갱신해, 최신 시세 조회는 페이지를 다시 읽지 않고 레코드를 반환한다.
+    """
+
+    def __init__(self, instrument: str, page_loader: Callable, max_pages: int = 500):
+        """
+        :param instrument: 종목 구분(gold, kospi, gs)
+        :param page_loader: (페이지 번호, 데드라인)을 받아 해당 페이지의 PriceSeries 를 반환하는 함수
+        :param max_pages: 한 번의 조회에서 읽을 최대 페이지 수
+        """
+        self.instrument = instrument
+        self.page_loader = page_loader
+        self.max_pages = max_pages
+        # 1페이지부터 연속된 페이지의 가장 과거 날짜(내림차순)
+        self._page_oldest_dates: List[str] = []
+        # 변경 이력: 날짜 -> (시퀀스, 해시, 추가/변경된 시세). 처음 읽은 과거 시세는 시퀀스 0 으로 기록한다.
+        self.epoch = secrets.token_hex(4)
+        self._sequence = 0
+        self._newest_date: Optional[str] = None
+        self._revisions: Dict[str, Tuple[int, bytes, Optional[Dict]]] = {}
+        self._lock = threading.Lock()
+        # 최신 일별 시세 레코드: (행, 시세, 1페이지를 확인한 시각)
+        self.latest: Optional[Tuple[Dict, Dict, float]] = None
+
+    def _first_page_before(self, date_text: Optional[str]) -> int:
+        # 날짜 인덱스에서 date_text 보다 과거의 시세가 처음 나오는 페이지를 찾는다.
+        indexed = self._page_oldest_dates
+        if date_text is None or not indexed:
+            return 1
+        position = bisect.bisect_right(indexed, _descending_key(date_text), key=_descending_key)
+        return min(position, len(indexed) - 1) + 1
+
+    def _index_page(self, page: int, series: PriceSeries):
+        indexed = self._page_oldest_dates
+        if page <= len(indexed):
+            indexed[page - 1] = series.dates[-1]
+        elif page == len(indexed) + 1:
+            indexed.append(series.dates[-1])
+
+    def iter_pages(self, deadline=None, before: Optional[str] = None) -> Iterator[Tuple[int, PriceSeries]]:
+        """
+        차례로 (페이지 번호, PriceSeries)를 반환한다. before(YYYY-MM-DD)가 있으면 날짜 인덱스로 그 이전 페이지를 건너뛴다.
+        마지막 페이지를 넘기면 업스트림이 마지막 페이지를 다시 보여주므로, 날짜가 더 과거로 진행하지 않으면 멈춘다.
+        """
+        oldest_date = None
+        for page in range(self._first_page_before(before), self.max_pages + 1):
+            series = self.page_loader(page, deadline)
+            if not len(series) or (oldest_date is not None and series.dates[-1] >= oldest_date):
+                return
+            oldest_date = series.dates[-1]
+            self._ingest(page, series)
+            yield page, series
+
+    def load_page(self, page: int, deadline=None) -> PriceSeries:
+        """
+        페이지 하나를 읽어 날짜 인덱스, 변경 이력, 최신 일별 시세 레코드에 반영한 뒤 반환한다.
+        """
+        series = self.page_loader(page, deadline)
+        if len(series):
+            self._ingest(page, series)
+        return series
+
+    def get_latest(self, max_age_secs: float, deadline=None) -> Optional[Tuple[Dict, Dict, float]]:
+        """
+        최신 일별 시세 레코드를 반환한다. 레코드가 없거나 max_age_secs 보다 오래되었을 때만 1페이지를 다시 읽는다.
+        :return: (행, 시세, 1페이지를 확인한 시각), 데이터가 없으면 None
+        """
+        latest = self.latest
+        if latest is None or time.time() - latest[2] > max_age_secs:
+            self.load_page(1, deadline)
+            latest = self.latest
+        return latest
+
+    def export_state(self) -> Optional[Dict]:
+        """
+        체크포인트에 저장할 상태(날짜 인덱스, 변경 이력, 최신 일별 시세 레코드). 읽은 데이터가 없으면 None.
+        epoch 를 함께 저장하므로 복원한 프로세스에서도 이전에 발급한 동기화 토큰을 변경 이력으로 처리한다.
+        """
+        with self._lock:
+            if self.latest is None and not self._revisions:
+                return None
+            return {
+                'page_oldest_dates': list(self._page_oldest_dates),
+                'epoch': self.epoch,
+                'sequence': self._sequence,
+                'newest_date': self._newest_date,
+                'revisions': dict(self._revisions),
+                'latest': self.latest
+            }
+
+    def restore_state(self, state: Dict):
+        """
+        export_state 로 저장한 상태를 채운다. 이미 읽은 데이터가 있으면 더 최신이므로 그대로 둔다.
+        """
+        with self._lock:
+            if self.latest is not None or self._revisions:
+                return
+            self._page_oldest_dates = list(state['page_oldest_dates'])
+            self.epoch = state['epoch']
+            self._sequence = state['sequence']
+            self._newest_date = state['newest_date']
+            self._revisions = dict(state['revisions'])
+            self.latest = state['latest']
+
+    def _ingest(self, page: int, series: PriceSeries):
+        self._index_page(page, series)
+        self._record_revisions(series)
+        if page == 1:
+            self.latest = (series.rows[0], next(series.bars()), time.time())
+
+    def _record_revisions(self, series: PriceSeries):
+        with self._lock:
+            baseline = self._newest_date is None
+            for bar in series.bars():
+                date_text = bar['date']
+                digest = _bar_digest(bar)
+                known = self._revisions.get(date_text)
+                if known is not None and known[1] == digest:
+                    continue
+                if known is None and (baseline or date_text < self._newest_date):
+                    self._revisions[date_text] = (0, digest, None)
+                else:
+                    self._sequence += 1
+                    self._revisions[date_text] = (self._sequence, digest, bar)
+            if self._newest_date is None or series.dates[0] > self._newest_date:
+                self._newest_date = series.dates[0]
+
+    def _sync_token(self) -> str:
+        return f'{self.epoch}.{self._sequence}.{self._newest_date or ""}'
+
+    @staticmethod
+    def parse_sync_token(token: str) -> Tuple[str, int, str]:
+        """
+        동기화 토큰을 (epoch, 시퀀스, 마지막 날짜)로 나눈다. 형식이 올바르지 않으면 ValueError 를 던진다.
+        """
+        epoch, sequence, last_date = token.split('.', 2)
+        if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', last_date):
+            raise ValueError(f'invalid sync token: {token}')
+        return epoch, int(sequence), last_date
+
+    def get_changes(self, since: Optional[str] = None, token: Optional[str] = None, deadline=None) -> Dict:
+        """
+        since(YYYY-MM-DD) 이후에 추가된 시세, 또는 동기화 토큰 이후에 추가되거나 바뀐 시세를 최신순으로 조회한다.
+        마지막 날짜가 들어 있는 페이지까지만 다시 읽어 변경 이력을 갱신한다.
+        다른 프로세스(epoch)의 토큰이면 토큰의 마지막 날짜를 포함해 그 이후의 시세를 모두 돌려준다.
+        :param since: 이 날짜(미포함) 이후의 시세를 조회
+        :param token: 이전 응답의 token(since 보다 우선)
+        :param deadline: 요청 데드라인
+        :return: {'bars': [...], 'count': n, 'token': 다음 동기화 토큰}
+        """
+        epoch, sequence, last_date = self.parse_sync_token(token) if token else (None, 0, since)
+        from_log = epoch == self.epoch
+        bars = []
+        for _, series in self.iter_pages(deadline):
+            if not from_log:
+                selected = series.between(last_date, None)
+                bars.extend(bar for bar in selected.bars() if token or bar['date'] != since)
+            if series.dates[-1] <= last_date:
+                break
+
+        with self._lock:
+            if from_log:
+                changed = [bar for revision, _, bar in self._revisions.values() if revision > sequence]
+                bars = sorted(changed, key=lambda bar: bar['date'], reverse=True)
+            next_token = self._sync_token()
+        return {
+            'bars': bars,
+            'count': len(bars),
+            'token': next_token
+        }
+
+    def _iter_series(self, start_date: Optional[str], end_date: Optional[str], before: Optional[str],
+                     deadline) -> Iterator[PriceSeries]:
+        for _, series in self.iter_pages(deadline, before):
+            selected = series.between(start_date, end_date)
+            yield selected.older_than(before) if before is not None else selected
+            if start_date is not None and series.dates[-1] <= start_date:
+                return
+
+    def iter_bars(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                  deadline=None, before: Optional[str] = None) -> Iterator[Dict]:
+        """
+        end_date 부터 start_date 까지(YYYY-MM-DD, 양 끝 포함) 최신순으로 하루 단위 시세를 하나씩 반환한다.
+        start_date 보다 과거 페이지는 읽지 않는다. before 가 있으면 그보다 과거(미포함)의 시세만 반환한다.
+        """
+        for series in self._iter_series(start_date, end_date, before, deadline):
+            yield from series.bars()
+
+    def get_series(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                   deadline=None) -> PriceSeries:
+        """
+        iter_bars 와 같은 범위의 일별 시세를 읽은 페이지를 이어 붙인 하나의 시계열(최신순)로 반환한다.
+        """
+        columns, rows = {}, []
+        for series in self._iter_series(start_date, end_date, None, deadline):
+            for name, values in series.columns.items():
+                columns.setdefault(name, []).extend(values)
+            rows.extend(series.rows)
+        return PriceSeries(self.instrument, columns, rows)
+
+    def iter_rows(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                  deadline=None, before: Optional[str] = None) -> Iterator[Dict]:
+        """
+        iter_bars 와 같은 범위의 일별 시세를 기존 JSON 응답의 행(dict) 형태로 하나씩 반환한다.
+        """
+        for series in self._iter_series(start_date, end_date, before, deadline):
+            yield from series.rows
+
+    def sync_history_file(self, path: str, deadline=None) -> int:
+        """
+        일별 시세 이력을 바이너리 이력 파일(util.history_file_utils)에 반영한다.
+        파일이 없거나 형식이 다르면 읽을 수 있는 페이지 전체로 새로 만들고, 있으면 마지막 날짜 이후의 시세만 덧붙인다.
+        :param path: 이력 파일 경로
+        :param deadline: 요청 데드라인
+        :return: 파일에 새로 쓴 레코드 수
+        """
+        try:
+            last_date = HistoryFile(path).last_date()
+        except (FileNotFoundError, ValueError):
+            last_date = None
+
+        if last_date is None:
+            bars = list(self.iter_bars(deadline=deadline))
+            bars.reverse()
+            write_history_file(path, self.instrument, bars)
+            return len(bars)
+
+        bars = [bar for bar in self.iter_bars(start_date=last_date, deadline=deadline) if bar['date'] > last_date]
+        bars.reverse()
+        return append_history_file(path, bars)
+
+    def get_page(self, limit: int, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 after: Optional[str] = None, fields: Optional[Iterable[str]] = None, deadline=None) -> Dict:
+        """
+        커서 기반으로 일별 시세 행을 최신순으로 limit 개까지 조회한다. 필요한 페이지만 읽고 전체 목록은 만들지 않는다.
+        :param limit: 최대 행 수
+        :param start_date: 시작 날짜(YYYY-MM-DD, 포함)
+        :param end_date: 종료 날짜(YYYY-MM-DD, 포함)
+        :param after: 이전 응답의 next_cursor(YYYY-MM-DD). 이 날짜보다 과거의 행부터 조회한다.
+        :param fields: 행에 남길 키 목록(없으면 전체)
+        :param deadline: 요청 데드라인
+        :return: {'daily_prices': [...], 'count': n, 'next_cursor': 다음 페이지 커서 또는 None}
+        """
+        rows = list(itertools.islice(self.iter_rows(start_date, end_date, deadline, after), limit + 1))
+        next_cursor = to_iso_date(rows[limit - 1]['date']) if len(rows) > limit else None
+        rows = rows[:limit]
+        if fields is not None:
+            rows = [{field: row.get(field) for field in fields} for row in rows]
+        return {
+            'daily_prices': rows,
+            'count': len(rows),
+            'next_cursor': next_cursor
+        }
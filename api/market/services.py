@@ -0,0 +1,304 @@
+import hashlib
+import json
+import threading
+import time
+import uuid
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+from api.market.models import PriceSeries
+from util import s3_utils
+from util.cache_utils import record_data_version
+from util.deadline_utils import Deadline
+from util.logging_util import logger
+from util.response_utils import dumps
+from util.shared_memory_utils import SharedMemoryRegion, SlotValue
+
+
+class SharedSnapshotService:
+    """
+    종목별 시세 스냅샷(실시간 시세 + 일별 시세 1페이지)을 S3 에 두고 모든 워커가 공유하는 2단계 캐시.
+    워커는 업스트림보다 S3 스냅샷을 먼저 읽고, 스냅샷이 오래되었을 때 갱신 구간마다 S3 조건부 쓰기로
+    선출된 워커 하나만 업스트림을 조회해 스냅샷을 다시 씁니다. 그래서 업스트림 호출 수는 워커 수와 관계없이 일정합니다.
+    같은 호스트의 워커끼리는 그 앞에 공유 메모리 단계를 둘 수 있습니다. 파일 잠금으로 선출된 워커 하나가 주기적으로
+    스냅샷(S3 와 같은 zlib 압축 JSON)을 공유 메모리에 쓰고, 나머지 워커는 S3 나 업스트림을 조회하지 않고 공유 메모리를 읽습니다.
+    읽는 워커는 슬롯이 바뀔 때마다 스냅샷을 풀어 자기 프로세스의 객체로 만듭니다(워커마다 복사본을 가집니다).
+    """
+    # 스냅샷 형식 버전. 객체 키에 들어가므로 형식이 바뀌면 이전 버전의 스냅샷은 읽지 않습니다.
+    FORMAT_VERSION = 1
+    KEY_PREFIX = 'market-snapshots'
+    # 워커가 S3 에서 스냅샷을 다시 확인하는 최소 간격(초). 그 사이에는 메모리의 스냅샷을 사용합니다.
+    POLL_INTERVAL_SECS = 2.0
+    # S3 호출에 실패하면 이 시간(초) 동안은 S3 를 건너뛰고 업스트림을 직접 조회합니다.
+    FAILURE_BACKOFF_SECS = 30.0
+
+    _enabled = False
+    _fresh_secs = 10.0
+    _max_stale_secs = 120.0
+    _bucket: Optional[str] = None
+    _worker_id = uuid.uuid4().hex
+    # 종목 구분 -> 스냅샷을 만드는 함수(데드라인 -> {'realtime': Dict, 'daily': PriceSeries} 또는 None)
+    _builders: Dict[str, Callable[[Optional[Deadline]], Optional[Dict]]] = {}
+    # 종목 구분 -> (스냅샷, S3 ETag, S3 에서 확인한 시각)
+    _local: Dict[str, Tuple[Optional[Dict], Optional[str], float]] = {}
+    _locks: Dict[str, threading.Lock] = {}
+    _backoff_until = 0.0
+    # 공유 메모리 단계: 슬롯(종목 구분별), 종목 구분 -> 마지막으로 읽은 슬롯 값(시퀀스가 같으면 다시 decode 하지 않음)
+    _shared_memory: Optional[SharedMemoryRegion] = None
+    _shared_memory_values: Dict[str, SlotValue] = {}
+    _shared_memory_refresher: Optional[threading.Thread] = None
+    # 공유 메모리 갱신 한 번에 허용하는 시간(초)
+    REFRESH_DEADLINE_SECS = 20.0
+
+    @staticmethod
+    def configure(enabled: bool, fresh_secs: float, max_stale_secs: float, bucket: Optional[str] = None):
+        """
+        공유 스냅샷 사용 여부와 유효 시간을 설정합니다(create_app 에서 호출).
+
+        Args:
+            enabled: 사용 여부
+            fresh_secs: 스냅샷을 갱신 없이 사용하는 시간(초)
+            max_stale_secs: 갱신하지 못했을 때 오래된 스냅샷을 대신 사용하는 최대 나이(초)
+            bucket: 버킷명(없으면 s3_utils 의 기본 버킷)
+        """
+        SharedSnapshotService._enabled = enabled
+        SharedSnapshotService._fresh_secs = fresh_secs
+        SharedSnapshotService._max_stale_secs = max_stale_secs
+        SharedSnapshotService._bucket = bucket or s3_utils.get_bucket_name()
+
+    @staticmethod
+    def register(instrument: str, builder: Callable[[Optional[Deadline]], Optional[Dict]]):
+        """
+        종목의 스냅샷을 만드는 함수를 등록합니다. builder 는 업스트림을 직접 조회해야 합니다(스냅샷을 다시 읽으면 안 됩니다).
+
+        Args:
+            instrument: 종목 구분
+            builder: 데드라인을 받아 {'realtime': 실시간 시세, 'daily': 일별 시세 1페이지} 를 반환하는 함수(실패 시 None)
+        """
+        SharedSnapshotService._builders[instrument] = builder
+        SharedSnapshotService._locks[instrument] = threading.Lock()
+
+    @staticmethod
+    def attach_shared_memory(path: str, slot_size: int):
+        """
+        같은 호스트의 워커끼리 스냅샷을 나눠 읽는 공유 메모리 파일을 연결합니다(등록된 종목마다 슬롯 하나, create_app 에서 호출).
+        
+        Args:
+            path: 공유 메모리 파일 경로
+            slot_size: 종목별 슬롯 크기(바이트)
+        """
+        try:
+            SharedSnapshotService._shared_memory = SharedMemoryRegion(path, sorted(SharedSnapshotService._builders),
+                                                                      slot_size)
+        except (OSError, ValueError) as e:
+            logger.warning(f"공유 메모리 연결 실패, 사용하지 않음 - {path}: {str(e)}")
+
+    @staticmethod
+    def start_shared_memory_refresher():
+        """
+        공유 메모리의 쓰기 잠금을 얻으면 스냅샷을 주기적으로 공유 메모리에 쓰는 백그라운드 스레드를 시작합니다(프로세스당 하나).
+        잠금을 얻지 못한 워커는 잠금을 가진 워커가 끝날 때를 대비해 같은 주기로 잠금을 다시 시도합니다.
+        """
+        region = SharedSnapshotService._shared_memory
+        if region is None or SharedSnapshotService._shared_memory_refresher is not None:
+            return
+        
+        def run():
+            while True:
+                try:
+                    if region.try_acquire_writer():
+                        SharedSnapshotService.refresh_shared_memory()
+                except Exception as e:
+                    logger.error(f"공유 메모리 스냅샷 갱신 중 오류: {str(e)}")
+                time.sleep(SharedSnapshotService._shared_memory_interval())
+        
+        SharedSnapshotService._shared_memory_refresher = threading.Thread(target=run, name='shared-memory-refresher',
+                                                                          daemon=True)
+        SharedSnapshotService._shared_memory_refresher.start()
+
+    @staticmethod
+    def refresh_shared_memory():
+        """
+        종목별 스냅샷을 S3 단계(사용하지 않으면 업스트림)에서 가져와 공유 메모리에 씁니다(쓰기 잠금을 가진 워커만 호출).
+        """
+        region = SharedSnapshotService._shared_memory
+        deadline = Deadline(SharedSnapshotService.REFRESH_DEADLINE_SECS)
+        for instrument in SharedSnapshotService._builders:
+            if SharedSnapshotService._enabled:
+                snapshot = SharedSnapshotService._get_from_s3(instrument, deadline)
+            else:
+                snapshot = SharedSnapshotService._build(instrument, deadline)
+            if snapshot is None:
+                continue
+            if not region.write(instrument, SharedSnapshotService._encode(snapshot)):
+                logger.warning(f"공유 메모리 슬롯보다 큰 스냅샷 - {instrument}")
+
+    @staticmethod
+    def get_snapshot(instrument: str, deadline: Optional[Deadline] = None) -> Optional[Dict]:
+        """
+        종목의 공유 스냅샷을 반환합니다.
+        공유 메모리 단계가 있고 쓰는 워커가 주기대로 갱신하고 있으면 공유 메모리의 스냅샷을 사용합니다.
+        아니면 S3 단계에서, 스냅샷이 fresh_secs 보다 오래되었을 때 갱신 구간의 선출을 시도해 선출되면 업스트림을 조회해 새 스냅샷을 씁니다.
+        선출되지 않았거나 갱신에 실패하면 max_stale_secs 안의 스냅샷을 그대로 사용합니다.
+        
+        Args:
+            instrument: 종목 구분
+            deadline: 요청 데드라인(선택사항)
+        
+        Returns:
+            Optional[Dict]: {'realtime', 'daily', 'generated_at', 'version'}. 사용하지 않거나 쓸 수 있는 스냅샷이 없으면 None
+                            (호출하는 쪽에서 업스트림을 직접 조회합니다)
+        """
+        if instrument not in SharedSnapshotService._builders:
+            return None
+        
+        snapshot = SharedSnapshotService._read_shared_memory(instrument)
+        if snapshot is None and SharedSnapshotService._enabled:
+            snapshot = SharedSnapshotService._get_from_s3(instrument, deadline)
+        if snapshot is None:
+            return None
+        record_data_version(f'snapshot:{instrument}', snapshot['version'], snapshot['generated_at'])
+        return snapshot
+
+    @staticmethod
+    def _shared_memory_interval() -> float:
+        # 공유 메모리를 쓰는 주기(초). 스냅샷이 fresh_secs 를 넘기지 않도록 그 절반마다 씁니다.
+        return SharedSnapshotService._fresh_secs / 2
+
+    @staticmethod
+    def _read_shared_memory(instrument: str) -> Optional[Dict]:
+        # 쓰는 워커가 두 주기 안에 쓴 스냅샷만 사용합니다. 쓰는 워커가 없거나 멈췄으면 None 으로 S3/업스트림 조회에 맡깁니다.
+        region = SharedSnapshotService._shared_memory
+        if region is None:
+            return None
+        value = region.read(instrument, lambda view: SharedSnapshotService._decode(instrument, view),
+                            SharedSnapshotService._shared_memory_values.get(instrument))
+        if value is None:
+            return None
+        SharedSnapshotService._shared_memory_values[instrument] = value
+        _, written_at, snapshot = value
+        if (snapshot is None or time.time() - written_at > 2 * SharedSnapshotService._shared_memory_interval()
+                or time.time() - snapshot['generated_at'] > SharedSnapshotService._max_stale_secs):
+            return None
+        return snapshot
+
+    @staticmethod
+    def _get_from_s3(instrument: str, deadline: Optional[Deadline]) -> Optional[Dict]:
+        # S3 단계: 스냅샷을 읽고, 오래되었으면 선출된 워커 하나가 업스트림을 조회해 다시 씁니다.
+        if time.monotonic() < SharedSnapshotService._backoff_until:
+            return None
+        
+        # 같은 워커 안의 동시 요청이 S3/업스트림을 중복 호출하지 않도록 종목별로 한 번에 하나씩 확인합니다.
+        with SharedSnapshotService._locks[instrument]:
+            try:
+                snapshot = SharedSnapshotService._poll(instrument)
+                age = time.time() - snapshot['generated_at'] if snapshot is not None else None
+                if age is None or age > SharedSnapshotService._fresh_secs:
+                    if SharedSnapshotService._try_elect(instrument):
+                        refreshed = SharedSnapshotService._refresh(instrument, deadline)
+                        if refreshed is not None:
+                            snapshot, age = refreshed, 0.0
+                    elif snapshot is None:
+                        # 다른 워커가 처음 스냅샷을 쓰는 중이므로 다음 호출에서 POLL_INTERVAL_SECS 를 기다리지 않고 다시 읽습니다.
+                        SharedSnapshotService._local.pop(instrument, None)
+            except Exception as e:
+                logger.error(f"공유 스냅샷 조회 중 오류, 업스트림 직접 조회로 대체 - {instrument}: {str(e)}")
+                SharedSnapshotService._backoff_until = time.monotonic() + SharedSnapshotService.FAILURE_BACKOFF_SECS
+                return None
+        
+        if age is None or age > SharedSnapshotService._max_stale_secs:
+            return None
+        return snapshot
+
+    @staticmethod
+    def _key(instrument: str, name: str) -> str:
+        return f"{SharedSnapshotService.KEY_PREFIX}/v{SharedSnapshotService.FORMAT_VERSION}/{instrument}/{name}"
+
+    @staticmethod
+    def _poll(instrument: str) -> Optional[Dict]:
+        # 메모리의 스냅샷이 POLL_INTERVAL_SECS 안에 확인한 것이면 그대로, 아니면 S3 를 ETag 조건부로 다시 읽습니다.
+        snapshot, etag, polled_at = SharedSnapshotService._local.get(instrument, (None, None, 0.0))
+        if polled_at and time.monotonic() - polled_at < SharedSnapshotService.POLL_INTERVAL_SECS:
+            return snapshot
+
+        result = s3_utils.get_object_contents(SharedSnapshotService._key(instrument, 'snapshot'),
+                                              bucket_name=SharedSnapshotService._bucket, etag=etag)
+        if result is None:
+            snapshot, etag = None, None
+        elif not result['not_modified']:
+            snapshot, etag = SharedSnapshotService._decode(instrument, result['body']), result['etag']
+        SharedSnapshotService._local[instrument] = (snapshot, etag, time.monotonic())
+        return snapshot
+
+    @staticmethod
+    def _try_elect(instrument: str) -> bool:
+        # 종목마다 선출 객체(refresher) 하나에 갱신 구간(fresh_secs 단위) 번호를 적고, 구간마다 조건부 쓰기에 처음 성공한 워커 하나만 갱신합니다.
+        # 객체가 없으면 If-None-Match: *, 있으면 읽은 ETag 로 If-Match 를 걸어 덮어쓰므로 요청이 끊겼다 다시 와도 선출 객체는 하나만 남습니다.
+        slot = int(time.time() // SharedSnapshotService._fresh_secs)
+        key = SharedSnapshotService._key(instrument, 'refresher')
+        owner = json.dumps({'worker': SharedSnapshotService._worker_id, 'slot': slot, 'elected_at': time.time()})
+        current = s3_utils.get_object_contents(key, bucket_name=SharedSnapshotService._bucket)
+        if current is None:
+            etag = s3_utils.put_object_contents(owner.encode('utf-8'), key,
+                                                bucket_name=SharedSnapshotService._bucket, if_none_match='*')
+        else:
+            try:
+                elected_slot = json.loads(current['body'])['slot']
+            except (ValueError, KeyError, TypeError):
+                elected_slot = None
+            if isinstance(elected_slot, int) and elected_slot >= slot:
+                return False
+            etag = s3_utils.put_object_contents(owner.encode('utf-8'), key,
+                                                bucket_name=SharedSnapshotService._bucket, if_match=current['etag'])
+        return etag is not None
+
+    @staticmethod
+    def _build(instrument: str, deadline: Optional[Deadline]) -> Optional[Dict]:
+        # 업스트림을 조회해 스냅샷을 만듭니다. 업스트림 오류는 S3 오류와 달리 백오프하지 않습니다.
+        try:
+            built = SharedSnapshotService._builders[instrument](deadline)
+        except Exception as e:
+            logger.error(f"공유 스냅샷 생성 중 업스트림 오류 - {instrument}: {str(e)}")
+            return None
+        if built is None:
+            return None
+        
+        snapshot = {'realtime': built['realtime'], 'daily': built['daily'], 'generated_at': time.time()}
+        snapshot['version'] = hashlib.blake2b(SharedSnapshotService._encode(snapshot), digest_size=16).hexdigest()
+        return snapshot
+
+    @staticmethod
+    def _refresh(instrument: str, deadline: Optional[Deadline]) -> Optional[Dict]:
+        # 선출된 워커가 업스트림을 조회해 스냅샷을 만들고 S3 에 씁니다.
+        snapshot = SharedSnapshotService._build(instrument, deadline)
+        if snapshot is None:
+            return None
+        
+        body = SharedSnapshotService._encode(snapshot)
+        etag = s3_utils.put_object_contents(body, SharedSnapshotService._key(instrument, 'snapshot'),
+                                            bucket_name=SharedSnapshotService._bucket)
+        SharedSnapshotService._local[instrument] = (snapshot, etag, time.monotonic())
+        logger.info(f"공유 스냅샷 갱신 - {instrument} ({len(body)} bytes)")
+        return snapshot
+
+    @staticmethod
+    def _encode(snapshot: Dict) -> bytes:
+        daily: PriceSeries = snapshot['daily']
+        return zlib.compress(dumps({
+            'format': SharedSnapshotService.FORMAT_VERSION,
+            'generated_at': snapshot['generated_at'],
+            'realtime': snapshot['realtime'],
+            'daily': {'columns': daily.columns, 'rows': daily.rows}
+        }), 6)
+
+    @staticmethod
+    def _decode(instrument: str, body) -> Optional[Dict]:
+        data = json.loads(zlib.decompress(body))
+        if data.get('format') != SharedSnapshotService.FORMAT_VERSION:
+            return None
+        return {
+            'realtime': data['realtime'],
+            'daily': PriceSeries(instrument, data['daily']['columns'], data['daily']['rows']),
+            'generated_at': data['generated_at'],
+            'version': hashlib.blake2b(body, digest_size=16).hexdigest()
+        }
@@ -0,0 +1,52 @@
+"""
+  바이너리 일별 시세 이력 파일 갱신 작업
+  zappa events 에는 등록하지 않는다. Lambda 의 /tmp 는 컨테이너마다 따로이고 분석 코드가 읽을 수 없기 때문이다.
+  분석용 호스트에서 한 프로세스만 cron 등으로 실행한다(예: 매일 장 마감 후). 파일을 쓰는 프로세스는 하나여야 한다.
+  실행: FINANCE_HISTORY_FILE_DIR=/var/lib/finance-backend/history python -m api.market.tasks
+"""
+import os
+
+from api.gold.services import GoldPriceService
+from api.gs.services import GsStockService
+from api.kospi.services import KospiPriceService
+from util.deadline_utils import Deadline
+from util.logging_util import logger
+
+# 바이너리 이력 파일 디렉터리(종목마다 {종목 구분}.bin)
+HISTORY_FILE_DIR = os.getenv('FINANCE_HISTORY_FILE_DIR', '/tmp/finance-backend/history')
+# 이력 파일 갱신 한 번에 허용하는 시간(초). 파일을 처음 만들 때는 이력 전체 페이지를 읽는다.
+SYNC_DEADLINE_SECS = 600.0
+INSTRUMENTS = {
+    'gold': GoldPriceService,
+    'kospi': KospiPriceService,
+    'gs': GsStockService
+}
+
+
+def history_file_path(instrument: str, directory: str = HISTORY_FILE_DIR) -> str:
+    """
+    종목의 바이너리 이력 파일 경로를 반환한다.
+    :param instrument: 종목 구분
+    :param directory: 이력 파일 디렉터리
+    """
+    return os.path.join(directory, f'{instrument}.bin')
+
+
+def sync_history_files(event=None, context=None):
+    """
+    종목별 일별 시세 이력을 바이너리 이력 파일에 반영한다(파일이 없으면 새로 만들고, 있으면 새 거래일만 덧붙인다).
+    파일은 쓰는 프로세스가 하나여야 하므로 호스트마다 cron 등으로 한 곳에서만 실행한다(python -m api.market.tasks).
+    :param event: 스케쥴 이벤트
+    :param context: Lambda 컨텍스트
+    """
+    deadline = Deadline(SYNC_DEADLINE_SECS)
+    for instrument, service in INSTRUMENTS.items():
+        try:
+            written = service.get_history().sync_history_file(history_file_path(instrument), deadline)
+            logger.info(f"이력 파일 갱신 - {instrument}: {written}건")
+        except Exception as e:
+            logger.error(f"이력 파일 {instrument} 갱신 중 오류: {str(e)}")
+
+
+if __name__ == '__main__':
+    sync_history_files()
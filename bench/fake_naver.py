@@ -0,0 +1,152 @@
+"""
+  오프라인 벤치마크용 네이버 금융 가짜 서버
+  서비스가 조회하는 페이지(일별 시세 HTML, 금 상세 HTML, 실시간 시세 JSON)를 로컬 HTTP 서버로 흉내낸다.
+  서비스의 *_URL 을 http://127.0.0.1:<port>/<원래 호스트>/<경로> 로 바꿔 실제 소켓 왕복을 포함해 측정한다.
+  일별 시세는 page 파라미터마다 기준일에서 PAGE_ROWS 일씩 이전 날짜를 돌려준다.
+"""
+import json
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+ANCHOR_DATE = date(2025, 8, 25)
+PAGE_ROWS = 10
+MAX_PAGES = 30
+
+GOLD_REALTIME = {
+    'closePrice': '3,412.50', 'compareToPreviousClosePrice': '12.30', 'fluctuationsRatio': '0.36',
+    'compareToPreviousPrice': {'code': '2', 'name': 'RISING'}, 'openPrice': '3,400.10', 'highPrice': '3,420.00',
+    'lowPrice': '3,398.00', 'marketStatus': 'OPEN', 'localTradedAt': '2025-08-25T16:30:00'
+}
+POLLING_REALTIME = {
+    'resultCode': 'success',
+    'result': {'areas': [{'datas': [{'nv': 315020, 'cv': 1230, 'cr': -0.39, 'rf': '5', 'ov': 316000, 'hv': 317000,
+                                     'lv': 314000, 'aq': 512345, 'aa': 10234567, 'ms': 'OPEN'}]}]}
+}
+GOLD_DETAIL = ('<html><body><div class="head_info"><p class="no_today"><em class="no_up">'
+               '<span class="no3">3</span><span class="shim">,</span><span class="no4">4</span>'
+               '<span class="no1">1</span><span class="no2">2</span><span class="jum">.</span>'
+               '<span class="no5">5</span><span class="no0">0</span></em></p></div></body></html>')
+
+
+def _page_dates(page: int) -> List[date]:
+    if page > MAX_PAGES:
+        return []
+    first = ANCHOR_DATE - timedelta(days=(page - 1) * PAGE_ROWS)
+    return [first - timedelta(days=offset) for offset in range(PAGE_ROWS)]
+
+
+def gold_daily_page(page: int) -> str:
+    rows = ''.join(
+        f'<tr><td class="date">{day:%Y.%m.%d}</td><td class="num">3,{300 + day.day}.50</td>'
+        f'<td class="num"><img src="ico_up.gif" alt="상승">1.20</td><td class="num">+0.03%</td></tr>'
+        for day in _page_dates(page))
+    return ('<html><body><table><thead><tr><th>날짜</th><th>종가</th></tr></thead>'
+            f'<tbody>{rows}</tbody></table></body></html>')
+
+
+def kospi_daily_page(page: int) -> str:
+    rows = ''.join(
+        f'<tr><td align="center"><span class="tah p10 gray03">{day:%Y.%m.%d}</span></td>'
+        f'<td class="number_1">3,1{day.day:02d}.20</td>'
+        '<td class="rate_down"><img src="ico_down.gif" alt="하락"><span class="tah p11 nv01">12.30</span></td>'
+        '<td class="number_1"><span class="tah p11 nv01">-0.39%</span></td>'
+        '<td class="number_1">512,345</td><td class="number_1">10,234,567</td></tr>'
+        for day in _page_dates(page))
+    return f'<html><body><table class="type_1"><tr><th>날짜</th></tr>{rows}</table></body></html>'
+
+
+def gs_daily_page(page: int) -> str:
+    rows = ''.join(
+        f'<tr><td align="center"><span class="tah p10 gray03">{day:%Y.%m.%d}</span></td>'
+        f'<td class="num"><span class="tah p11">45,{day.day:02d}0</span></td>'
+        '<td class="num"><img src="ico_up.gif" alt="상승"><span class="tah p11 red02">300</span></td>'
+        '<td class="num"><span class="tah p11">45,000</span></td><td class="num"><span class="tah p11">46,000</span></td>'
+        '<td class="num"><span class="tah p11">44,500</span></td><td class="num"><span class="tah p11">123,456</span></td></tr>'
+        for day in _page_dates(page))
+    return f'<html><body><table class="type2"><tr><th>날짜</th></tr>{rows}</table></body></html>'
+
+
+def route(path: str, page: int) -> Optional[Tuple[bytes, str]]:
+    """
+    요청 경로에 해당하는 (본문, Content-Type) 을 반환한다. 없는 경로는 None.
+    """
+    if 'worldDailyQuote' in path:
+        return gold_daily_page(page).encode('euc-kr'), 'text/html; charset=euc-kr'
+    if 'worldGoldDetail' in path:
+        return GOLD_DETAIL.encode('euc-kr'), 'text/html; charset=euc-kr'
+    if 'sise_index_day' in path:
+        return kospi_daily_page(page).encode('euc-kr'), 'text/html; charset=euc-kr'
+    if 'sise_day' in path:
+        return gs_daily_page(page).encode('euc-kr'), 'text/html; charset=euc-kr'
+    if 'marketindex/metals' in path:
+        return json.dumps(GOLD_REALTIME).encode('utf-8'), 'application/json'
+    if 'api/realtime' in path:
+        return json.dumps(POLLING_REALTIME).encode('utf-8'), 'application/json'
+    return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        page = int(parse_qs(parts.query).get('page', ['1'])[0])
+        self.server.request_count += 1
+        found = route(parts.path, page)
+        body, content_type = found if found is not None else (b'', 'text/plain')
+        self.send_response(200 if found is not None else 404)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeNaverServer:
+    """
+    127.0.0.1 의 임의 포트에서 가짜 네이버 금융 페이지를 제공하는 HTTP 서버(백그라운드 스레드).
+    """
+
+    def __init__(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.request_count = 0
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-naver', daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def request_count(self) -> int:
+        return self._server.request_count
+
+    def start(self) -> 'FakeNaverServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def redirect_services(base_url: str):
+    """
+    서비스 클래스의 네이버 URL(*_URL)을 가짜 서버 주소로 바꾼다(api 를 import 한 뒤, create_app 전에 호출).
+    :param base_url: FakeNaverServer.base_url
+    """
+    from api.gold.services import GoldPriceService
+    from api.gs.services import GsStockService
+    from api.kospi.services import KospiPriceService
+
+    for service in (GoldPriceService, KospiPriceService, GsStockService):
+        for name in dir(service):
+            value = getattr(service, name)
+            if name.endswith('_URL') and isinstance(value, str) and value.startswith('https://'):
+                setattr(service, name, f"{base_url}/{value[len('https://'):]}")
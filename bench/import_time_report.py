@@ -0,0 +1,143 @@
+"""
+  콜드 스타트 import 시간 리포트
+  새 파이썬 프로세스에서 `python -X importtime -c "import wsgi"` 를 실행해 stderr 의 import 시간을 표로 정리하고,
+  wsgi import 전체 시간이 예산을 넘으면 0 이 아닌 종료 코드로 끝낸다(배포 전 점검용).
+  Parameter Store 는 FINANCE_SSM_STUB 스텁 파일로 대신하고, Lambda 환경 변수를 지정해 배포와 같은 설정으로 측정한다
+  (대시보드 갱신 스레드와 시작 시 warm-up 은 Lambda 에서 기본으로 꺼져 있다). 캐시 체크포인트는 환경 변수로 끈다.
+  사용법: python -m bench.import_time_report [--module wsgi] [--budget-ms 600] [--top 25] [--repeat 3] [--json]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+# wsgi import 전체 시간 예산(ms). Lambda 콜드 스타트의 init 구간에 그대로 더해진다.
+DEFAULT_BUDGET_MS = 600
+# 앱 경로에서 import 되면 안 되는 무거운 패키지(처음 사용할 때 함수 안에서 import 한다).
+# 지연 import 하는 것은 이 패키지들뿐이고, 네임스페이스와 서비스 모듈은 create_app() 에서 모두 import 한다.
+DEFERRED_PACKAGES = ('boto3', 'botocore', 'firebase_admin', 'pynamodb', 'bs4', 'numpy')
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$')
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_ssm_stub() -> str:
+    """
+    등록된 Parameter Store 파라미터 전체에 대한 FINANCE_SSM_STUB 용 스텁 파일을 임시 경로에 만든다.
+    config 를 import 하면 LazyParameter 로 정의된 파라미터 이름이 등록된다(조회는 하지 않는다).
+    :return: 스텁 파일 경로(사용 후 삭제)
+    """
+    sys.path.insert(0, _ROOT)
+    import config  # noqa: F401
+    from contants import parameter_store
+
+    fd, path = tempfile.mkstemp(prefix='ssm-stub-', suffix='.json')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({name: f'stub-{name}' for name in parameter_store.registered_names}, f)
+    return path
+
+
+def run_importtime(module: str, ssm_stub_path: str) -> List[Dict]:
+    """
+    새 프로세스에서 module 을 import 하고 -X importtime 출력을 파싱한다.
+    :param module: import 할 모듈
+    :param ssm_stub_path: FINANCE_SSM_STUB 로 넘길 스텁 파일 경로
+    :return: [{'module', 'self_us', 'cumulative_us', 'depth'}, ...] (출력 순서)
+    """
+    # wsgi import 는 create_app 을 실행한다. warm-up 은 배포 설정(Lambda 기본값)을 그대로 따르고, 체크포인트는 끈다.
+    env = dict(os.environ, FINANCE_SSM_STUB=ssm_stub_path, AWS_LAMBDA_FUNCTION_NAME='import-time-report',
+               FINANCE_CHECKPOINT_DIR='')
+    env.pop('FINANCE_WARMUP_BUDGET_SECS', None)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f'import {module} 실패:\n{result.stderr[-2000:]}')
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append({
+                'module': name,
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': (len(indent) - 1) // 2
+            })
+    return rows
+
+
+def build_report(runs: List[List[Dict]], module: str, top: int) -> Dict:
+    """
+    여러 번 실행한 결과를 모듈별 중앙값으로 합쳐 리포트를 만든다.
+    :param runs: run_importtime 결과 목록
+    :param module: 측정한 최상위 모듈
+    :param top: 표에 담을 모듈 수(누적 시간 순)
+    :return: 리포트 dict
+    """
+    cumulative: Dict[str, List[int]] = {}
+    self_time: Dict[str, List[int]] = {}
+    for rows in runs:
+        for row in rows:
+            cumulative.setdefault(row['module'], []).append(row['cumulative_us'])
+            self_time.setdefault(row['module'], []).append(row['self_us'])
+
+    table = sorted(
+        ({'module': name,
+          'cumulative_ms': round(statistics.median(values) / 1000, 2),
+          'self_ms': round(statistics.median(self_time[name]) / 1000, 2)}
+         for name, values in cumulative.items()),
+        key=lambda row: row['cumulative_ms'], reverse=True)
+
+    return {
+        'module': module,
+        'python': sys.version.split()[0],
+        'repeat': len(runs),
+        'total_ms': round(statistics.median(cumulative.get(module, [0])) / 1000, 2),
+        'deferred_imported': [name for name in DEFERRED_PACKAGES if name in cumulative],
+        'top': table[:top]
+    }
+
+
+def format_table(report: Dict) -> str:
+    lines = [f"{'cumulative(ms)':>15} {'self(ms)':>10}  module", '-' * 60]
+    for row in report['top']:
+        lines.append(f"{row['cumulative_ms']:>15.2f} {row['self_ms']:>10.2f}  {row['module']}")
+    lines.append('-' * 60)
+    lines.append(f"import {report['module']}: {report['total_ms']:.2f} ms (budget {report['budget_ms']} ms, "
+                 f"median of {report['repeat']})")
+    if report['deferred_imported']:
+        lines.append(f"지연 import 대상이 import 됨: {', '.join(report['deferred_imported'])}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='콜드 스타트 import 시간 리포트')
+    parser.add_argument('--module', default='wsgi')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='표 대신 JSON 으로 출력')
+    args = parser.parse_args()
+
+    ssm_stub_path = write_ssm_stub()
+    try:
+        runs = [run_importtime(args.module, ssm_stub_path) for _ in range(args.repeat)]
+    finally:
+        os.remove(ssm_stub_path)
+
+    report = build_report(runs, args.module, args.top)
+    report['budget_ms'] = args.budget_ms
+    report['within_budget'] = report['total_ms'] <= args.budget_ms and not report['deferred_imported']
+
+    print(json.dumps(report, ensure_ascii=False, indent=2) if args.json else format_table(report))
+    sys.exit(0 if report['within_budget'] else 1)
+
+
+if __name__ == '__main__':
+    main()
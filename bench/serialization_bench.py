@@ -0,0 +1,163 @@
+"""
+  응답 직렬화 벤치마크
+  flask-restx marshal + json.dumps 경로와 util.response_utils 의 단일 패스 직렬화 경로,
+  Accept 헤더로 선택하는 컬럼 단위 형식(columnar JSON, CSV, MessagePack)을 비교한다.
+  사용법: python -m bench.serialization_bench [--rows 1000 10000 100000] [--repeat 5]
+  결과는 JSON 으로 표준 출력에 기록한다.
+"""
+import argparse
+import json
+import platform
+import statistics
+import time
+
+from flask_restx import Model, fields, marshal
+
+from util import response_utils
+from util.response_utils import _shape
+
+# api.gs.controllers 의 모델과 같은 구조(api 패키지 import 시 설정 조회가 일어나므로 여기서 다시 정의한다)
+gs_stock_model = Model('GsStockResponse', {
+    'status': fields.String,
+    'data': fields.Raw,
+    'message': fields.String,
+    'error_code': fields.String
+})
+
+daily_price_model = Model('DailyPriceData', {
+    'date': fields.String,
+    'closing_price': fields.String,
+    'change_value': fields.String,
+    'direction': fields.String,
+    'open_price': fields.String,
+    'high_price': fields.String,
+    'low_price': fields.String,
+    'volume': fields.String
+})
+
+realtime_data_model = Model('RealtimeData', {
+    'current_price': fields.String,
+    'change_value': fields.String,
+    'change_rate': fields.String,
+    'direction': fields.String
+})
+
+all_prices_model = Model('AllDailyPricesResponse', {
+    'stock_code': fields.String,
+    'stock_name': fields.String,
+    'current_price_info': fields.Nested(realtime_data_model),
+    'daily_prices': fields.List(fields.Nested(daily_price_model)),
+    'total_count': fields.Integer,
+    'last_updated': fields.String
+})
+
+
+def make_envelope(rows: int) -> dict:
+    daily_prices = [{
+        'date': f'{2025 - i // 366:04d}.{i % 12 + 1:02d}.{i % 28 + 1:02d}',
+        'closing_price': str(45000 + i % 1000),
+        'change_value': str(i % 500),
+        'direction': '상승' if i % 2 else '하락',
+        'open_price': str(44800 + i % 1000),
+        'high_price': str(45500 + i % 1000),
+        'low_price': str(44500 + i % 1000),
+        'volume': str(100000 + i)
+    } for i in range(rows)]
+    return {
+        'status': 'success',
+        'data': {
+            'stock_code': '078930',
+            'stock_name': 'GS',
+            'current_price_info': {'current_price': '45000', 'change_value': '300', 'change_rate': '0.67%',
+                                   'direction': '상승'},
+            'daily_prices': daily_prices,
+            'total_count': rows,
+            'last_updated': '2025-08-25T16:30:00'
+        },
+        'message': '조회했습니다.',
+        'error_code': None
+    }
+
+
+def restx_nested(envelope: dict) -> bytes:
+    # 모델 필드(Nested/List)를 행 단위로 순회하는 marshal 후 restx 의 output_json 과 같은 json.dumps
+    data = marshal(envelope['data'], all_prices_model)
+    body = marshal({**envelope, 'data': data}, gs_stock_model)
+    return (json.dumps(body) + '\n').encode('utf-8')
+
+
+def restx_envelope(envelope: dict) -> bytes:
+    # 현재 컨트롤러와 같은 envelope 모델(data 는 fields.Raw) marshal 후 json.dumps
+    return (json.dumps(marshal(envelope, gs_stock_model)) + '\n').encode('utf-8')
+
+
+def fast_path(envelope: dict) -> bytes:
+    return response_utils.dumps(_shape(envelope, gs_stock_model))
+
+
+def make_columns(envelope: dict) -> dict:
+    # api.market.models.PriceSeries 의 columns 와 같은 구조(응답 시점이 아니라 파싱 시점에 한 번 만든다)
+    rows = envelope['data']['daily_prices']
+    columns = {'date': [row['date'].replace('.', '-') for row in rows]}
+    for column, key in (('close', 'closing_price'), ('change', 'change_value'), ('open', 'open_price'),
+                        ('high', 'high_price'), ('low', 'low_price'), ('volume', 'volume')):
+        columns[column] = [int(row[key]) for row in rows]
+    columns['direction'] = [row['direction'] for row in rows]
+    return columns
+
+
+def columnar_json(columns: dict) -> bytes:
+    return response_utils.dumps({'status': 'success', 'data': columns, 'message': '', 'error_code': None})
+
+
+def columnar_msgpack(columns: dict) -> bytes:
+    return response_utils.msgpack.packb({'status': 'success', 'data': columns, 'message': '', 'error_code': None},
+                                        use_bin_type=True)
+
+
+def measure(func, payload: dict, repeat: int) -> dict:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(func(payload))
+        timings.append(time.perf_counter() - started)
+    return {
+        'median_ms': round(statistics.median(timings) * 1000, 3),
+        'min_ms': round(min(timings) * 1000, 3),
+        'bytes': size
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='응답 직렬화 경로 비교')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    for rows in args.rows:
+        envelope = make_envelope(rows)
+        result = {'rows': rows}
+        for name, func in (('restx_nested', restx_nested), ('restx_envelope', restx_envelope),
+                           ('fast', fast_path)):
+            result[name] = measure(func, envelope, args.repeat)
+        columns = make_columns(envelope)
+        result['columnar_json'] = measure(columnar_json, columns, args.repeat)
+        result['csv'] = measure(response_utils._columns_to_csv, columns, args.repeat)
+        if response_utils.msgpack is not None:
+            result['msgpack'] = measure(columnar_msgpack, columns, args.repeat)
+        result['speedup_vs_nested'] = round(result['restx_nested']['median_ms'] / result['fast']['median_ms'], 2)
+        results.append(result)
+
+    print(json.dumps({
+        'benchmark': 'serialization',
+        'encoder': 'orjson' if response_utils.orjson is not None else 'json',
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'results': results
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+  시작/콜드 스타트 벤치마크
+  새 파이썬 프로세스마다 api import 시간, create_app() 시간, 시작 직후 RSS,
+  네임스페이스별 첫 요청(콜드)과 두 번째 요청(웜) 지연 시간을 측정하고 -X importtime 분석을 함께 기록한다.
+  Parameter Store 는 FINANCE_SSM_STUB 스텁으로, 네이버 금융은 bench.fake_naver 의 로컬 서버로 대신하므로 오프라인에서 동작한다.
+  배포 설정 그대로 측정한다. --target lambda(기본)는 Lambda 환경 변수를 지정해 Lambda 기본값(warm-up 없음)으로,
+  --target server 는 Lambda 환경 변수 없이 서버 기본값(시작 시 warm-up 포함)으로 create_app() 을 실행한다.
+  사용법: python -m bench.startup_bench [--runs 5] [--target lambda|server] [--output result.json] [--baseline old.json]
+                                        [--max-regression 0.2]
+  결과는 JSON 으로 기록하고, --baseline 을 주면 중앙값이 max-regression 비율 넘게 늘어난 지표가 있을 때 종료 코드 1 로 끝낸다.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from bench.fake_naver import FakeNaverServer
+from bench.import_time_report import build_report, run_importtime, write_ssm_stub
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 네임스페이스별 첫 요청(이 순서대로 실행하므로 뒤쪽 네임스페이스는 앞에서 데운 공용 모듈의 이점을 받는다)
+FIRST_REQUESTS = [
+    ('gold', 'GET', '/gold/price', None),
+    ('kospi', 'GET', '/kospi/price', None),
+    ('gs', 'GET', '/gs/price', None),
+    ('batch', 'POST', '/batch', {'queries': [{'instrument': 'gold', 'type': 'date', 'date': '2025-08-20'},
+                                             {'instrument': 'kospi', 'type': 'realtime'}]}),
+    ('dashboard', 'GET', '/dashboard', None),
+    ('swagger', 'GET', '/swagger.json', None)
+]
+
+
+def _rss_kb() -> int:
+    # 현재 RSS(KB). /proc 가 없으면 최대 RSS 로 대신한다.
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_child(base_url: str, output_path: str):
+    # 새 프로세스에서 한 번의 콜드 스타트를 측정해 output_path 에 JSON 으로 기록한다.
+    started = time.perf_counter()
+    import api
+    import_ms = (time.perf_counter() - started) * 1000
+
+    from bench.fake_naver import redirect_services
+    redirect_services(base_url)
+
+    started = time.perf_counter()
+    app = api.create_app()
+    create_app_ms = (time.perf_counter() - started) * 1000
+    result = {'import_ms': import_ms, 'create_app_ms': create_app_ms, 'rss_after_startup_kb': _rss_kb(),
+              'warmup_budget_secs': app.config['WARMUP_BUDGET_SECS']}
+
+    client = app.test_client()
+    for namespace, method, path, body in FIRST_REQUESTS:
+        for phase in ('first', 'second'):
+            started = time.perf_counter()
+            response = client.open(path, method=method, json=body)
+            response.get_data()
+            result[f'{namespace}_{phase}_ms'] = (time.perf_counter() - started) * 1000
+            result[f'{namespace}_status'] = response.status_code
+
+    result['rss_after_requests_kb'] = _rss_kb()
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+def run_once(base_url: str, ssm_stub_path: str, target: str = 'lambda') -> Dict:
+    """
+    새 프로세스에서 콜드 스타트를 한 번 측정한다.
+    :param base_url: 가짜 네이버 서버 주소
+    :param ssm_stub_path: FINANCE_SSM_STUB 스텁 파일 경로
+    :param target: 'lambda' 면 Lambda 환경 변수를 지정하고, 'server' 면 지정하지 않는다
+    :return: 지표 이름 -> 값
+    """
+    fd, output_path = tempfile.mkstemp(prefix='startup-bench-', suffix='.json')
+    os.close(fd)
+    # 체크포인트는 끄고 빈 캐시로 시작하는 콜드 스타트를 측정한다. warm-up 은 target 의 기본값을 그대로 따른다.
+    env = dict(os.environ, FINANCE_SSM_STUB=ssm_stub_path, FINANCE_CHECKPOINT_DIR='')
+    env.pop('FINANCE_WARMUP_BUDGET_SECS', None)
+    env.pop('AWS_LAMBDA_FUNCTION_NAME', None)
+    if target == 'lambda':
+        env['AWS_LAMBDA_FUNCTION_NAME'] = 'startup-bench'
+    try:
+        result = subprocess.run([sys.executable, '-m', 'bench.startup_bench', '--child', base_url, output_path],
+                                cwd=_ROOT, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f'측정 프로세스 실패:\n{result.stderr[-2000:]}')
+        with open(output_path, encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(output_path)
+
+
+def summarize(runs: List[Dict]) -> Dict[str, Dict]:
+    """
+    실행별 지표를 지표별 중앙값/최솟값/최댓값으로 요약한다(상태 코드는 마지막 실행 값).
+    """
+    metrics = {}
+    for name in runs[0]:
+        values = [run[name] for run in runs]
+        if name.endswith('_status'):
+            metrics[name] = values[-1]
+        else:
+            metrics[name] = {
+                'median': round(statistics.median(values), 3),
+                'min': round(min(values), 3),
+                'max': round(max(values), 3)
+            }
+    return metrics
+
+
+def compare(metrics: Dict, baseline: Dict, max_regression: float) -> List[Dict]:
+    """
+    기준 결과와 지표별 중앙값을 비교해 max_regression 비율 넘게 늘어난 지표를 반환한다.
+    """
+    regressions = []
+    for name, current in metrics.items():
+        previous = baseline.get('metrics', {}).get(name)
+        if not isinstance(current, dict) or not isinstance(previous, dict) or not previous['median']:
+            continue
+        ratio = current['median'] / previous['median'] - 1
+        if ratio > max_regression:
+            regressions.append({'metric': name, 'baseline': previous['median'], 'current': current['median'],
+                                'change': round(ratio, 3)})
+    return regressions
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        _run_child(sys.argv[2], sys.argv[3])
+        return
+
+    parser = argparse.ArgumentParser(description='시작/콜드 스타트 벤치마크')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--target', choices=('lambda', 'server'), default='lambda', help='측정할 배포 설정')
+    parser.add_argument('--import-top', type=int, default=15, help='importtime 분석에 담을 모듈 수')
+    parser.add_argument('--output', help='결과 JSON 파일 경로(없으면 표준 출력)')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일 경로')
+    parser.add_argument('--max-regression', type=float, default=0.2, help='허용하는 중앙값 증가 비율')
+    args = parser.parse_args()
+
+    server = FakeNaverServer().start()
+    ssm_stub_path = write_ssm_stub()
+    try:
+        runs = [run_once(server.base_url, ssm_stub_path, args.target) for _ in range(args.runs)]
+        import_runs = [run_importtime('wsgi', ssm_stub_path) for _ in range(args.runs)]
+    finally:
+        os.remove(ssm_stub_path)
+        server.stop()
+
+    # warm-up 예산은 지표가 아닌 측정한 설정값이므로 따로 기록한다.
+    warmup_budget_secs = [run.pop('warmup_budget_secs') for run in runs][-1]
+    report = {
+        'benchmark': 'startup',
+        'revision': _git_revision(),
+        'measured_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': args.runs,
+        'target': args.target,
+        'warmup_budget_secs': warmup_budget_secs,
+        'metrics': summarize(runs),
+        'import_time': build_report(import_runs, 'wsgi', args.import_top)
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        report['baseline_revision'] = baseline.get('revision')
+        if baseline.get('target', 'lambda') != args.target:
+            print(f"기준 결과의 target({baseline.get('target', 'lambda')})이 다름", file=sys.stderr)
+        report['regressions'] = compare(report['metrics'], baseline, args.max_regression)
+        exit_code = 1 if report['regressions'] else 0
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,27 @@
+import inspect
 import logging
+import os
 
-from contants import SingletonInstance, get_config_from_param_store
+from flask import Config
+from werkzeug.utils import import_string
+
+from contants import LazyParameter, SingletonInstance
+
+# 아래 파라미터들은 처음 값을 읽을 때 Parameter Store 에서 한 번의 GetParameters 로 함께 조회한다.
 
 
 # Naver SMS
 class NaverSmsConfig(SingletonInstance):
-    def __init__(self):
-        self.ACCESS_KEY = get_config_from_param_store('/52g/nhn/sens/access-key')
-        self.SECRET_KEY = get_config_from_param_store('/52g/nhn/sens/secret-key')
-        self.NAVER_URL = get_config_from_param_store('/52g/nhn/sens/url')
-        self.NAVER_URI = get_config_from_param_store('/52g/nhn/sens/uri')
-        self.FROM_PHONE_NUMBER = get_config_from_param_store('/52g/nhn/sens/from-phone-number')
-
+    ACCESS_KEY = LazyParameter('/52g/nhn/sens/access-key')
+    SECRET_KEY = LazyParameter('/52g/nhn/sens/secret-key')
+    NAVER_URL = LazyParameter('/52g/nhn/sens/url')
+    NAVER_URI = LazyParameter('/52g/nhn/sens/uri')
+    FROM_PHONE_NUMBER = LazyParameter('/52g/nhn/sens/from-phone-number')
 
 
 # JWT
 class JWTConfig(SingletonInstance):
-    def __init__(self):
-        self.SECRET_KEY = get_config_from_param_store('/52g/camp/secret-key')
+    SECRET_KEY = LazyParameter('/52g/camp/secret-key')
 
 
 # Flask Base Configuration
@@ -27,13 +31,52 @@ class BaseConfig(object):
     DEBUG = False
     BUNDLE_ERRORS = True
     PROPAGATE_EXCEPTIONS = True
-    SECRET_KEY = JWTConfig.instance().SECRET_KEY
+    # JWTConfig 와 같은 파라미터. LazyConfig 에서는 JWT 토큰을 처음 만들거나 검증할 때 조회된다.
+    SECRET_KEY = LazyParameter('/52g/camp/secret-key')
     # Restx
     RESTX_VALIDATE = True
     RESTX_MASK_SWAGGER = False
     # JWT
     JWT_ACCESS_TOKEN_EXPIRES = False
     LOG_LEVEL = logging.DEBUG
+    # API Gateway 타임아웃(29초) 이전에 응답하기 위한 요청 단위 데드라인(초)
+    REQUEST_DEADLINE_SECS = 25.0
+    # 응답 압축(gzip, brotli): 최소 본문 크기(바이트), gzip 압축 레벨, 압축 바이트 캐시 항목 수
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 6
+    COMPRESS_CACHE_SIZE = 128
+    # 응답 Cache-Control max-age 의 기준이 되는 데이터 유효 시간(초): 실시간 시세 포함 응답, 일별 시세만 담은 응답
+    REALTIME_MAX_AGE_SECS = 10
+    PRICE_MAX_AGE_SECS = 300
+    # 대시보드 스냅샷 갱신 주기(초). 이보다 오래된 스냅샷은 백그라운드에서 갱신하며, 응답 max-age 의 기준이 된다.
+    DASHBOARD_REFRESH_SECS = 30
+    # 시작 시 캐시 warm-up: 전체 시간 예산(초, FINANCE_WARMUP_BUDGET_SECS 환경 변수, 0 이면 하지 않음),
+    # 종목별로 미리 읽을 일별 시세 이력 페이지 수.
+    # Lambda 에서는 warm-up 시간이 모든 콜드 스타트에 더해지므로 기본으로 하지 않는다(캐시는 첫 요청과 체크포인트로 채운다).
+    WARMUP_BUDGET_SECS = float(os.getenv('FINANCE_WARMUP_BUDGET_SECS',
+                                         '0' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else '3.0'))
+    WARMUP_HISTORY_PAGES = 3
+    # 캐시 체크포인트: 디렉터리(FINANCE_CHECKPOINT_DIR 환경 변수, 빈 값이면 사용하지 않음),
+    # 시작 시 복원할 체크포인트의 최대 나이(초), 요청 처리 후 저장 최소 간격(초)
+    CHECKPOINT_DIR = os.getenv('FINANCE_CHECKPOINT_DIR', '/tmp/finance-backend')
+    CHECKPOINT_MAX_AGE_SECS = 600
+    CHECKPOINT_INTERVAL_SECS = 60
+    # S3 공유 스냅샷: 사용 여부(FINANCE_SHARED_SNAPSHOT 환경 변수, 로컬은 FINANCE_S3_STUB 를 지정했을 때만 기본 사용),
+    # 갱신 없이 사용하는 시간(초), 갱신하지 못했을 때 대신 사용하는 최대 나이(초)
+    SHARED_SNAPSHOT_ENABLED = os.getenv('FINANCE_SHARED_SNAPSHOT', '1' if os.getenv('FINANCE_S3_STUB') else '0') == '1'
+    SHARED_SNAPSHOT_FRESH_SECS = 10
+    SHARED_SNAPSHOT_MAX_STALE_SECS = 120
+    # 같은 호스트의 워커끼리 스냅샷을 나눠 읽는 공유 메모리 파일(FINANCE_SHARED_MEMORY_PATH 환경 변수, 기본은 사용하지 않음)과
+    # 종목별 슬롯 크기(바이트). 쓰는 워커가 요청과 관계없이 주기적으로 업스트림을 조회하므로 멀티 프로세스 서버에서만 지정한다.
+    # Lambda 에서는 실행 환경마다 프로세스가 하나이므로 지정해도 사용하지 않는다.
+    SHARED_MEMORY_PATH = os.getenv('FINANCE_SHARED_MEMORY_PATH', '')
+    SHARED_MEMORY_SLOT_SIZE = 64 * 1024
+    # S3 아카이브 다운로드 URL(서명된 URL) 유효 시간(초)
+    ARCHIVE_URL_EXPIRES_SECS = 3600
+    # 큰 응답의 S3 분리: 기준 크기(바이트, FINANCE_RESPONSE_SPILL_MIN_SIZE 환경 변수, 0 이면 분리하지 않음),
+    # 서명된 URL 유효 시간(초). Lambda 응답 한도(6MB)는 base64 인코딩 후 크기에 적용되므로 여유를 둔다.
+    RESPONSE_SPILL_MIN_SIZE = int(os.getenv('FINANCE_RESPONSE_SPILL_MIN_SIZE', str(4 * 1024 * 1024)))
+    RESPONSE_SPILL_URL_EXPIRES_SECS = 600
 
 # Flask Local Configuration
 class LocalConfig(BaseConfig):
@@ -42,6 +85,36 @@ class LocalConfig(BaseConfig):
 # Flask Dev Configuration
 class DevConfig(BaseConfig):
     BASE_URL = 'https://finance-backend.52g.studio'
+    SHARED_SNAPSHOT_ENABLED = os.getenv('FINANCE_SHARED_SNAPSHOT', '1') == '1'
+
+
+class LazyConfig(Config):
+    """
+    LazyParameter 설정값을 처음 읽을 때 조회하는 Flask 설정.
+    from_object 에서 LazyParameter 를 값으로 바꾸지 않고 그대로 담아 두므로,
+    create_app 에서는 Parameter Store 를 호출하지 않고 boto3 도 import 하지 않는다.
+    """
+
+    def from_object(self, obj):
+        if isinstance(obj, str):
+            obj = import_string(obj)
+        for key in dir(obj):
+            if key.isupper():
+                value = inspect.getattr_static(obj, key)
+                self[key] = value if isinstance(value, LazyParameter) else getattr(obj, key)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, LazyParameter):
+            value = value.resolve()
+            self[key] = value
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 
 config_by_name = dict(
@@ -1,5 +1,9 @@
+import json
+import os
+import threading
+import time
 from enum import Enum, auto
-import boto3
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 # JWT User Scope
@@ -15,20 +19,162 @@ DEFAULT_REGION = 'ap-northeast-2'
 
 # AWS S3 : 금융 백엔드 서비스용 스토리지  
 S3_BUCKET_NAME_FORMAT = 'dev-{region}-finance-backend-storage'
+# 오프라인 테스트용 S3 스텁: 이 환경 변수에 디렉터리를 지정하면 S3 대신 그 디렉터리에 객체를 저장한다(util.s3_utils.LocalS3Client).
+S3_STUB_ENV = 'FINANCE_S3_STUB'
 
+# AWS Parameter Store : GetParameters 한 번에 조회할 수 있는 최대 파라미터 수, 조회한 값의 캐시 유효 시간(초)
+SSM_GET_PARAMETERS_MAX_NAMES = 10
+SSM_CACHE_TTL_SECS = 900
+# 오프라인 테스트용 SSM 스텁: 이 환경 변수에 {파라미터 이름: 값} JSON 파일 경로를 지정하면 AWS 를 호출하지 않는다.
+SSM_STUB_ENV = 'FINANCE_SSM_STUB'
 
-def get_config_from_param_store(param_name: str, with_description: bool = True) -> str:
+
+class StubSsmClient:
+    """
+    GetParameters 만 흉내내는 오프라인 테스트용 SSM 클라이언트.
+    """
+
+    def __init__(self, parameters: Dict[str, str]):
+        self.parameters = parameters
+        self.calls = 0
+
+    @classmethod
+    def from_file(cls, path: str) -> 'StubSsmClient':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def get_parameters(self, Names: List[str], WithDecryption: bool = True) -> dict:
+        self.calls += 1
+        return {
+            'Parameters': [{'Name': name, 'Value': self.parameters[name]} for name in Names if name in self.parameters],
+            'InvalidParameters': [name for name in Names if name not in self.parameters]
+        }
+
+
+class ParameterStore:
+    """
+    AWS Parameter Store 조회 캐시.
+    사용할 파라미터 이름을 미리 등록해 두고, 처음 값이 필요할 때 등록된 파라미터 전체를 GetParameters 로 한 번에 조회한다.
+    조회한 값은 ttl_secs 동안 캐시하고, 만료된 뒤 다시 필요할 때 만료된 파라미터만 한 번에 다시 조회한다.
+    """
+
+    def __init__(self, ttl_secs: float = SSM_CACHE_TTL_SECS, client=None):
+        """
+        :param ttl_secs: 캐시 유효 시간(초)
+        :param client: SSM 클라이언트(테스트용 StubSsmClient 등). 없으면 처음 조회할 때 만든다.
+        """
+        self.ttl_secs = ttl_secs
+        self._client = client
+        self._names = set()
+        self._values: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, *names: str):
+        """
+        다음 일괄 조회에 포함할 파라미터 이름을 등록한다(조회는 하지 않는다).
+        """
+        with self._lock:
+            self._names.update(names)
+
+    @property
+    def registered_names(self) -> List[str]:
+        """
+        등록된 파라미터 이름 목록(오프라인 스텁 파일을 만들 때 사용).
+        """
+        with self._lock:
+            return sorted(self._names)
+
+    def set_client(self, client):
+        """
+        SSM 클라이언트를 바꾸고 캐시를 비운다(오프라인 테스트에서 StubSsmClient 를 지정할 때 사용).
+        """
+        with self._lock:
+            self._client = client
+            self._values.clear()
+
+    def get(self, name: str, with_decryption: bool = True) -> str:
+        """
+        파라미터 값을 반환한다. 캐시에 없거나 만료되었으면 등록된 파라미터와 함께 한 번에 조회한다.
+        :param name: 파라미터 이름
+        :param with_decryption: SecureString 복호화 여부
+        :return: 파라미터 값
+        """
+        value = self._cached(name)
+        if value is not None:
+            return value
+
+        with self._lock:
+            self._names.add(name)
+            value = self._cached(name)
+            if value is None:
+                self._load(with_decryption)
+                value = self._values.get(name, (None, 0))[0]
+        if value is None:
+            raise KeyError(f'parameter not found: {name}')
+        return value
+
+    def _cached(self, name: str) -> Optional[str]:
+        cached = self._values.get(name)
+        if cached is None or time.monotonic() - cached[1] > self.ttl_secs:
+            return None
+        return cached[0]
+
+    def _load(self, with_decryption: bool):
+        names = sorted(name for name in self._names if self._cached(name) is None)
+        print(f'loading... get_parameters : {names}')
+        client = self._get_client()
+        for chunk in _chunks(names, SSM_GET_PARAMETERS_MAX_NAMES):
+            response = client.get_parameters(Names=chunk, WithDecryption=with_decryption)
+            loaded_at = time.monotonic()
+            for parameter in response['Parameters']:
+                self._values[parameter['Name']] = (parameter['Value'], loaded_at)
+            if response.get('InvalidParameters'):
+                print(f'invalid parameters : {response["InvalidParameters"]}')
+
+    def _get_client(self):
+        if self._client is None:
+            stub_path = os.getenv(SSM_STUB_ENV)
+            if stub_path:
+                self._client = StubSsmClient.from_file(stub_path)
+            else:
+                # boto3 는 import 에만 수십 ms 가 걸리므로 실제로 AWS 를 호출할 때 불러온다.
+                import boto3
+                region = boto3.session.Session().region_name
+                self._client = boto3.client('ssm', region)
+        return self._client
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# 애플리케이션 전체에서 공유하는 Parameter Store 캐시
+parameter_store = ParameterStore()
+
+
+class LazyParameter:
     """
-    AWS Parameter Store 에서 해당 파라미터 이름의 값을 얻어온다.
+    Parameter Store 의 값을 처음 읽을 때 조회하는 설정 속성(디스크립터).
+    클래스를 정의할 때 파라미터 이름만 등록하므로, import 시점에는 AWS 를 호출하지 않는다.
     """
-    print(f'loading... get_config_from_param_store : {param_name}')
-    region = boto3.session.Session().region_name
-    ssm = boto3.client('ssm', region)
-    parameter = ssm.get_parameter(
-        Name=param_name, WithDecryption=with_description
-    )
 
-    return parameter['Parameter']['Value']
+    def __init__(self, param_name: str):
+        self.param_name = param_name
+        parameter_store.register(param_name)
+
+    def __get__(self, instance, owner) -> str:
+        return self.resolve()
+
+    def resolve(self) -> str:
+        return parameter_store.get(self.param_name)
+
+
+def get_config_from_param_store(param_name: str, with_description: bool = True) -> str:
+    """
+    AWS Parameter Store 에서 해당 파라미터 이름의 값을 얻어온다(parameter_store 캐시 사용).
+    """
+    return parameter_store.get(param_name, with_description)
 
 
 class SingletonInstance:
@@ -64,3 +64,8 @@ class DuplicateKeyException(ApiBaseException):
 class InvalidValueException(ApiBaseException):
     def __init__(self, message, error_code):
         super().__init__(message, error_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+
+class DeadlineExceededException(ApiBaseException):
+    def __init__(self, message, error_code):
+        super().__init__(message, error_code, HTTPStatus.GATEWAY_TIMEOUT)
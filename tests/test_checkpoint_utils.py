@@ -0,0 +1,31 @@
+import struct
+
+from util import checkpoint_utils
+from util.checkpoint_utils import load_checkpoint, register_checkpoint, save_checkpoint
+
+
+def test_checkpoint_round_trip(tmp_path):
+    restored = {}
+    register_checkpoint('test-round-trip', lambda: {'value': 1}, restored.update)
+    try:
+        assert save_checkpoint(str(tmp_path)) is not None
+        assert 'test-round-trip' in load_checkpoint(str(tmp_path), 60)
+        assert restored == {'value': 1}
+    finally:
+        checkpoint_utils._sections.pop('test-round-trip')
+
+
+def test_checkpoint_with_other_format_version_is_ignored(tmp_path):
+    restored = {}
+    register_checkpoint('test-version', lambda: {'value': 1}, restored.update)
+    try:
+        path = save_checkpoint(str(tmp_path))
+        # 이전 형식 버전(hash() 로 만든 변경 이력 해시를 담은 파일)으로 바꾼다.
+        with open(path, 'r+b') as f:
+            f.seek(4)
+            f.write(struct.pack('<H', checkpoint_utils.CHECKPOINT_FORMAT_VERSION - 1))
+
+        assert load_checkpoint(str(tmp_path), 60) == []
+        assert restored == {}
+    finally:
+        checkpoint_utils._sections.pop('test-version')
@@ -0,0 +1,49 @@
+import types
+
+import pytest
+
+from api.gold import services
+from api.gold.services import GoldPriceService
+from tests.test_history_store import make_store
+
+MAX_AGE_SECS = 10.0
+
+
+@pytest.fixture
+def quotes(monkeypatch):
+    # 일별 시세 이력은 고정 페이지, 현재가는 호출 수를 세는 가짜 조회로 바꾸고 시계를 직접 움직인다.
+    state = types.SimpleNamespace(calls=0, now=1_700_000_000.0, available=True)
+
+    def get_current_price(deadline=None):
+        state.calls += 1
+        if not state.available:
+            return dict(GoldPriceService.EMPTY_PRICE_INFO)
+        return {'current_price': f'3,4{state.calls:02d}.50'}
+
+    monkeypatch.setattr(services, 'time', types.SimpleNamespace(time=lambda: state.now))
+    monkeypatch.setattr(GoldPriceService, '_history', make_store())
+    monkeypatch.setattr(GoldPriceService, '_latest_quote', None)
+    monkeypatch.setattr(GoldPriceService, '_get_current_price', staticmethod(get_current_price))
+    return state
+
+
+def test_latest_price_reuses_refetched_quote_until_max_age(quotes):
+    assert GoldPriceService.get_latest_price(MAX_AGE_SECS)['current_price'] == '3,401.50'
+
+    # 오래된 레코드를 다시 조회하면 그 결과를 레코드로 남겨, 다음 max_age_secs 동안은 다시 조회하지 않는다.
+    quotes.now += MAX_AGE_SECS + 1
+    assert GoldPriceService.get_latest_price(MAX_AGE_SECS)['current_price'] == '3,402.50'
+    quotes.now += MAX_AGE_SECS / 2
+    assert GoldPriceService.get_latest_price(MAX_AGE_SECS)['current_price'] == '3,402.50'
+    assert quotes.calls == 2
+    assert GoldPriceService._latest_quote[1] == quotes.now - MAX_AGE_SECS / 2
+
+
+def test_latest_price_does_not_keep_unavailable_quote(quotes):
+    quotes.available = False
+    assert GoldPriceService.get_latest_price(MAX_AGE_SECS)['current_price'] == 'N/A'
+    assert GoldPriceService._latest_quote is None
+
+    quotes.available = True
+    assert GoldPriceService.get_latest_price(MAX_AGE_SECS)['current_price'] == '3,402.50'
+    assert quotes.calls == 2
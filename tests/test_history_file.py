@@ -0,0 +1,108 @@
+import math
+import os
+
+import pytest
+
+from tests import test_history_store
+from tests.test_history_store import make_store
+from util.history_file_utils import (MISSING_INT, HISTORY_FILE_FORMAT_VERSION, HistoryFile, append_history_file,
+                                     write_history_file)
+
+HEADER_SIZE = 32
+RECORD_SIZE = 56
+NEWEST = '2025-08-25'
+
+
+def sync_without_newest_day(path: str, monkeypatch) -> int:
+    # 최신 거래일(2025-08-25)이 아직 없는 업스트림으로 이력 파일을 만든다.
+    columns = {name: values[1:] for name, values in test_history_store.PAGES[1].items()}
+    with monkeypatch.context() as patch:
+        patch.setitem(test_history_store.PAGES, 1, columns)
+        return make_store().sync_history_file(path)
+
+
+def test_sync_writes_then_appends_and_refresh_remaps(tmp_path, monkeypatch):
+    path = str(tmp_path / 'gold.bin')
+
+    assert sync_without_newest_day(path, monkeypatch) == 9
+    history = HistoryFile(path)
+    assert (len(history), history.first_date(), history.last_date()) == (9, '2025-08-12', '2025-08-22')
+    assert history.instrument == 'gold'
+    before = history.between()
+
+    # 새 거래일만 덧붙이고, 같은 이력으로 다시 동기화하면 아무것도 쓰지 않는다.
+    assert make_store().sync_history_file(path) == 1
+    assert make_store().sync_history_file(path) == 0
+    assert os.path.getsize(path) == HEADER_SIZE + 10 * RECORD_SIZE
+
+    assert history.refresh()
+    assert not history.refresh()
+    assert (len(history), history.last_date()) == (10, NEWEST)
+    assert len(before) == 9
+    bars = history.between('2025-08-21', NEWEST)
+    assert bars['date'].tolist() == [20250821, 20250822, 20250825]
+    assert bars['close'].tolist() == [3390.0, 3400.1, 3412.5]
+    assert bars['volume'].tolist() == [100, 110, 120]
+    # 이력에 없는 필드는 float 은 NaN, 정수는 MISSING_INT
+    assert all(math.isnan(value) for value in bars['open'])
+    assert bars['value'].tolist() == [MISSING_INT] * 3
+
+
+def test_refresh_remaps_replaced_file(tmp_path):
+    path = str(tmp_path / 'gold.bin')
+    make_store().sync_history_file(path)
+    history = HistoryFile(path)
+    old_view = history.between()
+
+    write_history_file(path, 'gold', [{'date': '2025-08-25', 'close': 1.0}])
+
+    assert history.refresh()
+    assert len(history) == 1
+    assert history.between()['close'].tolist() == [1.0]
+    # 교체 전에 만든 뷰는 이전 매핑을 계속 읽는다.
+    assert len(old_view) == 10
+
+
+def test_torn_trailing_record_is_ignored_then_truncated(tmp_path, monkeypatch):
+    path = str(tmp_path / 'gold.bin')
+    sync_without_newest_day(path, monkeypatch)
+    with open(path, 'ab') as f:
+        f.write(b'\x01' * (RECORD_SIZE // 2))
+
+    history = HistoryFile(path)
+    assert (len(history), history.last_date()) == (9, '2025-08-22')
+
+    assert make_store().sync_history_file(path) == 1
+    assert os.path.getsize(path) == HEADER_SIZE + 10 * RECORD_SIZE
+    history.refresh()
+    assert history.between()['date'].tolist()[-2:] == [20250822, 20250825]
+
+
+def test_between_returns_read_only_view(tmp_path):
+    path = str(tmp_path / 'gold.bin')
+    make_store().sync_history_file(path)
+
+    bars = HistoryFile(path).between('2025-08-14', '2025-08-20')
+
+    assert bars['date'].tolist() == [20250814, 20250815, 20250818, 20250819, 20250820]
+    assert bars.flags.owndata is False
+    assert bars.flags.writeable is False
+    assert bars['close'].flags.owndata is False
+    with pytest.raises(ValueError):
+        bars['close'][0] = 0.0
+
+
+def test_rejects_other_format_version(tmp_path):
+    path = str(tmp_path / 'gold.bin')
+    make_store().sync_history_file(path)
+    with open(path, 'r+b') as f:
+        f.seek(4)
+        f.write((HISTORY_FILE_FORMAT_VERSION + 1).to_bytes(2, 'little'))
+
+    with pytest.raises(ValueError):
+        HistoryFile(path)
+    with pytest.raises(ValueError):
+        append_history_file(path, [{'date': '2025-08-26', 'close': 1.0}])
+    # 형식이 다른 파일은 이력 전체로 다시 만든다.
+    assert make_store().sync_history_file(path) == 10
+    assert len(HistoryFile(path)) == 10
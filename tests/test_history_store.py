@@ -0,0 +1,87 @@
+import os
+import pickle
+import subprocess
+import sys
+
+from api.market.models import HistoryStore, PriceSeries, rows_to_columns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 최신순 2페이지(페이지마다 5거래일)의 일별 시세
+PAGES = {
+    1: {'date': ['2025-08-25', '2025-08-22', '2025-08-21', '2025-08-20', '2025-08-19'],
+        'close': [3412.5, 3400.1, 3390.0, 3385.2, 3380.0],
+        'volume': [120, 110, 100, 90, 80]},
+    2: {'date': ['2025-08-18', '2025-08-15', '2025-08-14', '2025-08-13', '2025-08-12'],
+        'close': [3370.0, 3365.5, 3360.0, 3355.1, 3350.0],
+        'volume': [70, 60, 50, 40, 30]}
+}
+
+# 다른 PYTHONHASHSEED 로 실행한 프로세스에서 체크포인트 상태를 복원하고 같은 페이지를 다시 읽는다.
+RESTORE_SCRIPT = '''
+import pickle, sys
+sys.path.insert(0, sys.argv[1])
+from tests.test_history_store import make_store
+store = make_store()
+with open(sys.argv[2], 'rb') as f:
+    state = pickle.load(f)
+store.restore_state(state['history'])
+changes = store.get_changes(token=state['token'])
+print(changes['count'], changes['token'])
+'''
+
+
+def make_store() -> HistoryStore:
+    def load_page(page, deadline=None):
+        columns = PAGES.get(page, PAGES[2])
+        rows = [{'date': date.replace('-', '.'), 'closing_price': f'{close:,.2f}'}
+                for date, close in zip(columns['date'], columns['close'])]
+        return PriceSeries('gold', {name: list(values) for name, values in columns.items()}, rows)
+    return HistoryStore('gold', load_page, max_pages=len(PAGES) + 1)
+
+
+def test_get_changes_returns_nothing_for_unchanged_bars():
+    store = make_store()
+    token = store.get_changes(since='2025-08-12')['token']
+
+    changes = store.get_changes(token=token)
+
+    assert changes['count'] == 0
+    assert changes['token'] == token
+
+
+def test_get_series_spans_pages_like_iter_bars():
+    store = make_store()
+
+    series = store.get_series('2025-08-14', '2025-08-21')
+
+    assert series.dates == ['2025-08-21', '2025-08-20', '2025-08-19', '2025-08-18', '2025-08-15', '2025-08-14']
+    assert list(series.bars()) == list(store.iter_bars('2025-08-14', '2025-08-21'))
+    assert [row['date'] for row in series.rows] == [date.replace('-', '.') for date in series.dates]
+
+
+def test_page_columns_match_page_rows():
+    store = make_store()
+    page = store.get_page(3, '2025-08-14', '2025-08-21', after='2025-08-20', fields=['closing_price', 'date'])
+
+    columns = rows_to_columns(page['daily_prices'], ['closing_price', 'date'], {'close': ('closing_price', float)})
+
+    assert list(columns) == ['closing_price', 'date']
+    assert columns['date'] == ['2025-08-19', '2025-08-18', '2025-08-15']
+    assert columns['closing_price'] == [3380.0, 3370.0, 3365.5]
+    assert page['next_cursor'] == '2025-08-15'
+
+
+def test_restored_revisions_match_under_different_hash_seed(tmp_path):
+    store = make_store()
+    token = store.get_changes(since='2025-08-12')['token']
+    state_path = tmp_path / 'state.pickle'
+    state_path.write_bytes(pickle.dumps({'history': store.export_state(), 'token': token}))
+
+    for seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run([sys.executable, '-c', RESTORE_SCRIPT, ROOT, str(state_path)],
+                                cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        count, next_token = result.stdout.split()[-2:]
+        assert count == '0'
+        assert next_token == token
@@ -0,0 +1,72 @@
+import json
+import types
+
+import pytest
+
+import contants
+from contants import SSM_GET_PARAMETERS_MAX_NAMES, SSM_STUB_ENV, LazyParameter, ParameterStore
+
+PARAMETERS = {f'/test/param-{index:02d}': f'value-{index:02d}' for index in range(23)}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # ParameterStore 가 캐시 만료를 판단하는 time.monotonic() 대신 사용하는 시계
+    state = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(contants, 'time', types.SimpleNamespace(monotonic=lambda: state.now))
+    return state
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch, clock):
+    # FINANCE_SSM_STUB 스텁 파일을 읽는 ParameterStore(등록된 파라미터 전체)
+    stub_path = tmp_path / 'ssm-stub.json'
+    stub_path.write_text(json.dumps(PARAMETERS), encoding='utf-8')
+    monkeypatch.setenv(SSM_STUB_ENV, str(stub_path))
+    store = ParameterStore(ttl_secs=60)
+    store.register(*PARAMETERS)
+    return store
+
+
+def test_registered_parameters_are_loaded_in_batches(store):
+    assert store.get('/test/param-00') == 'value-00'
+
+    batches = -(-len(PARAMETERS) // SSM_GET_PARAMETERS_MAX_NAMES)
+    assert store._client.calls == batches
+    # 등록된 파라미터는 처음 조회할 때 함께 읽었으므로 다시 호출하지 않는다.
+    assert [store.get(name) for name in PARAMETERS] == list(PARAMETERS.values())
+    assert store._client.calls == batches
+
+
+def test_expired_parameters_are_reloaded_once(store, clock):
+    store.get('/test/param-00')
+    calls = store._client.calls
+
+    clock.now += 30
+    store.get('/test/param-01')
+    assert store._client.calls == calls
+
+    clock.now += 31
+    assert store.get('/test/param-01') == 'value-01'
+    assert store.get('/test/param-22') == 'value-22'
+    assert store._client.calls == calls * 2
+
+
+def test_missing_parameter_raises_key_error(store):
+    with pytest.raises(KeyError):
+        store.get('/test/missing')
+    # 없는 파라미터가 있어도 함께 조회한 다른 파라미터는 캐시된다.
+    calls = store._client.calls
+    assert store.get('/test/param-05') == 'value-05'
+    assert store._client.calls == calls
+
+
+def test_lazy_parameter_is_resolved_on_first_access(store, monkeypatch):
+    monkeypatch.setattr(contants, 'parameter_store', store)
+
+    class Settings:
+        SECRET = LazyParameter('/test/param-07')
+
+    assert store._client is None
+    assert Settings.SECRET == 'value-07'
+    assert store._client.calls == -(-len(PARAMETERS) // SSM_GET_PARAMETERS_MAX_NAMES)
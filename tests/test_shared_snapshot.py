@@ -0,0 +1,150 @@
+import contextlib
+import types
+
+import pytest
+
+from api.market import services
+from api.market.models import PriceSeries
+from api.market.services import SharedSnapshotService
+from contants import S3_STUB_ENV
+from util import s3_utils
+
+FRESH_SECS = 10.0
+MAX_STALE_SECS = 120.0
+
+
+class Clock:
+    # SharedSnapshotService 가 사용하는 time.time()/time.monotonic() 대신 사용하는 시계
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def advance(self, secs: float):
+        self.now += secs
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class Worker:
+    # 프로세스마다 따로 가지는 SharedSnapshotService 의 상태를 바꿔 끼워 워커 하나를 흉내낸다.
+    def __init__(self, name: str):
+        self.state = {'_worker_id': name, '_local': {}, '_backoff_until': 0.0}
+
+    @contextlib.contextmanager
+    def active(self):
+        saved = {name: getattr(SharedSnapshotService, name) for name in self.state}
+        for name, value in self.state.items():
+            setattr(SharedSnapshotService, name, value)
+        try:
+            yield
+        finally:
+            for name in self.state:
+                self.state[name] = getattr(SharedSnapshotService, name)
+                setattr(SharedSnapshotService, name, saved[name])
+
+    def get_snapshot(self):
+        with self.active():
+            return SharedSnapshotService.get_snapshot('test')
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    # 로컬 S3(FINANCE_S3_STUB)를 공유하는 워커들과, 호출 수를 세는 업스트림 builder
+    monkeypatch.setenv(S3_STUB_ENV, str(tmp_path))
+    monkeypatch.setattr(s3_utils, 'cache_client', None)
+    clock = Clock()
+    monkeypatch.setattr(services, 'time', types.SimpleNamespace(time=clock.time, monotonic=clock.monotonic))
+    monkeypatch.setattr(SharedSnapshotService, '_shared_memory', None)
+    monkeypatch.setattr(SharedSnapshotService, '_builders', {})
+    monkeypatch.setattr(SharedSnapshotService, '_locks', {})
+    for name, value in (('_enabled', False), ('_fresh_secs', 0.0), ('_max_stale_secs', 0.0), ('_bucket', None)):
+        monkeypatch.setattr(SharedSnapshotService, name, value)
+    SharedSnapshotService.configure(True, FRESH_SECS, MAX_STALE_SECS)
+
+    state = types.SimpleNamespace(calls=0, failing=False, clock=clock, root=tmp_path)
+
+    def build(deadline=None):
+        state.calls += 1
+        if state.failing:
+            raise ConnectionError('upstream down')
+        series = PriceSeries('test', {'date': ['2025-08-25'], 'close': [100.0 + state.calls]},
+                             [{'date': '2025.08.25', 'closing_price': f'{100 + state.calls}'}])
+        return {'realtime': {'current_price': str(100 + state.calls)}, 'daily': series}
+
+    SharedSnapshotService.register('test', build)
+    return state
+
+
+def test_conditional_put_creates_object_only_once(upstream):
+    assert s3_utils.put_object_contents(b'first', 'test/object', if_none_match='*') is not None
+    assert s3_utils.put_object_contents(b'second', 'test/object', if_none_match='*') is None
+    assert s3_utils.get_object_contents('test/object')['body'] == b'first'
+
+
+def test_only_one_worker_is_elected_per_refresh_slot(upstream):
+    workers = [Worker(f'worker-{index}') for index in range(3)]
+    elected = []
+    for worker in workers:
+        with worker.active():
+            elected.append(SharedSnapshotService._try_elect('test'))
+    assert elected == [True, False, False]
+
+    upstream.clock.advance(FRESH_SECS)
+    with workers[2].active():
+        assert SharedSnapshotService._try_elect('test')
+
+
+def test_conditional_put_overwrites_only_matching_etag(upstream):
+    etag = s3_utils.put_object_contents(b'first', 'test/object')
+    assert s3_utils.put_object_contents(b'second', 'test/object', if_match=etag) is not None
+    assert s3_utils.put_object_contents(b'third', 'test/object', if_match=etag) is None
+    assert s3_utils.get_object_contents('test/object')['body'] == b'second'
+
+
+def test_election_keeps_a_single_object_across_idle_slots(upstream):
+    worker = Worker('worker')
+    for _ in range(5):
+        worker.get_snapshot()
+        upstream.clock.advance(FRESH_SECS * 3 + 1)
+
+    assert upstream.calls == 5
+    election_objects = [path for path in upstream.root.rglob('refresher*') if path.is_file()]
+    assert len(election_objects) <= 1
+
+
+def test_second_worker_reads_snapshot_written_by_first(upstream):
+    refresher, reader = Worker('refresher'), Worker('reader')
+
+    written = refresher.get_snapshot()
+    read = reader.get_snapshot()
+
+    assert upstream.calls == 1
+    assert read['version'] == written['version']
+    assert read['realtime'] == {'current_price': '101'}
+    assert read['daily'].columns == written['daily'].columns
+
+    # 스냅샷이 오래되면 두 워커 중 선출된 하나만 업스트림을 조회하고, 다른 워커는 새 스냅샷을 읽는다.
+    upstream.clock.advance(FRESH_SECS + 1)
+    refreshed = reader.get_snapshot()
+    assert refresher.get_snapshot()['version'] == refreshed['version']
+    assert upstream.calls == 2
+    assert refreshed['realtime'] == {'current_price': '102'}
+
+
+def test_stale_snapshot_is_used_until_max_stale(upstream):
+    refresher, reader = Worker('refresher'), Worker('reader')
+    written = refresher.get_snapshot()
+    upstream.failing = True
+
+    # 갱신에 실패해도(선출된 워커) 또는 선출되지 않아도(다른 워커) max_stale_secs 안의 스냅샷을 사용한다.
+    upstream.clock.advance(FRESH_SECS * 6)
+    assert refresher.get_snapshot()['version'] == written['version']
+    assert reader.get_snapshot()['version'] == written['version']
+
+    # max_stale_secs 를 넘으면 None 을 반환해 호출하는 쪽이 업스트림을 직접 조회하게 한다.
+    upstream.clock.advance(MAX_STALE_SECS)
+    assert refresher.get_snapshot() is None
+    assert reader.get_snapshot() is None
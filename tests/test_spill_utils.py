@@ -0,0 +1,66 @@
+import os
+import types
+
+import pytest
+
+from contants import S3_STUB_ENV
+from util import s3_utils, spill_utils
+
+BODY = b'{"status":"success","data":[' + b'1,' * 1000 + b'1]}'
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    # 로컬 S3(FINANCE_S3_STUB)와, 실제 시각에서 offset 만큼 옮길 수 있는 spill_utils 의 시계
+    monkeypatch.setenv(S3_STUB_ENV, str(tmp_path))
+    monkeypatch.setattr(s3_utils, 'cache_client', None)
+    monkeypatch.setattr(spill_utils, '_spilled_keys', type(spill_utils._spilled_keys)())
+    clock = types.SimpleNamespace(offset=0.0)
+    real_time = spill_utils.time.time
+    monkeypatch.setattr(spill_utils, 'time', types.SimpleNamespace(time=lambda: real_time() + clock.offset))
+    spill_utils.spill_body(BODY, 'application/json')
+    clock.client = s3_utils.cache_client[s3_utils.DEFAULT_REGION]
+    return clock
+
+
+def _object_path(url: str) -> str:
+    return url[len('file://'):].split('?')[0]
+
+
+def test_same_body_is_stored_once(stub):
+    url = spill_utils.spill_body(BODY, 'application/json')
+
+    assert stub.client.calls['put_object'] == 1
+    with open(_object_path(url), 'rb') as f:
+        assert f.read() == BODY
+
+
+def test_object_stored_by_other_worker_is_reused(stub):
+    spill_utils._spilled_keys.clear()
+
+    spill_utils.spill_body(BODY, 'application/json')
+
+    assert stub.client.calls['head_object'] == 2
+    assert stub.client.calls['put_object'] == 1
+
+
+def test_old_object_is_stored_again(stub):
+    url = spill_utils.spill_body(BODY, 'application/json')
+    os.remove(_object_path(url))
+
+    # 기억한 키는 SPILL_REUSE_SECS 가 지나면 버리고, 오래된(수명 주기 규칙이 지운) 객체는 다시 저장한다.
+    stub.offset = spill_utils.SPILL_REUSE_SECS + 1
+    url = spill_utils.spill_body(BODY, 'application/json')
+
+    assert stub.client.calls['put_object'] == 2
+    assert os.path.exists(_object_path(url))
+
+
+def test_old_object_stored_by_other_worker_is_stored_again(stub):
+    spill_utils._spilled_keys.clear()
+
+    # 다른 워커가 저장한 객체가 SPILL_REUSE_SECS 보다 오래되었으면 재사용하지 않는다.
+    stub.offset = spill_utils.SPILL_REUSE_SECS + 1
+    spill_utils.spill_body(BODY, 'application/json')
+
+    assert stub.client.calls['put_object'] == 2
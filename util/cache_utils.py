@@ -0,0 +1,105 @@
+"""
+  HTTP 캐시(ETag, Cache-Control) 관련 유틸리티 모듈
+  요청 처리 중에 사용한 업스트림 데이터의 버전(일별 시세 테이블, 실시간 시세의 본문 해시 또는 ETag)을 기록해 두었다가
+  그 버전들로 응답의 strong ETag 를 만들고, If-None-Match 가 일치하면 304 Not Modified 로 응답한다.
+  Cache-Control max-age 는 사용한 업스트림 데이터 중 가장 오래된 것의 남은 유효 시간으로 정한다.
+"""
+import functools
+import hashlib
+import time
+from typing import Optional
+
+from flask import Response, current_app, g, has_request_context, request
+
+# 압축 응답의 ETag 에 붙이는 인코딩 접미사(util.compression_utils 참고)
+ENCODING_SUFFIXES = ('-br', '-gzip')
+
+
+def record_data_version(source: str, version: str, validated_at: float):
+    """
+    현재 요청에서 사용한 업스트림 데이터의 버전을 기록한다. 요청 컨텍스트 밖에서는 아무것도 하지 않는다.
+    :param source: 데이터 출처(업스트림 URL 등)
+    :param version: 데이터 버전(ETag 또는 본문 해시)
+    :param validated_at: 업스트림에서 마지막으로 확인한 시각(time.time())
+    """
+    if not has_request_context() or g.get('data_versions_pinned'):
+        return
+    versions = g.setdefault('data_versions', {})
+    versions[source] = (version, validated_at)
+
+
+def pin_data_version(source: str, version: str, validated_at: float):
+    """
+    현재 요청의 데이터 버전을 주어진 버전 하나로 고정한다. 요청 컨텍스트 밖에서는 아무것도 하지 않는다.
+    메모리의 레코드로 응답할 때, 레코드 갱신 여부(업스트림을 읽었는지)와 관계없이 같은 데이터면 같은 ETag 가 되도록 한다.
+    :param source: 데이터 출처(레코드 이름 등)
+    :param version: 데이터 버전
+    :param validated_at: 데이터를 마지막으로 확인한 시각(time.time())
+    """
+    if not has_request_context():
+        return
+    g.data_versions = {source: (version, validated_at)}
+    g.data_versions_pinned = True
+
+
+def _compute_etag(versions: dict, mimetype: str) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(request.full_path.encode('utf-8'))
+    hasher.update(mimetype.encode('utf-8'))
+    for source in sorted(versions):
+        hasher.update(f'{source}={versions[source][0]}'.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def _matched_etag(etag: str) -> Optional[str]:
+    # 압축 응답으로 받은 ETag(접미사 포함)도 같은 데이터로 보고, 클라이언트가 보낸 값을 그대로 돌려준다.
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return None
+    if if_none_match.star_tag:
+        return etag
+    for tag in if_none_match.as_set(include_weak=True):
+        base = tag
+        for suffix in ENCODING_SUFFIXES:
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+                break
+        if base == etag:
+            return tag
+    return None
+
+
+def conditional_get(max_age_config: str):
+    """
+    응답에 업스트림 데이터 버전 기반의 strong ETag 와 Cache-Control 을 붙이고,
+    If-None-Match 가 일치하면 본문 없이 304 로 응답하는 데코레이터(fast_marshal_with 바깥에 적용한다).
+    :param max_age_config: 데이터의 유효 시간(초)을 담은 설정 키
+    :return: 데코레이터
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            response = func(*args, **kwargs)
+            versions = g.get('data_versions')
+            if not isinstance(response, Response) or response.status_code != 200 or not versions:
+                return response
+
+            etag = _compute_etag(versions, response.mimetype)
+            age = time.time() - min(validated_at for _, validated_at in versions.values())
+            max_age = max(0, int(current_app.config[max_age_config] - age))
+
+            matched = _matched_etag(etag)
+            if matched is not None:
+                not_modified = Response(status=304)
+                not_modified.vary.update(response.vary)
+                not_modified.vary.add('Accept-Encoding')
+                response, etag = not_modified, matched
+
+            response.set_etag(etag)
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            return response
+
+        return wrapper
+
+    return decorator
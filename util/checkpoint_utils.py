@@ -0,0 +1,175 @@
+"""
+  프로세스 메모리 캐시의 체크포인트 관련 유틸리티 모듈
+  업스트림 캐시, 일별 시세 이력, 대시보드 스냅샷 등 각 캐시가 이름(section)과 내보내기/복원 함수를 등록해 두면,
+  등록된 캐시 전체를 압축한 파일 하나로 저장하고 새 프로세스가 시작할 때 다시 채운다.
+  같은 컨테이너에서 프로세스가 다시 시작되거나(Lambda 실행 환경 재시작 포함) EFS 같은 공유 디렉터리를 지정한 경우
+  업스트림을 다시 조회하지 않고 캐시가 채워진 상태로 시작한다.
+  파일은 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace 로 바꾸므로, 쓰는 도중에 중단되어도 읽는 쪽은 이전 파일이나 새 파일 전체만 본다.
+  파일 형식: MAGIC(4) + 형식 버전(uint16) + 생성 시각(float64, time.time()) + zlib(pickle({section: 상태}))
+"""
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from util.logging_util import logger
+
+CHECKPOINT_MAGIC = b'FBCK'
+# 저장하는 상태의 구조나 의미가 바뀌면 올린다. 버전이 다른 파일은 읽지 않는다.
+# 2: 일별 시세 변경 이력의 해시를 프로세스마다 다른 hash() 에서 내용 해시(blake2b)로 변경
+CHECKPOINT_FORMAT_VERSION = 2
+CHECKPOINT_FILE_NAME = 'cache-checkpoint.bin'
+
+_HEADER = struct.Struct('<4sHd')
+
+_sections: Dict[str, Tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+_save_lock = threading.Lock()
+_last_saved_at: Optional[float] = None
+
+
+def register_checkpoint(section: str, export: Callable[[], Any], restore: Callable[[Any], None]):
+    """
+    체크포인트에 포함할 캐시를 등록한다.
+    :param section: 캐시 이름(파일 안의 키)
+    :param export: 저장할 상태(pickle 가능한 값, 저장할 것이 없으면 None)를 반환하는 함수
+    :param restore: 저장했던 상태를 받아 캐시를 채우는 함수
+    """
+    _sections[section] = (export, restore)
+
+
+def _checkpoint_path(directory: str) -> str:
+    return os.path.join(directory, CHECKPOINT_FILE_NAME)
+
+
+def save_checkpoint(directory: str) -> Optional[str]:
+    """
+    등록된 캐시의 상태를 체크포인트 파일로 저장한다(임시 파일에 쓴 뒤 원자적으로 교체).
+    :param directory: 체크포인트 디렉터리(없으면 만든다)
+    :return: 저장한 파일 경로, 실패하면 None
+    """
+    global _last_saved_at
+    with _save_lock:
+        started = time.monotonic()
+        states = {}
+        for section, (export, _) in _sections.items():
+            try:
+                state = export()
+            except Exception as e:
+                logger.error(f"체크포인트 {section} 내보내기 실패: {str(e)}")
+                continue
+            if state is not None:
+                states[section] = state
+
+        path = _checkpoint_path(directory)
+        temp_path = None
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            payload = zlib.compress(pickle.dumps(states, protocol=pickle.HIGHEST_PROTOCOL), 6)
+            fd, temp_path = tempfile.mkstemp(prefix='.checkpoint-', dir=directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_FORMAT_VERSION, time.time()))
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.error(f"체크포인트 저장 실패: {str(e)}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+        _last_saved_at = time.monotonic()
+        logger.info(f"체크포인트 저장 - {', '.join(states)} ({len(payload)} bytes, "
+                    f"{(time.monotonic() - started) * 1000:.0f}ms)")
+        return path
+
+
+def save_checkpoint_in_background(directory: str, interval_secs: float) -> bool:
+    """
+    마지막 저장 후 interval_secs 가 지났으면 백그라운드 스레드에서 체크포인트를 저장한다(요청 처리 후 호출용).
+    :param directory: 체크포인트 디렉터리
+    :param interval_secs: 최소 저장 간격(초)
+    :return: 저장을 시작했으면 True
+    """
+    global _last_saved_at
+    with _save_lock:
+        if _last_saved_at is not None and time.monotonic() - _last_saved_at < interval_secs:
+            return False
+        # 저장이 끝나기 전에 다른 요청이 또 저장하지 않도록 미리 시각을 갱신한다.
+        _last_saved_at = time.monotonic()
+
+    threading.Thread(target=save_checkpoint, args=(directory,), name='checkpoint-save', daemon=True).start()
+    return True
+
+
+def load_checkpoint(directory: str, max_age_secs: float) -> List[str]:
+    """
+    체크포인트 파일이 있고 max_age_secs 보다 새로우면 등록된 캐시를 파일의 상태로 채운다.
+    형식 버전이 다르거나, 다른 사용자가 만들었거나, 읽을 수 없는 파일은 무시한다.
+    :param directory: 체크포인트 디렉터리
+    :param max_age_secs: 사용할 체크포인트의 최대 나이(초)
+    :return: 복원한 section 목록(복원하지 않았으면 빈 목록)
+    """
+    path = _checkpoint_path(directory)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return []
+    # 공유 디렉터리(/tmp)에서 다른 사용자가 만든 파일은 pickle 로 읽지 않는다.
+    if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+        logger.warning(f"체크포인트 파일의 소유자가 다름 - 무시: {path}")
+        return []
+
+    try:
+        with open(path, 'rb') as f:
+            magic, version, created_at = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_FORMAT_VERSION:
+                logger.info(f"체크포인트 형식 버전이 다름({version}) - 무시: {path}")
+                return []
+            age = time.time() - created_at
+            if age > max_age_secs:
+                logger.info(f"체크포인트가 오래됨({age:.0f}s) - 무시: {path}")
+                return []
+            states = pickle.loads(zlib.decompress(f.read()))
+    except Exception as e:
+        logger.warning(f"체크포인트 읽기 실패 - 무시: {str(e)}")
+        return []
+
+    restored = []
+    for section, state in states.items():
+        if section not in _sections:
+            continue
+        try:
+            _sections[section][1](state)
+            restored.append(section)
+        except Exception as e:
+            logger.error(f"체크포인트 {section} 복원 실패: {str(e)}")
+    logger.info(f"체크포인트 복원 - {', '.join(restored)} (생성 후 {age:.0f}s)")
+    return restored
+
+
+def init_checkpoint(app) -> List[str]:
+    """
+    시작 시 체크포인트로 캐시를 채우고, 요청 처리 후 주기적으로 체크포인트를 저장하는 after_request 훅을 등록한다.
+    설정값:
+        CHECKPOINT_DIR: 체크포인트 디렉터리(None 이면 아무것도 하지 않는다)
+        CHECKPOINT_MAX_AGE_SECS: 시작 시 복원할 체크포인트의 최대 나이(초)
+        CHECKPOINT_INTERVAL_SECS: 요청 처리 후 저장하는 최소 간격(초)
+    :param app: Flask 애플리케이션
+    :return: 복원한 section 목록
+    """
+    directory = app.config.get('CHECKPOINT_DIR')
+    if not directory:
+        return []
+    interval_secs = app.config.get('CHECKPOINT_INTERVAL_SECS', 60)
+
+    @app.after_request
+    def checkpoint_caches(response):
+        save_checkpoint_in_background(directory, interval_secs)
+        return response
+
+    return load_checkpoint(directory, app.config.get('CHECKPOINT_MAX_AGE_SECS', 600))
@@ -0,0 +1,130 @@
+"""
+  응답 압축 관련 유틸리티 모듈
+  클라이언트의 Accept-Encoding 에 따라 응답 본문을 brotli(설치된 경우) 또는 gzip 으로 압축한다.
+  같은 본문은 압축 결과를 재사용하도록 본문 해시를 키로 압축 바이트를 캐시한다.
+"""
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from flask import Flask, Response, request
+
+from util.logging_util import logger
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 압축 대상 mimetype
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/vnd.finance.columnar+json',
+    'application/msgpack',
+    'application/x-msgpack',
+    'text/csv',
+    'text/html',
+    'text/css',
+    'text/javascript',
+    'application/javascript'
+}
+
+
+class CompressedBodyCache:
+    """
+    (인코딩, 본문 해시) -> 압축 바이트 LRU 캐시.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key, body: bytes):
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _select_encoding() -> Optional[str]:
+    accept_encodings = request.accept_encodings
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """
+    본문을 지정한 인코딩으로 압축한다.
+    :param body: 원본 바이트
+    :param encoding: 'br' 또는 'gzip'
+    :param level: gzip 압축 레벨(1~9). brotli 는 같은 비율의 quality(0~11)로 변환한다.
+    :return: 압축된 바이트
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=min(11, round(level * 11 / 9)))
+    # mtime 을 고정해야 같은 본문의 압축 결과가 항상 같다.
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def init_compression(app: Flask):
+    """
+    응답 압축을 after_request 훅으로 등록한다.
+    설정값:
+        COMPRESS_MIN_SIZE: 이 크기(바이트) 미만의 본문은 압축하지 않는다.
+        COMPRESS_LEVEL: gzip 압축 레벨
+        COMPRESS_CACHE_SIZE: 압축 바이트 캐시 항목 수(0 이면 캐시하지 않음)
+    :param app: Flask 애플리케이션
+    """
+    min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+    level = app.config.get('COMPRESS_LEVEL', 6)
+    cache_size = app.config.get('COMPRESS_CACHE_SIZE', 128)
+    cache = CompressedBodyCache(cache_size) if cache_size else None
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if (response.direct_passthrough or response.is_streamed
+                or not 200 <= response.status_code < 300 or response.status_code == 204
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = _select_encoding()
+        if encoding is None:
+            return response
+
+        body = response.get_data()
+        if len(body) < min_size:
+            return response
+
+        compressed = None
+        if cache is not None:
+            key = (encoding, level, hashlib.blake2b(body, digest_size=16).digest())
+            compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(body, encoding, level)
+            if cache is not None:
+                cache.put(key, compressed)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        # strong ETag 는 인코딩마다 달라야 하므로 접미사를 붙인다(util.cache_utils 에서 비교 시 제거).
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(f'{etag}-{encoding}')
+        logger.debug(f'compressed response {len(body)} -> {len(compressed)} bytes ({encoding})')
+        return response
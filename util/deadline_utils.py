@@ -0,0 +1,71 @@
+"""
+  요청 단위 데드라인(deadline) 관련 유틸리티 모듈
+  컨트롤러에서 요청마다 하나의 Deadline 을 만들고 서비스와 업스트림 호출에 전달하여
+  각 호출이 남은 시간 안에서만 대기하도록 한다.
+"""
+import time
+from typing import Optional, Union
+
+from flask import current_app, has_app_context
+
+from exceptions import DeadlineExceededException
+
+# API Gateway 통합 타임아웃(29초)보다 먼저 응답하기 위한 기본 요청 데드라인(초)
+DEFAULT_REQUEST_DEADLINE_SECS = 25.0
+
+Timeout = Union[None, float, tuple]
+
+
+class Deadline:
+    """
+    요청이 끝나야 하는 시각. time.monotonic() 기준으로 남은 시간을 계산한다.
+    """
+
+    def __init__(self, budget_secs: float):
+        """
+        :param budget_secs: 지금부터 허용되는 시간(초)
+        """
+        self.expires_at = time.monotonic() + budget_secs
+
+    def remaining(self) -> float:
+        """
+        :return: 남은 시간(초). 이미 지난 경우 0 이하
+        """
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self):
+        """
+        데드라인이 지났으면 DeadlineExceededException 을 발생시킨다.
+        """
+        if self.expired():
+            raise DeadlineExceededException('request deadline exceeded', 'DEADLINE_EXCEEDED')
+
+    def timeout(self, timeout: Timeout = None) -> Timeout:
+        """
+        requests 의 timeout 인자를 남은 시간으로 제한하여 반환한다.
+        :param timeout: 원래 타임아웃(초 또는 (연결, 응답) 튜플, None 이면 무제한)
+        :return: 남은 시간을 넘지 않는 타임아웃
+        """
+        self.check()
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+
+def request_deadline(budget_secs: Optional[float] = None) -> Deadline:
+    """
+    현재 요청에 사용할 데드라인을 만든다.
+    :param budget_secs: 허용 시간(초). None 이면 REQUEST_DEADLINE_SECS 설정값(없으면 기본값)을 사용한다.
+    :return: Deadline
+    """
+    if budget_secs is None:
+        budget_secs = DEFAULT_REQUEST_DEADLINE_SECS
+        if has_app_context():
+            budget_secs = current_app.config.get('REQUEST_DEADLINE_SECS', budget_secs)
+    return Deadline(budget_secs)
@@ -0,0 +1,605 @@
+"""
+  업스트림(네이버 금융 등) HTTP 조회에 관련된 유틸리티 모듈
+  - 지수 백오프(full jitter) 기반의 재시도 정책과 재시도 예산(retry budget)
+  - p95 지연 시간 이후에 두 번째 요청을 보내는 헤지 요청(hedged request)
+  - 요청 단위 데드라인과 마지막 정상 응답 캐시를 이용한 폴백
+  - ETag/Last-Modified 조건부 요청과 본문 해시 비교를 통한 파싱 결과 재사용
+  - 대상 테이블까지만 읽고 중단하는 스트리밍 테이블 추출
+"""
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from exceptions import DeadlineExceededException
+from util.cache_utils import record_data_version
+from util.checkpoint_utils import register_checkpoint
+from util.deadline_utils import Deadline
+from util.html_utils import TableRow, extract_element_text, extract_table_rows
+from util.logging_util import logger
+
+# 재시도/헤지 대상이 되는 멱등 HTTP 메소드
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 헤지 요청을 보낼 지연 시간 백분위
+HEDGE_PERCENTILE = 0.95
+
+# 남은 데드라인이 이 값(초)보다 작으면 업스트림을 호출하지 않고 캐시된 응답을 사용한다.
+MIN_FETCH_BUDGET_SECS = 1.0
+
+# URL 별로 보관할 업스트림 캐시 항목(마지막 정상 응답, 검증자, 파싱 결과)의 최대 개수
+MAX_CACHED_RESPONSES = 256
+
+
+class RetryPolicy:
+    """
+    재시도 정책.
+    재시도 간격은 min(max_delay, base_delay * 2^attempt) 범위 안에서 무작위로 정한다(full jitter).
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 2.0,
+                 retry_statuses: tuple = RETRYABLE_STATUS_CODES):
+        """
+        :param max_attempts: 최초 요청을 포함한 최대 시도 횟수
+        :param base_delay: 첫 번째 재시도의 최대 대기 시간(초)
+        :param max_delay: 재시도 대기 시간의 상한(초)
+        :param retry_statuses: 재시도할 HTTP 상태 코드 목록
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """
+        attempt 번째(0부터 시작) 재시도 전에 대기할 시간을 반환한다.
+        :param attempt: 재시도 순번
+        :return: 대기 시간(초)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    재시도 예산(토큰 버킷).
+    요청 1건마다 deposit_ratio 만큼 토큰이 적립되고 재시도(헤지 요청 포함) 1회마다 토큰 1개를 소모한다.
+    업스트림 장애 시 재시도가 전체 요청량을 (1 + deposit_ratio) 배 이상으로 증폭시키지 못하게 한다.
+    트래픽이 적을 때를 위해 초당 min_retries_per_sec 만큼은 시간에 비례해 토큰을 채운다.
+    """
+
+    def __init__(self, deposit_ratio: float = 0.1, min_retries_per_sec: float = 0.5, max_balance: float = 10.0):
+        """
+        :param deposit_ratio: 요청 1건당 적립되는 토큰 수
+        :param min_retries_per_sec: 시간에 비례해 채워지는 초당 토큰 수
+        :param max_balance: 적립할 수 있는 최대 토큰 수
+        """
+        self.deposit_ratio = deposit_ratio
+        self.min_retries_per_sec = min_retries_per_sec
+        self.max_balance = max_balance
+        self._balance = max_balance
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._balance = min(self.max_balance,
+                            self._balance + (now - self._updated_at) * self.min_retries_per_sec)
+        self._updated_at = now
+
+    def deposit(self):
+        """
+        요청 1건에 해당하는 토큰을 적립한다.
+        """
+        with self._lock:
+            self._refill()
+            self._balance = min(self.max_balance, self._balance + self.deposit_ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        재시도 1회에 해당하는 토큰을 소모한다.
+        :return: 토큰이 남아 있어 재시도가 가능하면 True
+        """
+        with self._lock:
+            self._refill()
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                return True
+            return False
+
+
+class UpstreamEntry:
+    """
+    URL 별 업스트림 캐시 항목.
+    마지막 정상 응답과 조건부 요청에 사용할 검증자(ETag, Last-Modified), 본문 해시와 그 파싱 결과를 보관한다.
+    스트리밍으로 읽은 응답은 본문 전체를 읽지 않으므로 response 없이 검증자와 파싱 결과만 보관한다.
+    """
+
+    def __init__(self, response: requests.Response, keep_response: bool = True):
+        self.response = response if keep_response else None
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.digest = None
+        self.parser_name = None
+        self.parsed = None
+        self.validated_at = time.time()
+        self._version = None
+
+    @property
+    def version(self) -> str:
+        """
+        데이터 버전. 보관한 응답이 있으면 업스트림 ETag 또는 응답 본문의 해시, 없으면(스트리밍) 읽은 바이트의 해시.
+        """
+        if self.response is None:
+            return self.digest or ''
+        if self._version is None:
+            self._version = self.etag or hashlib.blake2b(self.response.content, digest_size=16).hexdigest()
+        return self._version
+
+    def to_state(self) -> Dict:
+        """
+        체크포인트에 저장할 상태. 보관한 응답은 상태 코드, 헤더, 본문만 남긴다.
+        """
+        response = None
+        if self.response is not None:
+            response = {
+                'url': self.response.url,
+                'status_code': self.response.status_code,
+                'headers': dict(self.response.headers),
+                'content': self.response.content,
+                'encoding': self.response.encoding
+            }
+        return {
+            'response': response,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'digest': self.digest,
+            'parser_name': self.parser_name,
+            'parsed': self.parsed,
+            'validated_at': self.validated_at
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'UpstreamEntry':
+        entry = cls.__new__(cls)
+        entry.response = None
+        if state['response'] is not None:
+            response = requests.Response()
+            response.url = state['response']['url']
+            response.status_code = state['response']['status_code']
+            response.headers.update(state['response']['headers'])
+            response._content = state['response']['content']
+            response.encoding = state['response']['encoding']
+            entry.response = response
+        entry.etag = state['etag']
+        entry.last_modified = state['last_modified']
+        entry.digest = state['digest']
+        entry.parser_name = state['parser_name']
+        entry.parsed = state['parsed']
+        entry.validated_at = state['validated_at']
+        entry._version = None
+        return entry
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class LatencyTracker:
+    """
+    호스트별 최근 응답 지연 시간을 보관하고 백분위 값을 계산한다.
+    """
+
+    def __init__(self, window: int = 100, min_samples: int = 10):
+        """
+        :param window: 호스트별로 보관할 최근 샘플 수
+        :param min_samples: 백분위 값을 계산하기 위한 최소 샘플 수
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, elapsed: float):
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(elapsed)
+
+    def percentile(self, key: str, ratio: float) -> Optional[float]:
+        """
+        :param key: 호스트
+        :param ratio: 백분위(0~1)
+        :return: 백분위 지연 시간(초). 샘플이 부족하면 None
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * ratio))]
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+_latency_tracker = LatencyTracker()
+_upstream_entries = OrderedDict()
+_upstream_entries_lock = threading.Lock()
+_hedge_executor = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_executor_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hedged-request')
+    return _hedge_executor
+
+
+def _send(method: str, url: str, **kwargs) -> requests.Response:
+    started_at = time.monotonic()
+    response = requests.request(method, url, **kwargs)
+    _latency_tracker.record(urlsplit(url).netloc, time.monotonic() - started_at)
+    return response
+
+
+def _send_hedged(method: str, url: str, retry_budget: RetryBudget, **kwargs) -> requests.Response:
+    """
+    첫 번째 요청이 p95 지연 시간 안에 끝나지 않으면 두 번째 요청을 보내고 먼저 도착한 응답을 사용한다.
+    지연 시간 샘플이 부족하거나 재시도 예산이 없으면 헤지 요청을 보내지 않는다.
+    """
+    hedge_delay = _latency_tracker.percentile(urlsplit(url).netloc, HEDGE_PERCENTILE)
+    if hedge_delay is None:
+        return _send(method, url, **kwargs)
+
+    executor = _get_hedge_executor()
+    primary = executor.submit(_send, method, url, **kwargs)
+    try:
+        return primary.result(timeout=hedge_delay)
+    except FuturesTimeoutError:
+        pass
+
+    if not retry_budget.try_withdraw():
+        return primary.result()
+
+    logger.debug(f'hedged request: {method} {url} (delay:{hedge_delay:.3f}s)')
+    pending = {primary, executor.submit(_send, method, url, **kwargs)}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                return future.result()
+            except requests.RequestException as e:
+                error = e
+    raise error
+
+
+def request_with_retry(method: str, url: str, retry_policy: RetryPolicy = None, retry_budget: RetryBudget = None,
+                       hedge: bool = False, deadline: Deadline = None, **kwargs) -> requests.Response:
+    """
+    재시도 정책을 적용하여 HTTP 요청을 보낸다.
+    멱등 메소드(GET, HEAD, OPTIONS)만 재시도와 헤지 요청의 대상이며, 그 외 메소드는 1회만 호출한다.
+    연결 오류, 타임아웃, 재시도 대상 상태 코드만 재시도하며 재시도 예산이 소진되면 즉시 결과를 반환한다.
+    :param method: HTTP 메소드
+    :param url: 요청 URL
+    :param retry_policy: 재시도 정책(기본값 DEFAULT_RETRY_POLICY)
+    :param retry_budget: 재시도 예산(기본값 DEFAULT_RETRY_BUDGET)
+    :param hedge: p95 지연 시간 이후 헤지 요청 사용 여부
+    :param deadline: 요청 데드라인. 각 시도의 타임아웃을 남은 시간으로 제한하고, 남은 시간 안에 끝낼 수 없는 재시도는 하지 않는다.
+    :param kwargs: requests.request 에 전달할 인자(headers, params, timeout 등)
+    :return: 마지막 응답(raise_for_status 는 호출하지 않는다)
+    :raise requests.RequestException: 모든 시도가 예외로 실패한 경우 마지막 예외
+    :raise DeadlineExceededException: 시도 전에 데드라인이 지난 경우
+    """
+    policy = retry_policy or DEFAULT_RETRY_POLICY
+    budget = retry_budget or DEFAULT_RETRY_BUDGET
+    idempotent = method.upper() in IDEMPOTENT_METHODS
+    max_attempts = policy.max_attempts if idempotent else 1
+    timeout = kwargs.get('timeout')
+
+    budget.deposit()
+    attempt = 0
+    while True:
+        error = None
+        response = None
+        if deadline is not None:
+            kwargs['timeout'] = deadline.timeout(timeout)
+        try:
+            if hedge and idempotent:
+                response = _send_hedged(method, url, budget, **kwargs)
+            else:
+                response = _send(method, url, **kwargs)
+            if response.status_code not in policy.retry_statuses:
+                return response
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        attempt += 1
+        if attempt >= max_attempts or not budget.try_withdraw():
+            if error is not None:
+                raise error
+            return response
+
+        delay = policy.backoff(attempt - 1)
+        if deadline is not None and deadline.remaining() <= delay:
+            if error is not None:
+                raise error
+            return response
+
+        if response is not None:
+            response.close()
+        logger.warning(f'retry {attempt}/{max_attempts - 1} after {delay:.3f}s: {method} {url} '
+                       f'({error or response.status_code})')
+        time.sleep(delay)
+
+
+def get_with_retry(url: str, **kwargs) -> requests.Response:
+    """
+    재시도 정책을 적용하여 GET 요청을 보낸다. 인자는 request_with_retry 참조
+    """
+    return request_with_retry('GET', url, **kwargs)
+
+
+def _cache_key(url: str, params: Optional[dict]) -> str:
+    if not params:
+        return url
+    return requests.Request('GET', url, params=params).prepare().url
+
+
+def _get_entry(key: str) -> Optional[UpstreamEntry]:
+    with _upstream_entries_lock:
+        entry = _upstream_entries.get(key)
+        if entry is not None:
+            _upstream_entries.move_to_end(key)
+        return entry
+
+
+def _put_entry(key: str, entry: UpstreamEntry):
+    with _upstream_entries_lock:
+        _upstream_entries[key] = entry
+        _upstream_entries.move_to_end(key)
+        while len(_upstream_entries) > MAX_CACHED_RESPONSES:
+            _upstream_entries.popitem(last=False)
+
+
+def _export_entries() -> List:
+    with _upstream_entries_lock:
+        entries = list(_upstream_entries.items())
+    return [(key, entry.to_state()) for key, entry in entries] or None
+
+
+def _restore_entries(states: List):
+    # 이미 이 프로세스에서 조회한 항목은 더 최신이므로 덮어쓰지 않고, 복원한 항목은 LRU 순서상 그보다 앞에 둔다.
+    with _upstream_entries_lock:
+        for key, state in reversed(states):
+            if key not in _upstream_entries:
+                _upstream_entries[key] = UpstreamEntry.from_state(state)
+                _upstream_entries.move_to_end(key, last=False)
+        while len(_upstream_entries) > MAX_CACHED_RESPONSES:
+            _upstream_entries.popitem(last=False)
+
+
+register_checkpoint('upstream', _export_entries, _restore_entries)
+
+
+def _use_entry(key: str, entry: UpstreamEntry) -> UpstreamEntry:
+    # 현재 요청에서 사용한 업스트림 데이터의 버전을 기록한다(응답 ETag, Cache-Control 계산용).
+    record_data_version(key, entry.version, entry.validated_at)
+    return entry
+
+
+def fetch(url: str, headers: dict = None, params: dict = None, timeout: float = 10, deadline: Deadline = None,
+          hedge: bool = False, stream: bool = False, conditional: bool = False) -> requests.Response:
+    """
+    업스트림 페이지를 GET 으로 조회한다(재시도 정책 적용).
+    URL 별로 마지막 정상 응답을 보관해 두었다가 아래의 경우 그 응답을 대신 반환한다.
+      - 남은 데드라인이 MIN_FETCH_BUDGET_SECS 보다 작아 업스트림 호출을 생략하는 경우
+      - 재시도 후에도 연결 오류, 타임아웃, 5xx 응답으로 실패한 경우
+      - 조건부 요청에 업스트림이 304 Not Modified 로 응답한 경우
+    :param url: 요청 URL
+    :param headers: HTTP 헤더
+    :param params: 쿼리 파라미터
+    :param timeout: 시도별 타임아웃(초). deadline 이 있으면 남은 시간으로 제한된다.
+    :param deadline: 요청 데드라인
+    :param hedge: 헤지 요청 사용 여부
+    :param stream: 응답 본문을 스트리밍으로 읽을지 여부(스트리밍 응답은 캐시하지 않는다)
+    :param conditional: 보관된 ETag/Last-Modified 로 조건부 요청(If-None-Match/If-Modified-Since)을 보낼지 여부
+    :return: requests.Response
+    """
+    key = _cache_key(url, params)
+    entry = _get_entry(key)
+    if entry is not None and entry.response is None:
+        entry = None
+    if deadline is not None and deadline.remaining() < MIN_FETCH_BUDGET_SECS and entry is not None:
+        logger.warning(f'deadline is near({deadline.remaining():.3f}s), using cached response: {key}')
+        return _use_entry(key, entry).response
+
+    if conditional and entry is not None:
+        headers = {**(headers or {}), **entry.conditional_headers()}
+
+    try:
+        response = get_with_retry(url, headers=headers, params=params, timeout=timeout, deadline=deadline,
+                                  hedge=hedge, stream=stream)
+    except (requests.RequestException, DeadlineExceededException) as e:
+        if entry is None:
+            raise
+        logger.warning(f'upstream fetch failed({e}), using cached response: {key}')
+        return _use_entry(key, entry).response
+
+    if response.status_code == 304 and entry is not None:
+        response.close()
+        entry.validated_at = time.time()
+        return _use_entry(key, entry).response
+    if response.status_code >= 500 and entry is not None:
+        logger.warning(f'upstream returned {response.status_code}, using cached response: {key}')
+        response.close()
+        return _use_entry(key, entry).response
+    if response.status_code == 200 and not stream:
+        new_entry = UpstreamEntry(response)
+        if entry is not None:
+            # 본문이 바뀌지 않았다면 이전 파싱 결과를 재사용할 수 있도록 해시와 파싱 결과를 이어받는다.
+            new_entry.digest, new_entry.parser_name, new_entry.parsed = entry.digest, entry.parser_name, entry.parsed
+        _put_entry(key, new_entry)
+        _use_entry(key, new_entry)
+    return response
+
+
+def fetch_parsed(url: str, parser: Callable[[str], Any], headers: dict = None, params: dict = None,
+                 timeout: float = 10, deadline: Deadline = None, hedge: bool = False,
+                 encoding: str = None) -> Any:
+    """
+    업스트림 페이지를 조건부 요청으로 조회하고 parser 로 파싱한 결과를 반환한다.
+    304 응답이거나 본문 해시가 이전에 파싱한 본문과 같으면 파싱을 생략하고 이전 결과를 재사용한다.
+    반환값은 캐시와 공유되므로 호출하는 쪽에서 변경하지 않는다.
+    :param url: 요청 URL
+    :param parser: 응답 본문(str)을 받아 파싱 결과를 반환하는 함수
+    :param headers: HTTP 헤더
+    :param params: 쿼리 파라미터
+    :param timeout: 시도별 타임아웃(초)
+    :param deadline: 요청 데드라인
+    :param hedge: 헤지 요청 사용 여부
+    :param encoding: 응답 본문의 인코딩(None 이면 응답 헤더를 따른다)
+    :return: 파싱 결과
+    """
+    key = _cache_key(url, params)
+    response = fetch(url, headers=headers, params=params, timeout=timeout, deadline=deadline, hedge=hedge,
+                     conditional=True)
+    response.raise_for_status()
+
+    entry = _get_entry(key)
+    if entry is None or entry.response is not response:
+        # 캐시되지 않은 응답(예: 200 이외의 2xx)은 매번 파싱한다.
+        if encoding:
+            response.encoding = encoding
+        return parser(response.text)
+
+    parser_name = getattr(parser, '__qualname__', repr(parser))
+    digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+    if entry.parser_name == parser_name and entry.digest == digest:
+        return entry.parsed
+
+    if encoding:
+        response.encoding = encoding
+    parsed = parser(response.text)
+    entry.parser_name, entry.digest, entry.parsed = parser_name, digest, parsed
+    return parsed
+
+
+def _fetch_streamed(url: str, extract: Callable, parser: Callable, headers: dict, params: dict, timeout: float,
+                    deadline: Deadline, encoding: str, chunk_size: int) -> Any:
+    """
+    업스트림 페이지를 스트리밍으로 조회해 extract 로 필요한 부분만 읽고, 그 결과를 parser 로 파싱한다.
+    fetch_table, fetch_element_text 의 공통 구현이다.
+    :param extract: (바이트 청크, 인코딩)을 받아 (추출 결과, 읽은 바이트의 해시, 읽은 바이트 수)를 반환하는 함수
+    :param parser: 추출 결과를 받아 파싱 결과를 반환하는 함수
+    :return: 파싱 결과
+    """
+    key = _cache_key(url, params)
+    parser_name = getattr(parser, '__qualname__', repr(parser))
+    entry = _get_entry(key)
+    if entry is not None and entry.parser_name != parser_name:
+        entry = None
+
+    if deadline is not None and deadline.remaining() < MIN_FETCH_BUDGET_SECS and entry is not None:
+        logger.warning(f'deadline is near({deadline.remaining():.3f}s), using cached result: {key}')
+        return _use_entry(key, entry).parsed
+
+    request_headers = {**(headers or {}), **(entry.conditional_headers() if entry is not None else {})}
+    try:
+        response = get_with_retry(url, headers=request_headers, params=params, timeout=timeout, deadline=deadline,
+                                  stream=True)
+    except (requests.RequestException, DeadlineExceededException) as e:
+        if entry is None:
+            raise
+        logger.warning(f'upstream fetch failed({e}), using cached result: {key}')
+        return _use_entry(key, entry).parsed
+
+    try:
+        if entry is not None and (response.status_code == 304 or response.status_code >= 500):
+            if response.status_code == 304:
+                entry.validated_at = time.time()
+            else:
+                logger.warning(f'upstream returned {response.status_code}, using cached result: {key}')
+            return _use_entry(key, entry).parsed
+        response.raise_for_status()
+        extracted, digest, bytes_read = extract(response.iter_content(chunk_size),
+                                                encoding or response.encoding or 'utf-8')
+    finally:
+        response.close()
+
+    new_entry = UpstreamEntry(response, keep_response=False)
+    if entry is not None and entry.digest == digest:
+        new_entry.parsed = entry.parsed
+    else:
+        new_entry.parsed = parser(extracted)
+    new_entry.parser_name, new_entry.digest = parser_name, digest
+    _put_entry(key, new_entry)
+    _use_entry(key, new_entry)
+    logger.debug(f'streamed fetch: {key} read {bytes_read} bytes')
+    return new_entry.parsed
+
+
+def fetch_table(url: str, parser: Callable[[List[TableRow]], Any], table_class: str = None, headers: dict = None,
+                params: dict = None, timeout: float = 10, deadline: Deadline = None, encoding: str = None,
+                chunk_size: int = 8192) -> Any:
+    """
+    업스트림 페이지를 스트리밍으로 읽으면서 대상 테이블의 행만 추출하고, 테이블이 닫히면 나머지 본문은 읽지 않는다.
+    fetch_parsed 와 같이 조건부 요청을 보내며, 304 응답이거나 읽은 바이트의 해시가 이전과 같으면
+    parser 를 호출하지 않고 이전 결과를 재사용한다. 업스트림 호출에 실패하면 이전 결과로 폴백한다.
+    반환값은 캐시와 공유되므로 호출하는 쪽에서 변경하지 않는다.
+    :param url: 요청 URL
+    :param parser: 테이블 행 목록을 받아 파싱 결과를 반환하는 함수
+    :param table_class: 대상 테이블의 class(None 이면 첫 번째 테이블)
+    :param headers: HTTP 헤더
+    :param params: 쿼리 파라미터
+    :param timeout: 시도별 타임아웃(초)
+    :param deadline: 요청 데드라인
+    :param encoding: 응답 본문의 인코딩(None 이면 응답 헤더를 따르고, 헤더에도 없으면 utf-8)
+    :param chunk_size: 한 번에 읽을 바이트 수
+    :return: 파싱 결과
+    """
+    def extract(chunks, body_encoding):
+        return extract_table_rows(chunks, body_encoding, table_class)
+
+    return _fetch_streamed(url, extract, parser, headers, params, timeout, deadline, encoding, chunk_size)
+
+
+def fetch_element_text(url: str, parser: Callable[[Optional[str]], Any], tag: str, class_name: str,
+                       headers: dict = None, params: dict = None, timeout: float = 10, deadline: Deadline = None,
+                       encoding: str = None, chunk_size: int = 8192) -> Any:
+    """
+    업스트림 페이지를 스트리밍으로 읽으면서 tag 와 class 가 일치하는 첫 번째 요소의 텍스트만 추출하고,
+    요소가 닫히면 나머지 본문은 읽지 않는다. 캐시와 폴백 동작은 fetch_table 과 같다.
+    :param url: 요청 URL
+    :param parser: 요소의 텍스트(요소가 없으면 None)를 받아 파싱 결과를 반환하는 함수
+    :param tag: 대상 요소의 태그
+    :param class_name: 대상 요소의 class
+    :param headers: HTTP 헤더
+    :param params: 쿼리 파라미터
+    :param timeout: 시도별 타임아웃(초)
+    :param deadline: 요청 데드라인
+    :param encoding: 응답 본문의 인코딩(None 이면 응답 헤더를 따르고, 헤더에도 없으면 utf-8)
+    :param chunk_size: 한 번에 읽을 바이트 수
+    :return: 파싱 결과
+    """
+    def extract(chunks, body_encoding):
+        return extract_element_text(chunks, body_encoding, tag, class_name)
+
+    return _fetch_streamed(url, extract, parser, headers, params, timeout, deadline, encoding, chunk_size)
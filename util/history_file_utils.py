@@ -0,0 +1,220 @@
+"""
+  일별 시세 이력 바이너리 파일 관련 유틸리티 모듈
+  종목의 일별 시세를 고정 길이 레코드로 날짜 오름차순(과거 -> 최신)으로 저장한다. 새 거래일은 파일 끝에 덧붙이기만 한다.
+  읽는 쪽은 파일을 mmap 으로 매핑해, 날짜 범위를 레코드 번호 범위(오프셋 계산)로 바꾸고
+  NumPy 구조화 배열 뷰(np.frombuffer)로 복사 없이 읽는다. 여러 해의 이력을 분석해도 행마다 파이썬 객체를 만들지 않는다.
+  파일 형식: MAGIC(4) + 형식 버전(uint16) + 레코드 크기(uint16) + 종목 구분(16바이트) + 예약(8) 뒤에 레코드가 이어진다.
+  레코드 형식(56바이트, little endian): 날짜(int32, YYYYMMDD) + 정렬용 패딩(4) + 시가, 고가, 저가, 종가(float64)
+                                     + 거래량, 거래대금(int64). 값이 없으면 float64 는 NaN, int64 는 -1 이다.
+  numpy 는 배열 뷰를 만들 때만 import 한다(레코드 쓰기와 날짜 검색은 표준 라이브러리만 사용).
+"""
+import bisect
+import math
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+HISTORY_FILE_MAGIC = b'FBHF'
+# 헤더나 레코드 형식이 바뀌면 올린다. 버전이 다른 파일은 읽지 않는다.
+HISTORY_FILE_FORMAT_VERSION = 1
+# 값이 없는 정수 필드(거래량, 거래대금)
+MISSING_INT = -1
+
+_HEADER = struct.Struct('<4sHH16s8x')
+_RECORD = struct.Struct('<i4xddddqq')
+_DATE = struct.Struct('<i')
+
+# 레코드의 필드명(일별 시세 시계열의 컬럼명과 같다), 타입, 레코드 안의 위치
+RECORD_FIELDS = ('date', 'open', 'high', 'low', 'close', 'volume', 'value')
+_FLOAT_FIELDS = ('open', 'high', 'low', 'close')
+_INT_FIELDS = ('volume', 'value')
+NUMPY_DTYPE = {
+    'names': list(RECORD_FIELDS),
+    'formats': ['<i4', '<f8', '<f8', '<f8', '<f8', '<i8', '<i8'],
+    'offsets': [0, 8, 16, 24, 32, 40, 48],
+    'itemsize': _RECORD.size
+}
+
+
+def date_to_int(date_text: str) -> int:
+    """
+    'YYYY-MM-DD'(또는 'YYYY.MM.DD') 형식의 날짜를 YYYYMMDD 정수로 변환한다.
+    """
+    return int(date_text.replace('-', '').replace('.', ''))
+
+
+def int_to_date(value: int) -> str:
+    """
+    YYYYMMDD 정수를 'YYYY-MM-DD' 형식의 날짜로 변환한다.
+    """
+    return f'{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}'
+
+
+def pack_bars(bars: Iterable[Dict]) -> bytes:
+    """
+    하루 단위 시세(dict, 'date' 와 시세 컬럼)를 레코드로 변환한다. 레코드에 없는 컬럼은 무시한다.
+    :param bars: 날짜 오름차순의 하루 단위 시세
+    :return: 레코드를 이어 붙인 바이트
+    """
+    records = []
+    for bar in bars:
+        floats = [bar.get(name) for name in _FLOAT_FIELDS]
+        ints = [bar.get(name) for name in _INT_FIELDS]
+        records.append(_RECORD.pack(
+            date_to_int(bar['date']),
+            *(math.nan if value is None else float(value) for value in floats),
+            *(MISSING_INT if value is None else int(value) for value in ints)))
+    return b''.join(records)
+
+
+def write_history_file(path: str, instrument: str, bars: List[Dict]):
+    """
+    이력 파일 전체를 새로 쓴다(임시 파일에 쓴 뒤 원자적으로 교체). 과거 방향으로 이력을 채울 때 사용한다.
+    이미 파일을 매핑한 쪽은 교체 전의 파일을 계속 읽다가 HistoryFile.refresh() 에서 새 파일로 바꾼다.
+    :param path: 이력 파일 경로
+    :param instrument: 종목 구분(최대 16바이트)
+    :param bars: 날짜 오름차순의 하루 단위 시세
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.history-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(HISTORY_FILE_MAGIC, HISTORY_FILE_FORMAT_VERSION, _RECORD.size,
+                                 instrument.encode('utf-8')))
+            f.write(pack_bars(bars))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def append_history_file(path: str, bars: List[Dict]) -> int:
+    """
+    이력 파일 끝에 마지막 레코드보다 최신인 시세만 덧붙인다(쓰는 프로세스는 하나여야 한다).
+    레코드 전체를 한 번의 write 로 덧붙이므로, 읽는 쪽은 레코드 크기로 나누어떨어지는 부분까지만 읽으면 된다.
+    :param path: 이력 파일 경로(없으면 FileNotFoundError)
+    :param bars: 날짜 오름차순의 하루 단위 시세
+    :return: 덧붙인 레코드 수
+    """
+    with open(path, 'r+b') as f:
+        _check_header(f.read(_HEADER.size), path)
+        size = f.seek(0, os.SEEK_END)
+        count = (size - _HEADER.size) // _RECORD.size
+        last_date = 0
+        if count:
+            f.seek(_HEADER.size + (count - 1) * _RECORD.size)
+            last_date = _DATE.unpack(f.read(_DATE.size))[0]
+        newer = [bar for bar in bars if date_to_int(bar['date']) > last_date]
+        if not newer:
+            return 0
+        # 이전에 쓰다 만 레코드가 있으면 잘라낸다.
+        f.truncate(_HEADER.size + count * _RECORD.size)
+        f.seek(0, os.SEEK_END)
+        f.write(pack_bars(newer))
+        f.flush()
+        os.fsync(f.fileno())
+        return len(newer)
+
+
+def _check_header(header: bytes, path: str) -> str:
+    if len(header) < _HEADER.size:
+        raise ValueError(f'이력 파일 헤더가 없음: {path}')
+    magic, version, record_size, instrument = _HEADER.unpack(header)
+    if magic != HISTORY_FILE_MAGIC or version != HISTORY_FILE_FORMAT_VERSION or record_size != _RECORD.size:
+        raise ValueError(f'이력 파일 형식이 다름({version}): {path}')
+    return instrument.rstrip(b'\0').decode('utf-8')
+
+
+class _DateColumn:
+    # 날짜 컬럼을 시퀀스처럼 보이게 해 bisect 로 검색한다(레코드마다 날짜 4바이트만 읽는다).
+
+    def __init__(self, buffer, count: int):
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        return _DATE.unpack_from(self._buffer, _HEADER.size + index * _RECORD.size)[0]
+
+
+class HistoryFile:
+    """
+    mmap 으로 매핑한 일별 시세 이력 파일(읽기 전용).
+    파일이 커지거나 교체되면 refresh() 로 다시 매핑한다. 이전에 만든 배열 뷰는 이전 매핑을 계속 가리킨다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.instrument = None
+        self._mmap = None
+        self._identity = None
+        self._count = 0
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        파일이 커졌거나 교체되었으면 다시 매핑한다.
+        :return: 다시 매핑했으면 True
+        """
+        stat = os.stat(self.path)
+        identity = (stat.st_ino, stat.st_size)
+        if identity == self._identity:
+            return False
+        with open(self.path, 'rb') as f:
+            instrument = _check_header(f.read(_HEADER.size), self.path)
+            count = (stat.st_size - _HEADER.size) // _RECORD.size
+            # 길이가 0 인 파일은 매핑할 수 없으므로 레코드가 없으면 매핑하지 않는다.
+            region = mmap.mmap(f.fileno(), _HEADER.size + count * _RECORD.size,
+                               access=mmap.ACCESS_READ) if count else None
+        # 이전 매핑은 닫지 않는다(배열 뷰가 남아 있으면 닫을 수 없고, 참조가 없어지면 함께 해제된다).
+        self.instrument, self._mmap, self._count, self._identity = instrument, region, count, identity
+        return True
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def dates(self) -> _DateColumn:
+        return _DateColumn(self._mmap, self._count)
+
+    def first_date(self) -> Optional[str]:
+        return int_to_date(self.dates[0]) if self._count else None
+
+    def last_date(self) -> Optional[str]:
+        return int_to_date(self.dates[self._count - 1]) if self._count else None
+
+    def index_range(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[int, int]:
+        """
+        start_date ~ end_date(YYYY-MM-DD, 양 끝 포함)에 해당하는 레코드 번호 범위 [lo, hi) 를 이진 탐색으로 찾는다.
+        """
+        dates = self.dates
+        lo = 0 if start_date is None else bisect.bisect_left(dates, date_to_int(start_date))
+        hi = self._count if end_date is None else bisect.bisect_right(dates, date_to_int(end_date))
+        return lo, max(lo, hi)
+
+    def array(self, lo: int = 0, hi: Optional[int] = None):
+        """
+        레코드 번호 범위 [lo, hi) 의 NumPy 구조화 배열 뷰(읽기 전용, 복사 없음)를 반환한다.
+        배열의 필드(date, open, high, low, close, volume, value)도 같은 메모리를 가리키는 뷰다.
+        """
+        import numpy as np
+
+        hi = self._count if hi is None else min(hi, self._count)
+        if self._mmap is None or lo >= hi:
+            return np.empty(0, dtype=np.dtype(NUMPY_DTYPE))
+        return np.frombuffer(self._mmap, dtype=np.dtype(NUMPY_DTYPE), count=hi - lo,
+                             offset=_HEADER.size + lo * _RECORD.size)
+
+    def between(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """
+        start_date ~ end_date(YYYY-MM-DD, 양 끝 포함)의 NumPy 구조화 배열 뷰(날짜 오름차순)를 반환한다.
+        """
+        return self.array(*self.index_range(start_date, end_date))
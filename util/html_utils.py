@@ -0,0 +1,232 @@
+"""
+  HTML 스트리밍 파싱 관련 유틸리티 모듈
+  응답 본문을 조금씩 읽으면서 대상 테이블(또는 요소)만 추출하고, 대상이 닫히면 나머지 본문은 읽지 않는다.
+  lxml 도 의존성에 있지만, 표준 라이브러리 html.parser 는 태그 콜백마다 대상이 닫혔는지 바로 확인할 수 있고
+  시세 조회 경로에서 lxml/bs4 를 import 하지 않아도 되므로(콜드 스타트) 이 모듈은 html.parser 로 만든다.
+"""
+import codecs
+import hashlib
+from html.parser import HTMLParser
+from typing import Iterable, List, Optional, Tuple
+
+
+class TableRow:
+    """
+    테이블의 한 행(tr).
+    cells 는 각 셀(td)의 텍스트(BeautifulSoup 의 get_text(strip=True) 와 같은 방식),
+    markup 은 행 안에 있는 태그 속성값(class, src, alt 등)을 공백으로 이은 문자열이다(등락 아이콘 판별용).
+    """
+    __slots__ = ('cells', 'markup')
+
+    def __init__(self):
+        self.cells: List[str] = []
+        self.markup = ''
+
+    def __repr__(self):
+        return f'TableRow({self.cells})'
+
+
+class TableRowExtractor(HTMLParser):
+    """
+    feed() 로 전달되는 HTML 에서 대상 테이블의 행을 추출하는 증분 파서.
+    table_class 가 있으면 해당 class 를 가진 첫 번째 테이블을, 없으면 문서의 첫 번째 테이블을 대상으로 한다.
+    table_class 를 가진 테이블이 문서에 없으면 첫 번째 테이블의 행을 사용한다.
+    대상 테이블이 닫히면 done 이 True 가 되며 이후의 입력은 무시한다.
+    """
+
+    def __init__(self, table_class: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.table_class = table_class
+        self.done = False
+        self._first_table_rows: Optional[List[TableRow]] = None
+        self._target_rows: Optional[List[TableRow]] = None
+        self._collecting: Optional[List[TableRow]] = None
+        self._collecting_target = False
+        self._depth = 0
+        self._skip_depth = 0
+        self._row: Optional[TableRow] = None
+        self._cell: Optional[List[str]] = None
+        self._text: List[str] = []
+        self._markup: List[str] = []
+
+    @property
+    def rows(self) -> List[TableRow]:
+        if self._target_rows is not None:
+            return self._target_rows
+        return self._first_table_rows or []
+
+    def _flush_text(self):
+        if self._cell is not None and self._text:
+            text = ''.join(self._text).strip()
+            if text:
+                self._cell.append(text)
+        self._text = []
+
+    def _end_cell(self):
+        self._flush_text()
+        if self._cell is not None and self._row is not None:
+            self._row.cells.append(''.join(self._cell))
+        self._cell = None
+
+    def _end_row(self):
+        self._end_cell()
+        if self._row is not None:
+            self._row.markup = ' '.join(self._markup)
+            self._collecting.append(self._row)
+        self._row = None
+        self._markup = []
+
+    def _start_table(self, attrs):
+        classes = (dict(attrs).get('class') or '').split()
+        is_target = self.table_class is None or self.table_class in classes
+        if self._first_table_rows is None:
+            self._first_table_rows = []
+            self._collecting = self._first_table_rows
+        elif is_target:
+            self._collecting = []
+        else:
+            # 첫 번째 테이블도, 대상 class 의 테이블도 아니면 건너뛴다.
+            self._skip_depth = 1
+            return
+        if is_target:
+            self._target_rows = self._collecting
+        self._collecting_target = is_target
+        self._depth = 1
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == 'table':
+            if self._skip_depth:
+                self._skip_depth += 1
+            elif self._depth:
+                self._depth += 1
+            else:
+                self._start_table(attrs)
+            return
+        if self._depth == 0:
+            return
+        if self._depth == 1:
+            self._flush_text()
+            if tag == 'tr':
+                self._end_row()
+                self._row = TableRow()
+            elif tag in ('td', 'th'):
+                self._end_cell()
+                if self._row is not None and tag == 'td':
+                    self._cell = []
+        if self._row is not None:
+            self._markup.extend(value for _, value in attrs if value)
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag == 'table':
+            if self._skip_depth:
+                self._skip_depth -= 1
+            elif self._depth > 1:
+                self._depth -= 1
+            elif self._depth == 1:
+                self._end_row()
+                self._depth = 0
+                self.done = self._collecting_target
+            return
+        if self._depth != 1:
+            return
+        self._flush_text()
+        if tag == 'tr':
+            self._end_row()
+        elif tag in ('td', 'th'):
+            self._end_cell()
+
+    def handle_data(self, data):
+        if not self.done and self._depth and self._cell is not None:
+            self._text.append(data)
+
+
+def _feed_until_done(extractor, chunks: Iterable[bytes], encoding: str) -> Tuple[str, int]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    hasher = hashlib.blake2b(digest_size=16)
+    bytes_read = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        hasher.update(chunk)
+        bytes_read += len(chunk)
+        extractor.feed(decoder.decode(chunk))
+        if extractor.done:
+            break
+    else:
+        extractor.feed(decoder.decode(b'', final=True))
+        extractor.close()
+    return hasher.hexdigest(), bytes_read
+
+
+def extract_table_rows(chunks: Iterable[bytes], encoding: str,
+                       table_class: Optional[str] = None) -> Tuple[List[TableRow], str, int]:
+    """
+    바이트 청크를 순서대로 디코딩하면서 대상 테이블의 행을 추출한다. 대상 테이블이 닫히면 더 이상 읽지 않는다.
+    :param chunks: 응답 본문 바이트 청크(예: response.iter_content())
+    :param encoding: 본문 인코딩
+    :param table_class: 대상 테이블의 class(None 이면 첫 번째 테이블)
+    :return: (행 목록, 읽은 바이트의 해시, 읽은 바이트 수)
+    """
+    extractor = TableRowExtractor(table_class)
+    digest, bytes_read = _feed_until_done(extractor, chunks, encoding)
+    return extractor.rows, digest, bytes_read
+
+
+class ElementTextExtractor(HTMLParser):
+    """
+    feed() 로 전달되는 HTML 에서 tag 와 class 가 일치하는 첫 번째 요소의 텍스트를 추출하는 증분 파서.
+    요소가 닫히면 done 이 True 가 되며 이후의 입력은 무시한다.
+    """
+
+    def __init__(self, tag: str, class_name: str):
+        super().__init__(convert_charrefs=True)
+        self.tag = tag
+        self.class_name = class_name
+        self.done = False
+        self.found = False
+        self._depth = 0
+        self._text: List[str] = []
+
+    @property
+    def text(self) -> Optional[str]:
+        return ''.join(self._text).strip() if self.found else None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self._depth:
+            if tag == self.tag:
+                self._depth += 1
+        elif tag == self.tag and self.class_name in (dict(attrs).get('class') or '').split():
+            self.found = True
+            self._depth = 1
+
+    def handle_endtag(self, tag):
+        if self.done or not self._depth or tag != self.tag:
+            return
+        self._depth -= 1
+        self.done = self._depth == 0
+
+    def handle_data(self, data):
+        if not self.done and self._depth:
+            self._text.append(data.strip())
+
+
+def extract_element_text(chunks: Iterable[bytes], encoding: str, tag: str,
+                         class_name: str) -> Tuple[Optional[str], str, int]:
+    """
+    바이트 청크를 순서대로 디코딩하면서 tag 와 class 가 일치하는 첫 번째 요소의 텍스트를 추출한다.
+    요소가 닫히면 더 이상 읽지 않는다.
+    :param chunks: 응답 본문 바이트 청크(예: response.iter_content())
+    :param encoding: 본문 인코딩
+    :param tag: 대상 요소의 태그
+    :param class_name: 대상 요소의 class
+    :return: (요소의 텍스트(요소가 없으면 None), 읽은 바이트의 해시, 읽은 바이트 수)
+    """
+    extractor = ElementTextExtractor(tag, class_name)
+    digest, bytes_read = _feed_until_done(extractor, chunks, encoding)
+    return extractor.text, digest, bytes_read
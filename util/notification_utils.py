@@ -1,4 +1,3 @@
-import boto3
 import base64
 import hashlib
 import hmac
@@ -11,7 +10,6 @@ from enum import Enum
 from exceptions import CoreException
 from util.logging_util import logger
 from config import NaverSmsConfig
-from firebase_admin import messaging
 
 _sns_client = None
 
@@ -25,6 +23,9 @@ def _get_sns_client():
     global _sns_client
     if _sns_client is None:
         try:
+            # boto3 는 import 비용이 크므로 SNS 를 처음 사용할 때 불러온다.
+            import boto3
+
             # 서울 리전 아직 지원되지 않음
             # https://docs.aws.amazon.com/ko_kr/sns/latest/dg/sns-supported-regions-countries.html
             _sns_client = boto3.client('sns', region_name='us-east-1')
@@ -103,6 +104,8 @@ def send_naver_sms_notification(phone_number: str, message: str):
 
 
 def send_push_to_topic(topic: str, title: str, body) -> str:
+    from firebase_admin import messaging
+
     message = messaging.Message(
         notification=messaging.Notification(
             title=title,
@@ -116,6 +119,8 @@ def send_push_to_topic(topic: str, title: str, body) -> str:
 
 
 def subscribe_to_topic(token: str, topic: str):
+    from firebase_admin import messaging
+
     print(f'topic : {topic}')
     print(f'token : {token}')
 
@@ -125,6 +130,8 @@ def subscribe_to_topic(token: str, topic: str):
 
 
 def unsubscribe_from_topic(token: str, topic: str):
+    from firebase_admin import messaging
+
     response = messaging.unsubscribe_from_topic([token], topic)
     return response
 
@@ -0,0 +1,193 @@
+"""
+  API 응답 직렬화 관련 유틸리티 모듈
+  flask-restx 의 marshal_with 는 응답을 모델 필드 단위로 복사한 뒤 json.dumps 로 다시 직렬화한다.
+  서비스가 이미 응답 형태로 만든 데이터는 모델의 최상위 키만 맞춘 뒤 한 번에 직렬화해 반환한다.
+  시세 목록은 Accept 헤더에 따라 컬럼 단위 JSON, CSV, MessagePack 으로도 응답한다.
+  긴 날짜 범위는 한 줄에 한 건씩 NDJSON 으로 스트리밍한다.
+"""
+import csv
+import functools
+import io
+import json
+from typing import Any, Dict, Iterable, List, Tuple
+
+from flask import Response, after_this_request, request, stream_with_context
+from flask_restx import Model, Namespace
+
+from exceptions import ApiBaseException
+from util.logging_util import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_MIMETYPE = 'application/json'
+COLUMNAR_JSON_MIMETYPE = 'application/vnd.finance.columnar+json'
+CSV_MIMETYPE = 'text/csv'
+MSGPACK_MIMETYPE = 'application/msgpack'
+NDJSON_MIMETYPE = 'application/x-ndjson'
+# 커서 기반 페이지를 시계열 형식으로 응답할 때 다음 페이지 커서를 담는 헤더(CSV 는 본문에 담을 곳이 없으므로)
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+# Accept 헤더로 선택할 수 있는 시계열 응답 형식(application/json 이 기본값)
+SERIES_MIMETYPES = [JSON_MIMETYPE, COLUMNAR_JSON_MIMETYPE, CSV_MIMETYPE]
+if msgpack is not None:
+    SERIES_MIMETYPES += [MSGPACK_MIMETYPE, 'application/x-msgpack']
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+
+def dumps(data: Any) -> bytes:
+    """
+    데이터를 JSON 바이트로 직렬화한다. orjson 이 설치되어 있으면 orjson 을, 없으면 표준 json 을 사용한다.
+    :param data: 직렬화할 데이터
+    :return: JSON 바이트(마지막에 개행 포함)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    return (json.dumps(data, ensure_ascii=False, default=str, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def json_response(data: Any, status: int = 200, headers: dict = None) -> Response:
+    """
+    데이터를 한 번에 직렬화한 JSON 응답을 만든다.
+    :param data: 응답 본문 데이터
+    :param status: HTTP 상태 코드
+    :param headers: 추가 응답 헤더
+    :return: flask Response
+    """
+    return Response(dumps(data), status=status, headers=headers, mimetype=JSON_MIMETYPE)
+
+
+def _shape(data: dict, model: Model) -> dict:
+    # marshal 과 같이 모델에 정의된 키만 남기고, 없는 키는 None 으로 채운다.
+    return {key: data.get(key) for key in model}
+
+
+def _unpack(result) -> Tuple[Any, int, dict]:
+    if isinstance(result, tuple):
+        data = result[0]
+        status = result[1] if len(result) > 1 else 200
+        headers = result[2] if len(result) > 2 else None
+        return data, status, headers
+    return result, 200, None
+
+
+def fast_marshal_with(namespace: Namespace, model: Model, code: int = 200, description: str = 'Success'):
+    """
+    marshal_with 대신 사용하는 데코레이터.
+    Swagger 문서에는 model 을 그대로 노출하고, 실제 응답은 모델의 최상위 키만 맞춘 뒤 한 번에 직렬화한다.
+    model 의 필드는 중첩 모델 없이 최상위 키만 사용한다(data 와 같은 fields.Raw 는 그대로 직렬화된다).
+    :param namespace: 리소스가 등록된 Namespace
+    :param model: 응답 모델
+    :param code: 문서화할 HTTP 상태 코드
+    :param description: 문서화할 응답 설명
+    :return: 데코레이터
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            data, status, headers = _unpack(result)
+            if isinstance(data, dict):
+                data = _shape(data, model)
+            return json_response(data, status, headers)
+
+        return namespace.response(code, description, model)(wrapper)
+
+    return decorator
+
+
+def negotiate_series_format() -> str:
+    """
+    요청의 Accept 헤더로 시계열 응답 형식을 결정한다. 지원하지 않는 형식이거나 Accept 가 없으면 application/json 이다.
+    응답이 Accept 에 따라 달라지므로 이 요청의 응답에는 형식과 관계없이 Vary: Accept 를 붙인다.
+    :return: 응답 mimetype(SERIES_MIMETYPES 중 하나)
+    """
+    @after_this_request
+    def add_vary_accept(response: Response) -> Response:
+        response.vary.add('Accept')
+        return response
+
+    return request.accept_mimetypes.best_match(SERIES_MIMETYPES, default=JSON_MIMETYPE)
+
+
+def _columns_to_csv(columns: Dict[str, List]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(columns.keys())
+    writer.writerows(zip(*columns.values()))
+    return buffer.getvalue().encode('utf-8')
+
+
+def series_response(columns: Dict[str, List], mimetype: str, message: str, headers: dict = None,
+                    next_cursor: str = None) -> Response:
+    """
+    컬럼 단위 시계열({'date': [...], 'close': [...]})을 요청한 형식으로 직렬화한 응답을 만든다.
+    행 단위 dict 를 만들지 않고 컬럼 리스트를 그대로 직렬화한다.
+    CSV 는 헤더 행과 데이터 행만, columnar JSON 과 MessagePack 은 기존 응답과 같은 envelope 의 data 에 컬럼을 담는다.
+    :param columns: 컬럼명 -> 값 리스트
+    :param mimetype: negotiate_series_format() 의 결과
+    :param message: 응답 메시지
+    :param headers: 추가 응답 헤더
+    :param next_cursor: 커서 기반 페이지의 다음 페이지 커서(있으면 NEXT_CURSOR_HEADER 헤더로 응답)
+    :return: flask Response
+    """
+    if next_cursor:
+        headers = {**(headers or {}), NEXT_CURSOR_HEADER: next_cursor}
+    if mimetype == CSV_MIMETYPE:
+        return Response(_columns_to_csv(columns), headers=headers, mimetype=CSV_MIMETYPE)
+
+    envelope = {
+        'status': 'success',
+        'data': columns,
+        'message': message,
+        'error_code': None
+    }
+    if mimetype in (MSGPACK_MIMETYPE, 'application/x-msgpack'):
+        return Response(msgpack.packb(envelope, use_bin_type=True), headers=headers, mimetype=mimetype)
+    return Response(dumps(envelope), headers=headers, mimetype=COLUMNAR_JSON_MIMETYPE)
+
+
+def ndjson_response(items: Iterable[Dict]) -> Response:
+    """
+    항목을 한 줄에 하나씩 JSON 으로 직렬화해 스트리밍하는 NDJSON 응답을 만든다.
+    items 가 제너레이터이면 응답을 보내는 동안 필요한 만큼만 만들어지므로 응답 크기와 관계없이 메모리 사용량이 일정하다.
+    상태 코드와 헤더는 첫 줄보다 먼저 나가므로, 도중에 오류가 나면 마지막 줄에 오류 envelope 을 쓰고 끝낸다.
+    :param items: 직렬화할 dict 이터러블
+    :return: flask Response(스트리밍)
+    """
+    def generate():
+        try:
+            for item in items:
+                yield dumps(item)
+        except ApiBaseException as e:
+            logger.error(f"NDJSON 스트리밍 중 오류: {e.error_code} - {e.message}")
+            yield dumps({'status': 'error', 'data': None, 'message': e.message, 'error_code': e.error_code})
+        except Exception as e:
+            logger.error(f"NDJSON 스트리밍 중 예상치 못한 오류: {str(e)}")
+            yield dumps({'status': 'error', 'data': None, 'message': '서버 내부 오류가 발생했습니다.',
+                         'error_code': 'INTERNAL_SERVER_ERROR'})
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def prime_serializers():
+    """
+    응답 직렬화 경로(JSON envelope, 시계열 형식별 직렬화, NDJSON)를 작은 데이터로 한 번씩 실행한다.
+    인코더 초기화와 관련 모듈 로딩을 시작 단계에서 끝내 첫 요청이 그 비용을 내지 않게 한다(warm-up 용).
+    """
+    columns = {'date': ['2025-01-02', '2025-01-03'], 'close': [1.0, 2.0]}
+    json_response({'status': 'success', 'data': columns, 'message': None, 'error_code': None}).get_data()
+    for mimetype in SERIES_MIMETYPES:
+        series_response(columns, mimetype, 'warm-up').get_data()
+    dumps({'date': '2025-01-02', 'close': 1.0})
@@ -2,10 +2,12 @@ import requests
 from flask import json
 
 from exceptions import CoreException
+from util.deadline_utils import Deadline
+from util.fetch_utils import get_with_retry
 
 
 def call_rest_api(http_method, url, jwt_token=None, request_entity=None, headers=None,
-                  conn_timeout=5.0, read_timeout=5.0):
+                  conn_timeout=5.0, read_timeout=5.0, deadline: Deadline = None):
     """
     지정된 HTTP API를 호출한다.
     :param http_method: HTTP 메소드 (GET, POST, PUT, DELETE, PATCH)
@@ -15,6 +17,7 @@ def call_rest_api(http_method, url, jwt_token=None, request_entity=None, headers
     :param headers: HTTP 헤더
     :param conn_timeout: 연결 타임아웃 기본값 5초 None 일 경우 무한
     :param read_timeout: 응답 타임아웃 기본값 5초 None 일 경우 무한
+    :param deadline: 요청 데드라인. 지정하면 연결/응답 타임아웃을 남은 시간으로 제한한다.
     :return:
     """
     default_headers = {'Content-Type': 'application/json; charset=utf-8'}
@@ -24,11 +27,16 @@ def call_rest_api(http_method, url, jwt_token=None, request_entity=None, headers
     timeouts = (conn_timeout, read_timeout)
 
     try:
+        if deadline is not None:
+            timeouts = deadline.timeout(timeouts)
+
         if headers:
             default_headers.update(headers)
 
         if http_method == 'GET':
-            response = requests.get(url, headers=default_headers, params=request_entity, timeout=timeouts)
+            # GET 은 멱등 메소드이므로 재시도 정책을 적용한다.
+            response = get_with_retry(url, headers=default_headers, params=request_entity, timeout=timeouts,
+                                      deadline=deadline)
         else:
             data = None
             if request_entity:
@@ -1,34 +1,204 @@
-import boto3
-from botocore.client import Config
-from botocore.exceptions import ClientError
+import fcntl
+import hashlib
+import io
+import os
+import tempfile
+from datetime import datetime, timezone
+import uuid
+from typing import Dict, Iterable, Optional
 
 from util.logging_util import logger
-from contants import S3_BUCKET_NAME_FORMAT, DEFAULT_REGION
+from contants import S3_BUCKET_NAME_FORMAT, DEFAULT_REGION, S3_STUB_ENV
 
 from enum import Enum, auto
 
 cache_client = None
 cache_resource = None
 
+# 멀티파트 업로드: S3 가 허용하는 최소 파트 크기(마지막 파트 제외), 기본 파트 크기
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+
+def _s3_config():
+    # boto3/botocore 는 import 에만 수십 ms 가 걸리므로 S3 를 처음 사용할 때 불러온다.
+    from botocore.client import Config
+    return Config(signature_version='s3v4')
+
+
+class LocalS3Client:
+    """
+    로컬 디렉터리({root}/{버킷}/{키})에 객체를 저장하는 오프라인 테스트용 S3 클라이언트.
+    이 모듈에서 사용하는 객체 읽기/메타데이터 조회/쓰기/삭제, 멀티파트 업로드, 서명된 URL(로컬 file:// 경로) 만 흉내내며,
+    오류는 boto3 와 같은 ClientError 로 던진다.
+    여러 프로세스가 같은 디렉터리를 쓰면 워커 여러 개가 S3 를 공유하는 상황을 재현할 수 있다.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.calls = {'get_object': 0, 'head_object': 0, 'put_object': 0, 'delete_object': 0, 'upload_part': 0}
+
+    def _path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root, bucket, *key.split('/'))
+
+    @staticmethod
+    def _error(operation: str, code: str, status: int):
+        from botocore.exceptions import ClientError
+        return ClientError({'Error': {'Code': code, 'Message': code},
+                            'ResponseMetadata': {'HTTPStatusCode': status}}, operation)
+
+    def get_object(self, Bucket: str, Key: str, IfNoneMatch: str = None, **kwargs) -> dict:
+        self.calls['get_object'] += 1
+        path = self._path(Bucket, Key)
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            raise self._error('GetObject', 'NoSuchKey', 404)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if IfNoneMatch is not None and IfNoneMatch in (etag, '*'):
+            raise self._error('GetObject', '304', 304)
+        return {
+            'Body': io.BytesIO(body),
+            'ETag': etag,
+            'ContentLength': len(body),
+            'LastModified': datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc)
+        }
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+        self.calls['head_object'] += 1
+        path = self._path(Bucket, Key)
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            raise self._error('HeadObject', '404', 404)
+        return {
+            'ETag': f'"{hashlib.md5(body).hexdigest()}"',
+            'ContentLength': len(body),
+            'LastModified': datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc)
+        }
+
+    def put_object(self, Bucket: str, Key: str, Body=b'', IfNoneMatch: str = None, IfMatch: str = None,
+                   **kwargs) -> dict:
+        self.calls['put_object'] += 1
+        body = Body.read() if hasattr(Body, 'read') else Body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.put-', dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+        try:
+            if IfNoneMatch == '*':
+                # 이미 있으면 실패하는 원자적 생성(S3 의 조건부 쓰기 If-None-Match: *)
+                try:
+                    os.link(temp_path, path)
+                except FileExistsError:
+                    raise self._error('PutObject', 'PreconditionFailed', 412)
+            elif IfMatch is not None:
+                # ETag 가 같을 때만 덮어쓰는 조건부 쓰기(S3 의 If-Match). 비교와 교체 사이에 다른 쓰기가 끼지 않도록 잠근다.
+                with open(os.path.join(os.path.dirname(path), '.if-match.lock'), 'w') as lock:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                    try:
+                        with open(path, 'rb') as f:
+                            current = f'"{hashlib.md5(f.read()).hexdigest()}"'
+                    except FileNotFoundError:
+                        raise self._error('PutObject', 'NoSuchKey', 404)
+                    if current != IfMatch:
+                        raise self._error('PutObject', 'PreconditionFailed', 412)
+                    os.replace(temp_path, path)
+                    temp_path = None
+            else:
+                os.replace(temp_path, path)
+                temp_path = None
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+        return {'ETag': f'"{hashlib.md5(body).hexdigest()}"'}
+
+    def delete_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+        self.calls['delete_object'] += 1
+        try:
+            os.remove(self._path(Bucket, Key))
+        except FileNotFoundError:
+            pass
+        return {}
+
+    def _upload_path(self, bucket: str, upload_id: str, part_number: int = None) -> str:
+        directory = os.path.join(self.root, '.multipart', bucket, upload_id)
+        return directory if part_number is None else os.path.join(directory, f'{part_number:05d}')
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> dict:
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._upload_path(Bucket, upload_id))
+        return {'Bucket': Bucket, 'Key': Key, 'UploadId': upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body=b'', **kwargs) -> dict:
+        self.calls['upload_part'] += 1
+        body = Body.read() if hasattr(Body, 'read') else Body
+        with open(self._upload_path(Bucket, UploadId, PartNumber), 'wb') as f:
+            f.write(body)
+        return {'ETag': f'"{hashlib.md5(body).hexdigest()}"'}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict,
+                                  **kwargs) -> dict:
+        parts = MultipartUpload['Parts']
+        bodies = []
+        for part in parts:
+            with open(self._upload_path(Bucket, UploadId, part['PartNumber']), 'rb') as f:
+                bodies.append(f.read())
+        # 마지막 파트를 뺀 파트가 최소 크기보다 작으면 S3 와 같이 실패한다.
+        if any(len(body) < MULTIPART_MIN_PART_SIZE for body in bodies[:-1]):
+            raise self._error('CompleteMultipartUpload', 'EntityTooSmall', 400)
+        self.put_object(Bucket, Key, b''.join(bodies))
+        self.abort_multipart_upload(Bucket, Key, UploadId)
+        digest = hashlib.md5(b''.join(hashlib.md5(body).digest() for body in bodies)).hexdigest()
+        return {'Bucket': Bucket, 'Key': Key, 'ETag': f'"{digest}-{len(parts)}"'}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> dict:
+        directory = self._upload_path(Bucket, UploadId)
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+        return {}
+
+    def generate_presigned_url(self, ClientMethod: str, Params: dict = None, ExpiresIn: int = 3600,
+                               HttpMethod: str = None) -> str:
+        # 서명 대신 로컬 파일 경로를 돌려준다.
+        return f"file://{self._path(Params['Bucket'], Params['Key'])}?expires_in={ExpiresIn}"
+
 
 def _find_client_from_cache(region):
     global cache_client
     if cache_client is None:
         cache_client = {}
 
+    stub_root = os.getenv(S3_STUB_ENV)
+    if stub_root:
+        if not isinstance(cache_client.get(region), LocalS3Client):
+            cache_client[region] = LocalS3Client(stub_root)
+        return cache_client[region]
+
+    import boto3
+
     if cache_client.get(region):
         s3_client = cache_client[region]
         if s3_client is None:
-            s3_client = boto3.client('s3', config=Config(signature_version='s3v4'), region_name=region)
+            s3_client = boto3.client('s3', config=_s3_config(), region_name=region)
             cache_client[region] = s3_client
     else:
-        s3_client = boto3.client('s3', config=Config(signature_version='s3v4'), region_name=region)
+        s3_client = boto3.client('s3', config=_s3_config(), region_name=region)
         cache_client[region] = s3_client
 
     return s3_client
 
 
 def _find_resource_from_cache(region):
+    import boto3
+
     global cache_resource
     if cache_resource is None:
         cache_resource = {}
@@ -36,10 +206,10 @@ def _find_resource_from_cache(region):
     if cache_resource.get(region):
         s3_resource = cache_resource[region]
         if s3_resource is None:
-            s3_resource = boto3.resource('s3', config=Config(signature_version='s3v4'), region_name=region)
+            s3_resource = boto3.resource('s3', config=_s3_config(), region_name=region)
             cache_resource[region] = s3_resource
     else:
-        s3_resource = boto3.resource('s3', config=Config(signature_version='s3v4'), region_name=region)
+        s3_resource = boto3.resource('s3', config=_s3_config(), region_name=region)
         cache_resource[region] = s3_resource
 
     return s3_resource
@@ -62,25 +232,155 @@ def get_s3_base_url(region=DEFAULT_REGION):
     return f'https://{get_bucket_name()}.s3.{region}.amazonaws.com'
 
 
-def put_object_contents(source_contents, object_key, region=DEFAULT_REGION, bucket_name=get_bucket_name()):
+def put_object_contents(source_contents, object_key, region=DEFAULT_REGION, bucket_name=get_bucket_name(),
+                        if_none_match: str = None, if_match: str = None, content_type: str = None,
+                        content_encoding: str = None) -> Optional[str]:
     """
     소스 파일을 지정한 키로 지정된 버킷에 저장한다.
     :param region: 버킷의 리전
     :param bucket_name: 버킷명
     :param source_contents: 소스 파일 binary
     :param object_key: 객체키
-    :return:
+    :param if_none_match: '*' 이면 객체가 없을 때만 저장한다(조건부 쓰기)
+    :param if_match: 객체의 ETag 가 이 값과 같을 때만 덮어쓴다(조건부 쓰기)
+    :param content_type: 객체의 Content-Type(선택사항)
+    :param content_encoding: 객체의 Content-Encoding(선택사항, 예: gzip)
+    :return: 저장한 객체의 ETag. 조건부 쓰기에서 객체가 이미 있거나(if_none_match) ETag 가 다르면(if_match) None
     """
+    from botocore.exceptions import ClientError
+
     logger.debug(
-        f'region:{region}, bucket_name:{bucket_name}, source_key:{source_contents}, destination_key:{object_key}')
+        f'region:{region}, bucket_name:{bucket_name}, source_size:{len(source_contents)}, destination_key:{object_key}')
+    params = {'IfNoneMatch': if_none_match} if if_none_match else {}
+    if if_match:
+        params['IfMatch'] = if_match
+    if content_type:
+        params['ContentType'] = content_type
+    if content_encoding:
+        params['ContentEncoding'] = content_encoding
     try:
         s3_client = _find_client_from_cache(region)
-        s3_client.put_object(Bucket=bucket_name, Body=source_contents, Key=object_key)
+        response = s3_client.put_object(Bucket=bucket_name, Body=source_contents, Key=object_key, **params)
+        return response.get('ETag')
+    except ClientError as e:
+        # 412 PreconditionFailed: 객체가 이미 있거나 ETag 가 다름, 409 ConditionalRequestConflict: 같은 키에 동시에 조건부 쓰기
+        # (If-Match 대상 객체가 그 사이에 삭제되면 404)
+        status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        if (if_none_match and status in (409, 412)) or (if_match and status in (404, 409, 412)):
+            return None
+        logger.error(f'put_object_contents: {e}')
+        raise e
     except Exception as e:
         logger.error(f'put_object_contents: {e}')
         raise e
 
 
+def get_object_contents(object_key, region=DEFAULT_REGION, bucket_name=get_bucket_name(),
+                        etag: str = None) -> Optional[Dict]:
+    """
+    버킷에 있는 객체의 내용을 읽는다.
+    :param region: 버킷의 리전
+    :param bucket_name: 버킷명
+    :param object_key: 객체키
+    :param etag: 이전에 읽은 객체의 ETag. 객체가 바뀌지 않았으면 본문을 다시 받지 않는다(If-None-Match)
+    :return: {'body': 본문 bytes(바뀌지 않았으면 None), 'etag': ETag, 'not_modified': 바뀌지 않았는지 여부}.
+             객체가 없으면 None
+    """
+    from botocore.exceptions import ClientError
+
+    params = {'IfNoneMatch': etag} if etag else {}
+    try:
+        s3_client = _find_client_from_cache(region)
+        response = s3_client.get_object(Bucket=bucket_name, Key=object_key, **params)
+        return {'body': response['Body'].read(), 'etag': response.get('ETag'), 'not_modified': False}
+    except ClientError as e:
+        status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        if status == 304:
+            return {'body': None, 'etag': etag, 'not_modified': True}
+        if status == 404 or e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return None
+        logger.error(f'get_object_contents: {e}')
+        raise e
+
+
+def head_object_info(object_key, region=DEFAULT_REGION, bucket_name=get_bucket_name()) -> Optional[Dict]:
+    """
+    버킷에 있는 객체의 메타데이터를 본문 없이 읽는다(HeadObject).
+    :param region: 버킷의 리전
+    :param bucket_name: 버킷명
+    :param object_key: 객체키
+    :return: {'etag': ETag, 'size': 크기, 'last_modified': 마지막 수정 시각(time.time() 기준 초)}. 객체가 없으면 None
+    """
+    from botocore.exceptions import ClientError
+
+    try:
+        s3_client = _find_client_from_cache(region)
+        response = s3_client.head_object(Bucket=bucket_name, Key=object_key)
+        return {'etag': response.get('ETag'), 'size': response.get('ContentLength'),
+                'last_modified': response['LastModified'].timestamp()}
+    except ClientError as e:
+        if e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 404:
+            return None
+        logger.error(f'head_object_info: {e}')
+        raise e
+
+
+def put_object_multipart(chunks: Iterable[bytes], object_key, region=DEFAULT_REGION, bucket_name=get_bucket_name(),
+                         part_size: int = MULTIPART_PART_SIZE, content_type: str = None,
+                         content_encoding: str = None) -> Dict:
+    """
+    바이트 조각들을 멀티파트 업로드로 저장한다. 조각을 part_size 만큼 모아 파트 하나로 올리므로 전체 본문을 메모리에 두지 않는다.
+    업로드 중 오류가 나면 멀티파트 업로드를 취소(abort)해 올린 파트가 남지 않게 한다.
+    :param chunks: 저장할 바이트 조각들
+    :param object_key: 객체키
+    :param region: 버킷의 리전
+    :param bucket_name: 버킷명
+    :param part_size: 파트 크기(마지막 파트를 빼고 MULTIPART_MIN_PART_SIZE 이상)
+    :param content_type: 객체의 Content-Type(선택사항)
+    :param content_encoding: 객체의 Content-Encoding(선택사항, 예: gzip)
+    :return: {'etag': 저장한 객체의 ETag, 'size': 전체 크기(바이트), 'parts': 파트 수}
+    """
+    part_size = max(part_size, MULTIPART_MIN_PART_SIZE)
+    params = {}
+    if content_type:
+        params['ContentType'] = content_type
+    if content_encoding:
+        params['ContentEncoding'] = content_encoding
+
+    s3_client = _find_client_from_cache(region)
+    upload_id = s3_client.create_multipart_upload(Bucket=bucket_name, Key=object_key, **params)['UploadId']
+    parts = []
+    size = 0
+    try:
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= part_size:
+                parts.append(_upload_part(s3_client, bucket_name, object_key, upload_id, len(parts) + 1,
+                                          bytes(buffer[:part_size])))
+                del buffer[:part_size]
+                size += part_size
+        # 마지막 파트(본문이 비어 있어도 파트는 하나 있어야 한다)
+        if buffer or not parts:
+            parts.append(_upload_part(s3_client, bucket_name, object_key, upload_id, len(parts) + 1, bytes(buffer)))
+            size += len(buffer)
+        response = s3_client.complete_multipart_upload(Bucket=bucket_name, Key=object_key, UploadId=upload_id,
+                                                       MultipartUpload={'Parts': parts})
+    except Exception as e:
+        logger.error(f'put_object_multipart: {e}')
+        s3_client.abort_multipart_upload(Bucket=bucket_name, Key=object_key, UploadId=upload_id)
+        raise e
+
+    logger.debug(f'bucket_name:{bucket_name}, destination_key:{object_key}, size:{size}, parts:{len(parts)}')
+    return {'etag': response.get('ETag'), 'size': size, 'parts': len(parts)}
+
+
+def _upload_part(s3_client, bucket_name: str, object_key: str, upload_id: str, part_number: int, body: bytes) -> Dict:
+    response = s3_client.upload_part(Bucket=bucket_name, Key=object_key, UploadId=upload_id,
+                                     PartNumber=part_number, Body=body)
+    return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+
 def delete_object(object_key, region=DEFAULT_REGION, bucket_name=get_bucket_name()):
     """
     버킷에 있는 객체를 삭제한다.
@@ -228,6 +528,8 @@ def create_presigned_url(object_key: str, url_type: S3PreSignedURLOpType = S3Pre
     :return: 문자열인 서명된 URL. 오류가 발생하면 None을 리턴.
     """
 
+    from botocore.exceptions import ClientError
+
     # Generate a presigned URL for the S3 object
     # s3_client = boto3.client('s3', verify=False)
     s3_client = _find_client_from_cache(region)
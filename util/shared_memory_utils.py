@@ -0,0 +1,164 @@
+"""
+  프로세스 간 공유 메모리 캐시 관련 유틸리티 모듈
+  멀티 프로세스 WSGI 서버(gunicorn 등)에서 같은 호스트의 워커들이 mmap 으로 매핑한 파일 하나를 함께 읽는다.
+  키마다 고정 크기 슬롯을 두고, 파일 잠금(flock)으로 선출된 프로세스 하나만 슬롯에 쓴다.
+  슬롯마다 seqlock(시퀀스가 홀수면 쓰는 중)을 두어, 읽는 쪽은 잠금 없이 매핑된 메모리의 memoryview 를 decode 함수에 넘기고
+  읽는 동안 시퀀스가 바뀌었으면 다시 읽는다. 슬롯의 데이터 형식은 쓰는 쪽이 정한다(이 모듈은 바이트만 다룬다).
+  decode 결과는 프로세스마다 따로 만든 복사본이다. 슬롯 바이트를 decode 전에 따로 복사하지 않을 뿐, 데이터 자체를 워커끼리
+  메모리에서 공유하지는 않는다(read 의 known 으로 시퀀스가 바뀌었을 때만 다시 decode 한다).
+  파일 이름에 형식 버전과 슬롯 배치를 붙이므로, 배치가 다른 프로세스(배포 중의 이전 워커 등)는 서로 다른 파일을 쓴다.
+  파일 형식: MAGIC(4) + 형식 버전(uint16) + 슬롯 수(uint16) + 슬롯 크기(uint32) 뒤에 고정 크기 슬롯이 이어진다.
+  슬롯 형식: 시퀀스(uint64) + 기록 시각(float64, time.time()) + 키(32바이트) + 데이터 길이(uint32) + 데이터
+"""
+import fcntl
+import mmap
+import os
+import struct
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+SHARED_MEMORY_MAGIC = b'FBSM'
+# 헤더나 슬롯 형식이 바뀌면 올린다(파일 이름에 들어간다).
+SHARED_MEMORY_FORMAT_VERSION = 1
+# 쓰는 중인 슬롯을 만났을 때 다시 읽는 최대 횟수
+READ_RETRIES = 100
+
+_HEADER = struct.Struct('<4sHHI')
+_SLOT_HEADER = struct.Struct('<Qd32sI')
+_SEQUENCE = struct.Struct('<Q')
+
+# 슬롯 읽기 결과: (시퀀스, 기록 시각, decode 결과)
+SlotValue = Tuple[int, float, Any]
+
+
+class SharedMemoryRegion:
+    """
+    키마다 고정 크기 슬롯을 가진 mmap 공유 메모리 파일.
+    쓰기는 try_acquire_writer() 로 파일 잠금을 얻은 프로세스만 하고, 읽기는 모든 프로세스가 잠금 없이 한다.
+    """
+
+    def __init__(self, path: str, keys: List[str], slot_size: int = 64 * 1024):
+        """
+        :param path: 공유 메모리 파일 경로(/dev/shm 아래 권장). 실제 파일 이름에는 형식 버전과 슬롯 배치가 붙는다.
+        :param keys: 슬롯 키 목록(모든 프로세스에서 같은 순서, 키마다 최대 32바이트)
+        :param slot_size: 슬롯 하나의 크기(바이트, 슬롯 헤더 포함)
+        """
+        self.path = f'{path}.v{SHARED_MEMORY_FORMAT_VERSION}-{len(keys)}x{slot_size}'
+        self.slot_size = slot_size
+        self.capacity = slot_size - _SLOT_HEADER.size
+        self._slots = {key: index for index, key in enumerate(keys)}
+        self._size = _HEADER.size + len(keys) * slot_size
+        self._writer_fd: Optional[int] = None
+        self._mmap = self._map()
+
+    def _map(self) -> mmap.mmap:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # 공유 디렉터리에서 다른 사용자가 만든 파일은 쓰지 않는다.
+            if os.fstat(fd).st_uid != os.getuid():
+                raise PermissionError(f'공유 메모리 파일의 소유자가 다름: {self.path}')
+            # 처음 만든 프로세스 하나만 크기를 정하고 헤더를 쓴다.
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < self._size:
+                    os.ftruncate(fd, self._size)
+                    os.pwrite(fd, _HEADER.pack(SHARED_MEMORY_MAGIC, SHARED_MEMORY_FORMAT_VERSION, len(self._slots),
+                                               self.slot_size), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            region = mmap.mmap(fd, self._size)
+        finally:
+            os.close(fd)
+
+        magic, version, _, _ = _HEADER.unpack_from(region, 0)
+        if magic != SHARED_MEMORY_MAGIC or version != SHARED_MEMORY_FORMAT_VERSION:
+            region.close()
+            raise ValueError(f'공유 메모리 파일 형식이 다름: {self.path}')
+        return region
+
+    def _offset(self, key: str) -> int:
+        return _HEADER.size + self._slots[key] * self.slot_size
+
+    def try_acquire_writer(self) -> bool:
+        """
+        쓰기 잠금을 얻는다(기다리지 않음). 잠금은 프로세스가 끝나면 운영체제가 풀어 주므로 다른 프로세스가 이어받는다.
+        :return: 이 프로세스가 쓰기 잠금을 가지고 있으면 True
+        """
+        if self._writer_fd is not None:
+            return True
+        fd = os.open(f'{self.path}.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._writer_fd = fd
+        return True
+
+    def write(self, key: str, payload: bytes) -> bool:
+        """
+        슬롯에 데이터를 쓴다(쓰기 잠금을 가진 프로세스만 호출).
+        :param key: 슬롯 키
+        :param payload: 데이터(슬롯 용량 이하)
+        :return: 썼으면 True, 데이터가 슬롯보다 크면 False
+        """
+        if self._writer_fd is None:
+            raise RuntimeError('쓰기 잠금 없이 공유 메모리에 쓸 수 없습니다.')
+        if len(payload) > self.capacity:
+            return False
+
+        offset = self._offset(key)
+        sequence = _SEQUENCE.unpack_from(self._mmap, offset)[0]
+        # 이전 writer 가 쓰는 도중에 끝났으면 시퀀스가 홀수로 남아 있다.
+        sequence += sequence % 2
+        _SEQUENCE.pack_into(self._mmap, offset, sequence + 1)
+        start = offset + _SLOT_HEADER.size
+        self._mmap[start:start + len(payload)] = payload
+        _SLOT_HEADER.pack_into(self._mmap, offset, sequence + 1, time.time(), key.encode('utf-8'), len(payload))
+        _SEQUENCE.pack_into(self._mmap, offset, sequence + 2)
+        return True
+
+    def read(self, key: str, decode: Callable[[memoryview], Any],
+             known: Optional[SlotValue] = None) -> Optional[SlotValue]:
+        """
+        슬롯의 데이터를 잠금 없이 읽는다. decode 에는 매핑된 메모리의 memoryview 를 그대로 넘기고,
+        decode 하는 동안 writer 가 슬롯을 바꿨으면 다시 읽는다. decode 결과는 memoryview 를 참조하면 안 되므로
+        decode 는 필요한 값을 복사해 만들어야 한다.
+        :param key: 슬롯 키
+        :param decode: memoryview 를 받아 값을 만드는 함수
+        :param known: 이전에 읽은 결과. 시퀀스가 같으면 decode 하지 않고 그대로 반환한다.
+        :return: (시퀀스, 기록 시각, decode 결과), 기록이 없거나 읽지 못하면 None
+        """
+        offset = self._offset(key)
+        start = offset + _SLOT_HEADER.size
+        for _ in range(READ_RETRIES):
+            sequence, written_at, raw_key, length = _SLOT_HEADER.unpack_from(self._mmap, offset)
+            if sequence == 0:
+                return None
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            if known is not None and known[0] == sequence:
+                return sequence, written_at, known[2]
+
+            value, failed = None, False
+            if raw_key.rstrip(b'\0') == key.encode('utf-8') and length <= self.capacity:
+                view = memoryview(self._mmap)[start:start + length]
+                try:
+                    value = decode(view)
+                except Exception:
+                    failed = True
+                finally:
+                    view.release()
+            else:
+                failed = True
+
+            if _SEQUENCE.unpack_from(self._mmap, offset)[0] == sequence:
+                return None if failed else (sequence, written_at, value)
+        return None
+
+    def close(self):
+        if self._writer_fd is not None:
+            os.close(self._writer_fd)
+            self._writer_fd = None
+        self._mmap.close()
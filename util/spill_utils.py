@@ -0,0 +1,119 @@
+"""
+  큰 응답의 S3 분리(spill) 관련 유틸리티 모듈
+  API Gateway 뒤의 Lambda 는 응답 본문을 6MB 까지만 돌려줄 수 있으므로, 최종 응답 본문(압축 후)이 기준 크기를 넘으면
+  본문을 S3 에 저장하고 서명된 GET URL 로 303 See Other 를 응답한다. 기준보다 작은 응답은 그대로 응답한다.
+  S3 키는 본문 해시이므로 같은 본문은 다시 올리지 않고 이미 저장된 객체를 재사용한다(content-addressed).
+  객체에는 응답의 Content-Type, Content-Encoding 을 함께 저장해 S3 가 같은 헤더로 본문을 돌려준다.
+  저장한 객체는 버킷 수명 주기 규칙(s3_lifecycle.json, SPILL_KEY_PREFIX 접두어, SPILL_OBJECT_EXPIRES_DAYS 일 후 삭제)으로 정리한다.
+  수명 주기 규칙이 객체를 지우기 전에 서명된 URL 이 만료되도록, 저장한 지 SPILL_REUSE_SECS 가 지난 객체는 재사용하지 않고
+  다시 저장한다(다시 저장하면 객체의 생성 시각이 바뀌어 삭제 시점도 늦춰진다).
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Flask, Response
+
+from util import s3_utils
+from util.logging_util import logger
+from util.response_utils import json_response
+
+SPILL_KEY_PREFIX = 'responses/v1'
+# 버킷 수명 주기 규칙(s3_lifecycle.json)에서 SPILL_KEY_PREFIX 객체를 삭제하는 기준(생성 후 일수)
+SPILL_OBJECT_EXPIRES_DAYS = 1
+# 저장된 객체를 재사용하는 최대 나이(초). 수명 주기 규칙의 삭제 기준보다 충분히 짧아야 한다.
+SPILL_REUSE_SECS = 12 * 60 * 60
+# 이 프로세스에서 저장(확인)한 객체 키를 기억하는 최대 수
+MAX_SPILLED_KEYS = 1024
+
+# 객체 키 -> 객체를 저장한 시각(time.time())
+_spilled_keys = OrderedDict()
+_spilled_keys_lock = threading.Lock()
+
+
+def _spilled_at(key: str):
+    # 기억하는 객체가 SPILL_REUSE_SECS 안에 저장한 것이면 저장 시각을, 아니면 None 을 반환한다.
+    with _spilled_keys_lock:
+        written_at = _spilled_keys.get(key)
+        if written_at is None:
+            return None
+        if time.time() - written_at > SPILL_REUSE_SECS:
+            del _spilled_keys[key]
+            return None
+        _spilled_keys.move_to_end(key)
+        return written_at
+
+
+def _remember_spilled(key: str, written_at: float):
+    with _spilled_keys_lock:
+        _spilled_keys[key] = written_at
+        _spilled_keys.move_to_end(key)
+        while len(_spilled_keys) > MAX_SPILLED_KEYS:
+            _spilled_keys.popitem(last=False)
+
+
+def spill_body(body: bytes, content_type: str, content_encoding: str = None, expires_in: int = 600) -> str:
+    """
+    본문을 본문 해시 키로 S3 에 저장하고 서명된 GET URL 을 반환한다.
+    같은 키의 객체가 SPILL_REUSE_SECS 안에 저장된 것이면(이 프로세스가 기억하거나 HeadObject 로 확인) 다시 저장하지 않는다.
+    :param body: 응답 본문(압축된 경우 압축 바이트)
+    :param content_type: 응답의 Content-Type
+    :param content_encoding: 응답의 Content-Encoding(압축하지 않았으면 None)
+    :param expires_in: 서명된 URL 의 유효 시간(초)
+    :return: 서명된 URL(만들지 못하면 빈 문자열)
+    """
+    key = f'{SPILL_KEY_PREFIX}/{hashlib.blake2b(body, digest_size=20).hexdigest()}'
+    if _spilled_at(key) is None:
+        # 다른 워커가 저장한 객체라도 오래되었으면 수명 주기 규칙이 곧 지울 수 있으므로 다시 저장한다(내용은 같다).
+        info = s3_utils.head_object_info(key)
+        if info is not None and time.time() - info['last_modified'] <= SPILL_REUSE_SECS:
+            written_at = info['last_modified']
+        else:
+            s3_utils.put_object_contents(body, key, content_type=content_type, content_encoding=content_encoding)
+            written_at = time.time()
+        _remember_spilled(key, written_at)
+    return s3_utils.create_presigned_url(key, expiration=expires_in)
+
+
+def init_response_spill(app: Flask):
+    """
+    큰 응답을 S3 로 분리하는 after_request 훅을 등록한다.
+    after_request 훅은 등록의 역순으로 실행되므로, 압축 후의 크기를 재도록 init_compression 보다 먼저 호출한다.
+    설정값:
+        RESPONSE_SPILL_MIN_SIZE: 이 크기(바이트) 이상의 본문을 S3 로 분리한다(0 이면 분리하지 않음).
+        RESPONSE_SPILL_URL_EXPIRES_SECS: 서명된 URL 의 유효 시간(초)
+    :param app: Flask 애플리케이션
+    """
+    min_size = app.config.get('RESPONSE_SPILL_MIN_SIZE', 0)
+    expires_in = app.config.get('RESPONSE_SPILL_URL_EXPIRES_SECS', 600)
+    if not min_size:
+        return
+
+    @app.after_request
+    def spill_large_response(response: Response) -> Response:
+        # 스트리밍 응답(ndjson 등)은 크기를 미리 알 수 없으므로 그대로 둔다.
+        if response.direct_passthrough or response.is_streamed or response.status_code != 200:
+            return response
+
+        body = response.get_data()
+        if len(body) < min_size:
+            return response
+
+        try:
+            url = spill_body(body, response.content_type, response.headers.get('Content-Encoding'), expires_in)
+        except Exception as e:
+            logger.error(f'큰 응답 S3 분리 실패, 본문을 그대로 응답: {str(e)}')
+            return response
+        if not url:
+            return response
+
+        logger.info(f'큰 응답 S3 분리 - {len(body)} bytes')
+        redirect = json_response({
+            'status': 'success',
+            'data': {'url': url, 'size': len(body), 'expires_in': expires_in},
+            'message': '응답이 커서 S3 에서 내려받도록 안내합니다.',
+            'error_code': None
+        }, 303, headers={'Location': url, 'Cache-Control': 'no-store'})
+        redirect.vary.update(response.vary)
+        return redirect